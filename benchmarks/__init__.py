@@ -0,0 +1,6 @@
+"""
+Benchmark suite for Cline Tools.
+Generates a synthetic rule catalog and external .clinerules files and times
+extraction, merging, comparison and update scenarios. Run with
+`python -m benchmarks` from the repository root.
+"""
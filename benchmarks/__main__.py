@@ -0,0 +1,175 @@
+"""Command-line runner for the benchmark suite."""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+from datetime import datetime
+from typing import Dict, List, Optional
+from src.core.file_manager import FileManager
+from .corpus import CorpusConfig, CorpusGenerator
+from .scenarios import build_scenarios
+
+
+def git_revision() -> Optional[str]:
+    """
+    Get the current git commit, if available.
+
+    Returns:
+        Short commit hash or None
+    """
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return result.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_comparison(
+    results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]]
+) -> None:
+    """
+    Print each scenario's best time relative to a baseline run.
+
+    Args:
+        results: Results of this run per scenario
+        baseline: Results of the baseline run per scenario
+    """
+    print(f"\n{'scenario':20} {'baseline ms':>12} {'current ms':>12} {'change':>8}")
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        before, after = baseline[name]["min_ms"], result["min_ms"]
+        change = (after - before) / before * 100 if before else 0.0
+        print(f"{name:20} {before:12.3f} {after:12.3f} {change:+7.1f}%")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Main entry point for the benchmark runner.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv)
+    """
+    defaults = CorpusConfig()
+    parser = argparse.ArgumentParser(description="Run the Cline Tools benchmarks")
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument(
+        "--languages",
+        type=int,
+        default=defaults.languages,
+        help="Language rule files in the catalog",
+    )
+    parser.add_argument(
+        "--paragraphs",
+        type=int,
+        default=defaults.paragraphs,
+        help="Sections per block (controls block size)",
+    )
+    parser.add_argument(
+        "--externals",
+        type=int,
+        default=defaults.externals,
+        help="Number of external .clinerules files",
+    )
+    parser.add_argument(
+        "--languages-per-external",
+        type=int,
+        default=defaults.languages_per_external,
+        help="Language blocks in each external file",
+    )
+    parser.add_argument(
+        "--variant-rate",
+        type=float,
+        default=defaults.variant_rate,
+        help="Probability that an external block is a near-duplicate",
+    )
+    parser.add_argument(
+        "--filler-blocks",
+        type=int,
+        default=defaults.filler_blocks,
+        help="Unrelated blocks appended to each external file",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Timed repetitions")
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        help="Only run the named scenario (repeatable)",
+    )
+    parser.add_argument("--output", help="Write results to this JSON file")
+    parser.add_argument("--baseline", help="JSON results of an earlier run to compare")
+    parser.add_argument(
+        "--corpus-dir",
+        help="Generate the corpus here and keep it (defaults to a temporary directory)",
+    )
+    parser.add_argument(
+        "--verbose", action="store_true", help="Keep tool log output enabled"
+    )
+    args = parser.parse_args(argv)
+
+    if not args.verbose:
+        logging.disable(logging.WARNING)
+
+    config = CorpusConfig(
+        seed=args.seed,
+        languages=args.languages,
+        paragraphs=args.paragraphs,
+        externals=args.externals,
+        languages_per_external=args.languages_per_external,
+        variant_rate=args.variant_rate,
+        filler_blocks=args.filler_blocks,
+    )
+
+    with tempfile.TemporaryDirectory(prefix="cline_bench_") as tmp_dir:
+        corpus = CorpusGenerator(config).generate(args.corpus_dir or tmp_dir)
+        print(
+            f"Corpus: {len(corpus.local_files)} local files, "
+            f"{len(corpus.external_files)} external files, "
+            f"{corpus.total_bytes() / 1024:.0f} KiB"
+        )
+
+        results: Dict[str, Dict[str, float]] = {}
+        for scenario in build_scenarios(corpus):
+            if args.scenario and scenario.name not in args.scenario:
+                continue
+            results[scenario.name] = scenario.measure(args.repeat)
+            result = results[scenario.name]
+            throughput = (
+                f"{result['mb_per_s']:9.2f} MB/s" if "mb_per_s" in result else ""
+            )
+            print(
+                f"{scenario.name:20} min {result['min_ms']:10.3f} ms  "
+                f"median {result['median_ms']:10.3f} ms {throughput}"
+            )
+
+    report = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "revision": git_revision(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "config": config.to_dict(),
+        "repeat": args.repeat,
+        "results": results,
+    }
+    if args.output:
+        FileManager.write_file(args.output, json.dumps(report, indent=2))
+        print(f"Results written to {args.output}")
+
+    if args.baseline:
+        content = FileManager.read_file(args.baseline)
+        if content is not None:
+            print_comparison(results, json.loads(content).get("results", {}))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,271 @@
+"""Deterministic generator for synthetic rule catalogs and .clinerules files."""
+
+import os
+import random
+from typing import List, Optional
+from src.core.file_manager import FileManager
+
+WORDS = (
+    "always use clear names for functions classes modules and variables keep "
+    "files small split large code blocks into separate units prefer explicit "
+    "imports handle errors gracefully log with the logging module write tests "
+    "for new features document public interfaces avoid global state validate "
+    "input at the boundary format code before committing review dependencies"
+).split()
+
+LANGUAGES = [
+    "python",
+    "javascript",
+    "php",
+    "rust",
+    "flutter",
+    "go",
+    "java",
+    "kotlin",
+    "swift",
+    "ruby",
+    "arduino_c",
+    "autohotkey_v1",
+]
+
+
+class CorpusConfig:
+    """Size and shape of a generated corpus."""
+
+    def __init__(
+        self,
+        seed: int = 42,
+        languages: int = 7,
+        paragraphs: int = 8,
+        externals: int = 20,
+        languages_per_external: int = 2,
+        variant_rate: float = 0.3,
+        filler_blocks: int = 0,
+    ):
+        """
+        Initialize CorpusConfig.
+
+        Args:
+            seed: Random seed; equal configs produce identical corpora
+            languages: Number of language rule files in the catalog
+            paragraphs: Sections per rule block
+            externals: Number of external .clinerules files
+            languages_per_external: Language blocks included in each external file
+            variant_rate: Probability that an external block is a near-duplicate
+            filler_blocks: Extra unrelated blocks appended to each external file
+        """
+        self.seed = seed
+        self.languages = min(languages, len(LANGUAGES))
+        self.paragraphs = paragraphs
+        self.externals = externals
+        self.languages_per_external = min(languages_per_external, self.languages)
+        self.variant_rate = variant_rate
+        self.filler_blocks = filler_blocks
+
+    def to_dict(self) -> dict:
+        """
+        Convert the configuration to a JSON-serializable dictionary.
+
+        Returns:
+            Dictionary of configuration values
+        """
+        return dict(vars(self))
+
+
+class Corpus:
+    """Paths of a generated corpus."""
+
+    def __init__(self, root_dir: str):
+        """
+        Initialize Corpus.
+
+        Args:
+            root_dir: Directory holding the corpus
+        """
+        self.root_dir = root_dir
+        self.clinerules_dir = os.path.join(root_dir, "clinerules")
+        self.externals_dir = os.path.join(root_dir, "externals")
+        self.output_file = os.path.join(root_dir, "output", ".clinerules")
+        self.local_files: List[str] = []
+        self.external_files: List[str] = []
+        # Original content of each external file, used to undo updates
+        self.external_contents: List[str] = []
+        # Local files whose blocks each external file contains
+        self.external_selections: List[List[str]] = []
+
+    def reset_externals(self) -> None:
+        """Restore every external file to its generated content."""
+        for path, content in zip(self.external_files, self.external_contents):
+            FileManager.write_file(path, content)
+
+    def total_bytes(self) -> int:
+        """
+        Get the combined size of all generated files.
+
+        Returns:
+            Size in bytes
+        """
+        return sum(
+            os.path.getsize(path) for path in self.local_files + self.external_files
+        )
+
+
+class CorpusGenerator:
+    """Writes a synthetic catalog and external files for benchmarking."""
+
+    def __init__(self, config: Optional[CorpusConfig] = None):
+        """
+        Initialize CorpusGenerator.
+
+        Args:
+            config: Corpus configuration (defaults to CorpusConfig())
+        """
+        self.config = config or CorpusConfig()
+        self.random = random.Random(self.config.seed)
+
+    def sentence(self, length: int) -> str:
+        """
+        Build a random sentence.
+
+        Args:
+            length: Number of words
+
+        Returns:
+            Sentence text
+        """
+        words = [self.random.choice(WORDS) for _ in range(length)]
+        return " ".join(words).capitalize() + "."
+
+    def section(self, index: int) -> str:
+        """
+        Build one heading with bullets and, sometimes, a code fence.
+
+        Args:
+            index: Section number
+
+        Returns:
+            Section text
+        """
+        lines = [f"# {self.sentence(3)[:-1]} {index}", ""]
+        lines.extend(
+            f"- {self.sentence(self.random.randint(5, 14))}"
+            for _ in range(self.random.randint(3, 8))
+        )
+        if self.random.random() < 0.2:
+            lines.extend(["", "```", self.sentence(6), "```"])
+        return "\n".join(lines)
+
+    def block(self, marker: str) -> str:
+        """
+        Build a rule block.
+
+        Args:
+            marker: Marker line text after '### BEGIN '
+
+        Returns:
+            Block text
+        """
+        sections = [self.section(i) for i in range(self.config.paragraphs)]
+        return f"### BEGIN {marker}\n\n" + "\n\n".join(sections)
+
+    def make_variant(self, block: str) -> str:
+        """
+        Derive a near-duplicate of a block.
+
+        Args:
+            block: Original block text
+
+        Returns:
+            Block with one small edit
+        """
+        lines = block.split("\n")
+        position = self.random.randrange(2, len(lines))
+        edit = self.random.choice(("reword", "insert", "delete", "whitespace"))
+        if edit == "reword":
+            lines[position] = f"- {self.sentence(self.random.randint(5, 14))}"
+        elif edit == "insert":
+            lines.insert(position, f"- {self.sentence(8)}")
+        elif edit == "delete":
+            del lines[position]
+        else:
+            lines[position] = lines[position] + "  "
+        return "\n".join(lines)
+
+    @staticmethod
+    def language_marker(language: str) -> str:
+        """
+        Get the marker text used for a language block.
+
+        Args:
+            language: Language name as used in the file name
+
+        Returns:
+            Marker text after '### BEGIN '
+        """
+        if language == "arduino_c":
+            return "LANGUAGE ARDUINO C"
+        return f"LANGUAGE {language.upper()}"
+
+    def generate(self, root_dir: str) -> Corpus:
+        """
+        Write the corpus to disk.
+
+        Args:
+            root_dir: Directory to write the corpus into
+
+        Returns:
+            Paths of the generated files
+        """
+        corpus = Corpus(root_dir)
+        blocks = {}
+
+        singles = [
+            ("general", "clinerules_general.md", "GENERAL RULES"),
+            ("system", "clinerules_system_linux.md", "SYSTEM"),
+            ("project", "clinerules_project_default.md", "PROJECT"),
+        ]
+        for category, filename, marker in singles:
+            path = os.path.join(corpus.clinerules_dir, category, filename)
+            blocks[path] = self.block(marker)
+
+        language_files = []
+        for language in LANGUAGES[: self.config.languages]:
+            path = os.path.join(
+                corpus.clinerules_dir,
+                "languages",
+                f"clinerules_language_{language}.md",
+            )
+            blocks[path] = self.block(self.language_marker(language))
+            language_files.append(path)
+
+        for path, block in blocks.items():
+            FileManager.ensure_directory(os.path.dirname(path))
+            FileManager.write_file(path, block + "\n")
+            corpus.local_files.append(path)
+
+        single_files = [path for path in blocks if path not in language_files]
+        for i in range(self.config.externals):
+            selection = single_files + self.random.sample(
+                language_files, self.config.languages_per_external
+            )
+            parts = []
+            for local_file in selection:
+                block = blocks[local_file]
+                if self.random.random() < self.config.variant_rate:
+                    block = self.make_variant(block)
+                parts.append(block)
+            parts.extend(
+                self.block(f"NOTES {n}") for n in range(self.config.filler_blocks)
+            )
+
+            path = os.path.join(
+                corpus.externals_dir, f"project_{i:04d}", ".clinerules"
+            )
+            content = "\n\n".join(parts) + "\n"
+            FileManager.ensure_directory(os.path.dirname(path))
+            FileManager.write_file(path, content)
+            corpus.external_files.append(path)
+            corpus.external_contents.append(content)
+            corpus.external_selections.append(selection)
+
+        return corpus
@@ -0,0 +1,181 @@
+"""Timed benchmark scenarios over a generated corpus."""
+
+import os
+import statistics
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+from src.core.file_manager import FileManager
+from src.core.block_extractor import BlockExtractor
+from src.core.compare.block_comparer import BlockComparer
+from src.core.rules.catalog import RuleCatalog
+from src.core.rules.output_handler import OutputHandler
+from src.core.update.block_updater import BlockUpdater
+from .corpus import Corpus
+
+# (external content, local file, block type, local block) for one block lookup
+BlockCase = Tuple[str, str, str, str]
+
+
+class Scenario:
+    """A named operation timed over several repetitions."""
+
+    def __init__(
+        self,
+        name: str,
+        run: Callable[[], object],
+        setup: Optional[Callable[[], object]] = None,
+        nbytes: int = 0,
+    ):
+        """
+        Initialize Scenario.
+
+        Args:
+            name: Scenario name used in reports
+            run: Operation to time
+            setup: Untimed preparation run before every repetition
+            nbytes: Bytes processed per run, for throughput figures
+        """
+        self.name = name
+        self.run = run
+        self.setup = setup
+        self.nbytes = nbytes
+
+    def measure(self, repeat: int) -> Dict[str, float]:
+        """
+        Time the scenario.
+
+        Args:
+            repeat: Number of timed repetitions
+
+        Returns:
+            Dictionary with min/median/mean milliseconds and throughput
+        """
+        timings: List[float] = []
+        for _ in range(repeat):
+            if self.setup:
+                self.setup()
+            start = time.perf_counter()
+            self.run()
+            timings.append((time.perf_counter() - start) * 1000)
+
+        best = min(timings)
+        result = {
+            "repeat": repeat,
+            "min_ms": round(best, 3),
+            "median_ms": round(statistics.median(timings), 3),
+            "mean_ms": round(statistics.mean(timings), 3),
+        }
+        if self.nbytes and best > 0:
+            result["mb_per_s"] = round(self.nbytes / 1e6 / (best / 1000), 2)
+        return result
+
+
+def load_cases(corpus: Corpus) -> List[BlockCase]:
+    """
+    Read the corpus once and list every (external, local block) pair.
+
+    Args:
+        corpus: Generated corpus
+
+    Returns:
+        List of block lookup cases
+    """
+    local_blocks = {}
+    for local_file in corpus.local_files:
+        block_type = BlockExtractor.determine_block_type(local_file)
+        content = FileManager.read_file(local_file)
+        if block_type and content is not None:
+            local_blocks[local_file] = (block_type, content)
+
+    cases = []
+    for content, selection in zip(
+        corpus.external_contents, corpus.external_selections
+    ):
+        for local_file in selection:
+            block_type, local_content = local_blocks[local_file]
+            cases.append((content, local_file, block_type, local_content))
+    return cases
+
+
+def build_scenarios(corpus: Corpus) -> List[Scenario]:
+    """
+    Create all scenarios for a corpus.
+
+    Args:
+        corpus: Generated corpus
+
+    Returns:
+        List of scenarios in reporting order
+    """
+    cases = load_cases(corpus)
+    case_bytes = sum(len(case[0]) for case in cases)
+    external_bytes = sum(len(content) for content in corpus.external_contents)
+    local_bytes = sum(os.path.getsize(path) for path in corpus.local_files)
+    pairs = [
+        (external_file, local_file)
+        for external_file, selection in zip(
+            corpus.external_files, corpus.external_selections
+        )
+        for local_file in selection
+    ]
+    extractor = BlockExtractor()
+    warm_handler = OutputHandler()
+
+    def extract_block() -> None:
+        for content, local_file, block_type, _ in cases:
+            extractor.extract_block(content, block_type, local_file)
+
+    def find_block_bounds() -> None:
+        for content, local_file, block_type, _ in cases:
+            extractor.find_block_bounds(content, block_type, local_file)
+
+    def replace_block() -> None:
+        for content, local_file, block_type, local_content in cases:
+            extractor.replace_block(content, local_content, block_type, local_file)
+
+    def merge_files_cold() -> None:
+        OutputHandler().merge_files(corpus.local_files)
+
+    def merge_files_warm() -> None:
+        warm_handler.merge_files(corpus.local_files)
+
+    def extract_blocks() -> None:
+        comparer = BlockComparer()
+        for external_file, local_file in pairs:
+            comparer.extract_blocks(external_file, local_file)
+
+    def full_create() -> None:
+        general, system, project, languages, cline = RuleCatalog(
+            corpus.clinerules_dir
+        ).get_files_by_category()
+        content = OutputHandler().merge_files(
+            cline + general + system + project + languages
+        )
+        FileManager.ensure_directory(os.path.dirname(corpus.output_file))
+        FileManager.write_file(corpus.output_file, content)
+
+    def full_compare() -> None:
+        comparer = BlockComparer()
+        for external_file, local_file in pairs:
+            blocks = comparer.extract_blocks(external_file, local_file)
+            if blocks:
+                comparer.are_blocks_identical(blocks[0], blocks[1])
+
+    def full_update() -> None:
+        BlockUpdater().update_externals_with_locals(
+            corpus.external_files, corpus.local_files
+        )
+
+    return [
+        Scenario("extract_block", extract_block, nbytes=case_bytes),
+        Scenario("find_block_bounds", find_block_bounds, nbytes=case_bytes),
+        Scenario("replace_block", replace_block, nbytes=case_bytes),
+        Scenario("merge_files_cold", merge_files_cold, nbytes=local_bytes),
+        Scenario("merge_files_warm", merge_files_warm, nbytes=local_bytes),
+        Scenario("extract_blocks", extract_blocks, nbytes=case_bytes),
+        Scenario("create", full_create, nbytes=local_bytes),
+        Scenario("compare", full_compare, nbytes=case_bytes),
+        Scenario(
+            "update", full_update, setup=corpus.reset_externals, nbytes=external_bytes
+        ),
+    ]
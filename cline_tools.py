@@ -0,0 +1,13 @@
+#!/usr/bin/env python3
+"""
+Unified entry point for Cline Tools.
+Dispatches to the create, compare, update and audit subcommands, importing
+only the modules the selected subcommand needs.
+"""
+
+import sys
+
+from src.cli.main import main
+
+if __name__ == "__main__":
+    sys.exit(main())
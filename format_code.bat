@@ -2,11 +2,11 @@
 REM Format code with black
 echo.
 echo Formatting code with black...
-black src create_rules.py compare_rules.py
+black src benchmarks cline_tools.py create_rules.py compare_rules.py
 
 REM Run flake8
 echo.
 echo Running flake8 linter...
-flake8 src create_rules.py compare_rules.py
+flake8 src benchmarks cline_tools.py create_rules.py compare_rules.py
 
 pause
\ No newline at end of file
@@ -2,10 +2,10 @@
 setlocal enabledelayedexpansion
 echo Cline Tools Runner
 echo.
-echo 1. Create Rules (create_rules.py)
-echo 2. Compare Rules (compare_rules.py)
-echo 3. Update Local File from External (update_local_cline_rules_with_external_file.py)
-echo 4. Update External File from Local (update_external_cline_rules_with_local_file.py)
+echo 1. Create Rules (cline_tools.py create)
+echo 2. Compare Rules (cline_tools.py compare)
+echo 3. Update Local File from External (cline_tools.py update-local)
+echo 4. Update External File from Local (cline_tools.py update-external)
 echo.
 
 REM Activate virtual environment
@@ -14,7 +14,7 @@ call %~dp0\venv\Scripts\activate.bat
 set /p choice="Enter your choice (1-4): "
 
 if "%choice%"=="1" (
-    python create_rules.py
+    python cline_tools.py create
 ) else if "%choice%"=="2" (
     set /p "external_file=Enter path to external clinerules file: "
     if "!external_file!"=="" (
@@ -23,7 +23,7 @@ if "%choice%"=="1" (
         echo ERROR: File not found: "!external_file!"
     ) else (
         echo Using external file: "!external_file!"
-        python compare_rules.py "!external_file!"
+        python cline_tools.py compare "!external_file!"
     )
 ) else if "%choice%"=="3" (
     set /p "external_file=Enter path to external clinerules file: "
@@ -33,7 +33,7 @@ if "%choice%"=="1" (
         echo ERROR: File not found: "!external_file!"
     ) else (
         echo Using external file: "!external_file!"
-        python update_local_cline_rules_with_external_file.py "!external_file!"
+        python cline_tools.py update-local "!external_file!"
     )
 ) else if "%choice%"=="4" (
     set /p "external_file=Enter path to external clinerules file: "
@@ -43,7 +43,7 @@ if "%choice%"=="1" (
         echo ERROR: File not found: "!external_file!"
     ) else (
         echo Using external file: "!external_file!"
-        python update_external_cline_rules_with_local_file.py "!external_file!"
+        python cline_tools.py update-external "!external_file!"
     )
 ) else (
     echo ERROR: Invalid choice. Please enter a number between 1 and 4.
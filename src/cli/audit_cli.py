@@ -0,0 +1,143 @@
+"""CLI interface for auditing many external clinerules files at once."""
+
+import argparse
+import os
+from typing import Dict, List, Optional
+from src.utils.logging_config import setup_logger
+from src.core.file_manager import FileManager
+
+logger = setup_logger(__name__)
+
+
+def add_batch_arguments(parser: argparse.ArgumentParser, prefix: str = "") -> None:
+    """
+    Add the batch audit options to a parser.
+
+    Args:
+        parser: Parser to extend
+        prefix: Help text prefix (e.g. 'Batch mode: ')
+    """
+    parser.add_argument(
+        "--root",
+        action="append",
+        default=[],
+        help=f"{prefix}directory to search for .clinerules files (repeatable)",
+    )
+    parser.add_argument(
+        "--file-list",
+        help=f"{prefix}text file with one external clinerules path per line",
+    )
+    parser.add_argument(
+        "--report",
+        default=os.path.join("output", "compare_report.json"),
+        help=f"{prefix}path of the report file",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["json", "csv"],
+        help=f"{prefix}report format (defaults to the report file extension)",
+    )
+    parser.add_argument(
+        "--workers", type=int, help=f"{prefix}number of worker processes"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or update the persistent hash cache",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help=(
+            f"{prefix}read files concurrently with asyncio and print differences "
+            "as they are found (no hash cache)"
+        ),
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=32,
+        help=f"{prefix}maximum concurrent reads in --stream mode",
+    )
+
+
+def print_result(row: Dict[str, str]) -> None:
+    """
+    Print a streamed result row unless the blocks are identical or absent.
+
+    Args:
+        row: Result row
+    """
+    if row["status"] not in ("identical", "absent"):
+        print(
+            f"{row['status']:10} {row['block_type']:9} {row['external_file']} "
+            f"({os.path.basename(row['local_file'])})",
+            flush=True,
+        )
+
+
+def run_audit(args: argparse.Namespace) -> bool:
+    """
+    Run a batch audit from parsed arguments.
+
+    Args:
+        args: Parsed arguments (see add_batch_arguments)
+
+    Returns:
+        True if the audit completed successfully, False otherwise
+    """
+    # Imported here so the compare CLI only loads batch support when needed
+    from src.core.compare.batch_comparer import BatchComparer
+
+    report_format = args.format or (
+        "csv" if args.report.lower().endswith(".csv") else "json"
+    )
+    try:
+        batch_comparer = BatchComparer(
+            args.workers, not args.no_cache, not args.no_history
+        )
+        if args.stream:
+            return batch_comparer.run_streaming(
+                args.root,
+                args.file_list,
+                args.report,
+                report_format,
+                args.concurrency,
+                print_result,
+            )
+        return batch_comparer.run(
+            args.root, args.file_list, args.report, report_format
+        )
+    except Exception as e:
+        logger.error(f"An unexpected error occurred: {e}")
+        return False
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Main entry point for audit CLI.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv)
+    """
+    parser = argparse.ArgumentParser(
+        description="Compare many external clinerules files against all local blocks"
+    )
+    add_batch_arguments(parser)
+    parser.add_argument(
+        "--no-history",
+        action="store_true",
+        help="Do not record block versions in the block store",
+    )
+    args = parser.parse_args(argv)
+    if not args.root and not args.file_list:
+        parser.error("at least one --root or --file-list is required")
+
+    if not run_audit(args):
+        print("Failed to audit rules files")
+
+    FileManager.log_write_stats()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,14 @@
 """CLI interface for comparing clinerules files."""
 
 import argparse
-from typing import Optional
+from typing import List, Optional
 from src.utils.logging_config import setup_logger
 from src.utils.input_handler import InputHandler
 from src.core.rules.file_selector import FileSelector
 from src.core.compare.block_comparer import BlockComparer
 from src.core.compare.diff_formatter import DiffFormatter
+from src.core.file_manager import FileManager
+from src.cli.audit_cli import add_batch_arguments, run_audit
 
 logger = setup_logger(__name__)
 
@@ -14,34 +16,60 @@ logger = setup_logger(__name__)
 class CompareRulesCLI:
     """CLI interface for comparing clinerules files."""
 
-    def __init__(self):
-        """Initialize CompareRulesCLI with required components."""
+    def __init__(self, use_cache: bool = True, use_history: bool = True):
+        """
+        Initialize CompareRulesCLI with required components.
+
+        Args:
+            use_cache: Whether to use the persistent hash cache
+            use_history: Whether to record compared blocks in the block store
+        """
+        self.use_cache = use_cache
+        self.hash_cache = None
+        if use_cache:
+            # Imported here so --no-cache runs never load sqlite3
+            from src.core.hash_cache import HashCache
+
+            self.hash_cache = HashCache()
+        block_store = None
+        if use_history:
+            # Imported here so --no-history runs never load the store
+            from src.core.block_store import BlockStore
+
+            block_store = BlockStore()
         self.file_selector = FileSelector()
-        self.block_comparer = BlockComparer()
+        self.block_comparer = BlockComparer(self.hash_cache, block_store)
         self.diff_formatter = DiffFormatter()
         self.input_handler = InputHandler()
 
-    def compare_rules_files(self, external_file: str) -> bool:
+    def compare_rules_files(
+        self, external_file: str, view: Optional[str] = None
+    ) -> bool:
         """
         Compare rules files and show differences.
 
         Args:
             external_file: Path to external rules file to compare against
+            view: Diff view to use (prompts the user if omitted)
 
         Returns:
             True if comparison was successful, False otherwise
         """
         try:
             # Get files by category
-            general_files, system_files, project_files, language_files = self.file_selector.get_files_by_category()
+            general_files, system_files, project_files, language_files, cline_files = (
+                self.file_selector.get_files_by_category()
+            )
 
             # Display files by category
             self.file_selector.display_files_by_category(
-                general_files, system_files, project_files, language_files
+                general_files, system_files, project_files, language_files, cline_files
             )
 
-            # Get user selection
-            all_files = general_files + system_files + project_files + language_files
+            # Get user selection in display order
+            all_files = (
+                cline_files + general_files + system_files + project_files + language_files
+            )
             if not all_files:
                 print("\nNo files found to compare")
                 return False
@@ -56,6 +84,11 @@ class CompareRulesCLI:
             if not self.block_comparer.validate_files(external_file, local_file):
                 return False
 
+            # Short-circuit on cached block digests
+            if self.block_comparer.compare_hashes(external_file, local_file):
+                print("\nBlocks are identical")
+                return True
+
             # Extract blocks for comparison
             result = self.block_comparer.extract_blocks(external_file, local_file)
             if result is None:
@@ -70,29 +103,72 @@ class CompareRulesCLI:
 
             # Show block information
             print(self.diff_formatter.format_block_info(block_type, local_file))
+            sections = self.diff_formatter.format_changed_sections(
+                external_block, local_block
+            )
+            if sections:
+                print(sections)
 
-            # Get diff tool choice and show diff
-            use_git_diff = self.input_handler.get_diff_tool_choice()
+            # Get diff view choice and show diff
+            if view is None:
+                view = self.input_handler.get_diff_view_choice()
             return self.diff_formatter.show_diff(
-                external_block, local_block, block_type, use_git_diff
+                external_block, local_block, block_type, view
             )
 
         except Exception as e:
             logger.error(f"An unexpected error occurred: {e}")
             return False
 
+    def close(self) -> None:
+        """Close the hash cache if one is open."""
+        if self.hash_cache is not None:
+            self.hash_cache.close()
+            self.hash_cache = None
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Main entry point for compare_rules CLI.
 
-def main() -> None:
-    """Main entry point for compare_rules CLI."""
+    Args:
+        argv: Command-line arguments (defaults to sys.argv)
+    """
     parser = argparse.ArgumentParser(
         description="Compare clinerules blocks between files"
     )
-    parser.add_argument("external_file", help="Path to external clinerules file")
-    args = parser.parse_args()
+    parser.add_argument(
+        "external_file", nargs="?", help="Path to external clinerules file"
+    )
+    parser.add_argument(
+        "--view",
+        choices=DiffFormatter.VIEWS,
+        help="Diff view to use instead of prompting",
+    )
+    add_batch_arguments(parser, "Batch mode: ")
+    parser.add_argument(
+        "--no-history",
+        action="store_true",
+        help="Do not record block versions in the block store",
+    )
+    args = parser.parse_args(argv)
+
+    if args.root or args.file_list:
+        if not run_audit(args):
+            print("Failed to compare rules files")
+    elif not args.external_file:
+        parser.error("external_file is required unless --root or --file-list is given")
+    else:
+        cli = CompareRulesCLI(
+            use_cache=not args.no_cache, use_history=not args.no_history
+        )
+        try:
+            if not cli.compare_rules_files(args.external_file, args.view):
+                print("Failed to compare rules files")
+        finally:
+            cli.close()
 
-    cli = CompareRulesCLI()
-    if not cli.compare_rules_files(args.external_file):
-        print("Failed to compare rules files")
+    FileManager.log_write_stats()
 
 
 if __name__ == "__main__":
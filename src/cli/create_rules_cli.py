@@ -1,10 +1,16 @@
 """CLI interface for creating clinerules files."""
 
-from typing import Optional
+import argparse
+import os
+import sys
+from typing import List, Optional
 from src.utils.logging_config import setup_logger
 from src.core.rules.validator import validate_directory_structure, format_directory_structure
 from src.core.rules.file_selector import FileSelector
 from src.core.rules.output_handler import OutputHandler
+from src.core.rules.compactor import OutputCompactor
+from src.core.file_manager import FileManager
+from src.core.block_stats import BlockStats
 
 logger = setup_logger(__name__)
 
@@ -12,10 +18,49 @@ logger = setup_logger(__name__)
 class CreateRulesCLI:
     """CLI interface for creating clinerules files."""
 
-    def __init__(self):
-        """Initialize CreateRulesCLI with required components."""
-        self.file_selector = FileSelector()
-        self.output_handler = OutputHandler()
+    def __init__(
+        self,
+        use_history: bool = True,
+        compact: bool = True,
+        max_tokens: Optional[int] = None,
+    ):
+        """
+        Initialize CreateRulesCLI with required components.
+
+        Args:
+            use_history: Whether to record created blocks in the block store
+            compact: Whether to collapse whitespace and drop duplicated rules
+            max_tokens: Refuse to write output estimated above this many tokens
+        """
+        self.file_selector = FileSelector(block_stats=BlockStats())
+        block_store = None
+        if use_history:
+            # Imported here so --no-history runs never load the store
+            from src.core.block_store import BlockStore
+
+            block_store = BlockStore()
+        self.output_handler = OutputHandler(
+            block_store,
+            OutputCompactor() if compact else None,
+            max_tokens,
+        )
+
+    def build_output(self, files: List[str]) -> bool:
+        """
+        Merge the selected files into the output file and show token counts.
+
+        Args:
+            files: Selected file paths
+
+        Returns:
+            True if the output file was written, False otherwise
+        """
+        success = self.output_handler.process_files(files)
+        report = self.output_handler.format_token_report()
+        if report:
+            print("\nEstimated tokens:")
+            print(report)
+        return success
 
     def create_rules_file(self) -> bool:
         """
@@ -41,19 +86,136 @@ class CreateRulesCLI:
                 print("\nError: No sections were selected. At least one section is required.")
                 return False
 
+            # Remember selection for watch mode
+            self.output_handler.save_selection(selected_files)
+
             # Process files and create output
-            return self.output_handler.process_files(selected_files)
+            return self.build_output(selected_files)
 
         except Exception as e:
             logger.error(f"An unexpected error occurred: {e}")
             return False
 
+    def get_watch_selection(self) -> List[str]:
+        """
+        Get the files to watch, reusing the last selection if available.
+
+        Returns:
+            List of selected file paths (empty if none selected)
+        """
+        selection = [
+            f for f in self.output_handler.load_selection() if os.path.exists(f)
+        ]
+        if selection:
+            logger.info("Using last selection:")
+            for file in selection:
+                logger.info(f"- {os.path.basename(file)}")
+            return selection
+
+        selection = self.file_selector.select_all_files()
+        if selection:
+            self.output_handler.save_selection(selection)
+        return selection
+
+    def watch_rules_file(self, interval: float = 1.0) -> bool:
+        """
+        Rebuild the output file whenever a selected rule file changes.
+
+        Args:
+            interval: Polling interval in seconds
+
+        Returns:
+            True when stopped by the user, False on setup errors
+        """
+        error_msg = validate_directory_structure()
+        if error_msg:
+            print(error_msg)
+            print()
+            print("\n".join(format_directory_structure()))
+            return False
+
+        selection = self.get_watch_selection()
+        if not selection:
+            print("\nError: No sections were selected. At least one section is required.")
+            return False
+
+        # Imported here so one-shot runs skip loading ctypes
+        from src.core.rules.watcher import RulesWatcher
+
+        watcher = RulesWatcher(interval=interval)
+        self.build_output(selection)
+        print("\nWatching for changes (press Ctrl+C to stop)...")
+        try:
+            while True:
+                changed = RulesWatcher.affected(watcher.wait_for_changes(), selection)
+                if not changed:
+                    continue
+                for file in changed:
+                    logger.info(f"Changed: {os.path.basename(file)}")
+                self.build_output(selection)
+        except KeyboardInterrupt:
+            print("\nStopped watching")
+            return True
+        finally:
+            watcher.close()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Main entry point for create_rules CLI.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv)
+    """
+    parser = argparse.ArgumentParser(
+        description="Create a clinerules file from selected rule files"
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Rebuild the output file whenever a selected rule file changes",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=1.0,
+        help="Watch mode: polling interval in seconds",
+    )
+    parser.add_argument(
+        "--no-history",
+        action="store_true",
+        help="Do not record block versions in the block store",
+    )
+    parser.add_argument(
+        "--no-compact",
+        action="store_true",
+        help="Merge files as they are, without collapsing whitespace or "
+        "dropping rules repeated across files",
+    )
+    parser.add_argument(
+        "--max-tokens",
+        type=int,
+        help="Fail instead of writing output estimated above this many tokens",
+    )
+    args = parser.parse_args(argv)
+
+    cli = CreateRulesCLI(
+        use_history=not args.no_history,
+        compact=not args.no_compact,
+        max_tokens=args.max_tokens,
+    )
+    if args.watch:
+        success = cli.watch_rules_file(args.interval)
+        if not success:
+            print("Failed to watch rules files")
+    else:
+        success = cli.create_rules_file()
+        if not success:
+            print("Failed to create rules file")
 
-def main() -> None:
-    """Main entry point for create_rules CLI."""
-    cli = CreateRulesCLI()
-    if not cli.create_rules_file():
-        print("Failed to create rules file")
+    FileManager.log_write_stats()
+    if not success:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
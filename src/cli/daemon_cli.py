@@ -0,0 +1,114 @@
+"""CLI interface for running and querying the Cline Tools daemon."""
+
+import argparse
+import json
+import sys
+from typing import Any, Dict, List, Optional
+from src.utils.logging_config import setup_logger
+from src.core.rules.config import DAEMON_SOCKET
+
+logger = setup_logger(__name__)
+
+
+def parse_params(pairs: List[str]) -> Dict[str, Any]:
+    """
+    Parse key=value pairs into request parameters.
+
+    Values are decoded as JSON when possible and kept as strings otherwise.
+
+    Args:
+        pairs: Strings of the form key=value
+
+    Returns:
+        Parameter dictionary
+
+    Raises:
+        ValueError: If a pair has no '='
+    """
+    params: Dict[str, Any] = {}
+    for pair in pairs:
+        key, separator, value = pair.partition("=")
+        if not separator:
+            raise ValueError(f"Expected key=value, got '{pair}'")
+        try:
+            params[key] = json.loads(value)
+        except ValueError:
+            params[key] = value
+    return params
+
+
+def serve_main(argv: Optional[List[str]] = None) -> None:
+    """
+    Main entry point for the daemon server.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv)
+    """
+    parser = argparse.ArgumentParser(
+        description="Run the Cline Tools daemon on a Unix domain socket"
+    )
+    parser.add_argument("--socket", default=DAEMON_SOCKET, help="Socket path")
+    parser.add_argument(
+        "--no-history",
+        action="store_true",
+        help="Do not record updated block versions in the block store",
+    )
+    args = parser.parse_args(argv)
+
+    from src.daemon.server import serve
+
+    if not serve(args.socket, use_history=not args.no_history):
+        print("Failed to start daemon")
+        sys.exit(1)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Main entry point for the daemon client.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv)
+    """
+    parser = argparse.ArgumentParser(
+        description="Send a request to the running Cline Tools daemon"
+    )
+    parser.add_argument(
+        "method",
+        help="ping, catalog, extract, compare, render, update or shutdown",
+    )
+    parser.add_argument(
+        "params",
+        nargs="*",
+        help="Parameters as key=value (values are parsed as JSON when possible)",
+    )
+    parser.add_argument("--socket", default=DAEMON_SOCKET, help="Socket path")
+    args = parser.parse_args(argv)
+
+    from src.daemon.client import DaemonClient
+    from src.daemon.protocol import RpcError
+
+    try:
+        params = parse_params(args.params)
+        client = DaemonClient(args.socket)
+    except ValueError as e:
+        parser.error(str(e))
+    except OSError as e:
+        logger.error(f"Could not connect to daemon at {args.socket}: {e}")
+        sys.exit(1)
+
+    try:
+        result = client.call(args.method, **params)
+    except RpcError as e:
+        logger.error(f"Daemon error {e.code}: {e.message}")
+        sys.exit(1)
+    finally:
+        client.close()
+
+    if isinstance(result, dict) and isinstance(result.get("diff"), str):
+        print(result["diff"] if result["diff"] else "Blocks are identical")
+    else:
+        print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""CLI interface for reporting block drift across many clinerules files."""
+
+import argparse
+import sys
+from typing import List, Optional
+from src.utils.logging_config import setup_logger
+from src.core.file_manager import FileManager
+
+logger = setup_logger(__name__)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Main entry point for drift CLI.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv)
+    """
+    parser = argparse.ArgumentParser(
+        description=(
+            "Group the blocks of many external clinerules files by fingerprint "
+            "and diff each distinct variant once against the local rules"
+        )
+    )
+    parser.add_argument(
+        "--root",
+        action="append",
+        default=[],
+        help="Directory to search for .clinerules files (repeatable)",
+    )
+    parser.add_argument(
+        "--file-list", help="Text file with one external clinerules path per line"
+    )
+    parser.add_argument("--report", help="Write the drift report as JSON to this path")
+    parser.add_argument("--workers", type=int, help="Number of worker processes")
+    parser.add_argument(
+        "--no-diff", action="store_true", help="Only print the variant summary"
+    )
+    args = parser.parse_args(argv)
+    if not args.root and not args.file_list:
+        parser.error("at least one --root or --file-list is required")
+
+    # Imported here so argument errors stay fast
+    from src.core.compare.drift_reporter import DriftReporter
+
+    try:
+        reporter = DriftReporter(args.workers)
+        success = reporter.run(
+            args.root,
+            args.file_list,
+            args.report,
+            show_diffs=not args.no_diff,
+            color=sys.stdout.isatty(),
+        )
+    except Exception as e:
+        logger.error(f"An unexpected error occurred: {e}")
+        success = False
+
+    if not success:
+        print("Failed to create drift report")
+
+    FileManager.log_write_stats()
+
+
+if __name__ == "__main__":
+    main()
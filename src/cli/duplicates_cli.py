@@ -0,0 +1,127 @@
+"""CLI interface for finding near-duplicate rules across the rule catalog."""
+
+import argparse
+import json
+import os
+import sys
+from typing import List, Optional
+from src.utils.logging_config import setup_logger
+from src.core.rules.catalog import get_shared_catalog
+from src.core.rules.near_duplicates import DuplicateCluster, NearDuplicateFinder
+
+logger = setup_logger(__name__)
+
+# Characters of each rule shown in the text report
+PREVIEW_LENGTH = 70
+
+
+def format_clusters(clusters: List[DuplicateCluster]) -> str:
+    """
+    Format clusters as a readable report.
+
+    Args:
+        clusters: Clusters to list
+
+    Returns:
+        One paragraph per cluster with the similarity and location of each rule
+    """
+    paragraphs = []
+    for number, cluster in enumerate(clusters, 1):
+        similarities = [similarity for _, similarity in cluster.members]
+        files = "1 file" if cluster.files == 1 else f"{cluster.files} files"
+        lines = [
+            f"Cluster {number}: {len(cluster.members)} rules in {files}, "
+            f"similarity {min(similarities):.2f}-{max(similarities):.2f}, "
+            f"~{cluster.repeated_tokens:,} repeated tokens"
+        ]
+        width = max(
+            len(f"{os.path.basename(unit.source)}:{unit.line}")
+            for unit, _ in cluster.members
+        )
+        for unit, similarity in cluster.members:
+            location = f"{os.path.basename(unit.source)}:{unit.line}"
+            preview = " ".join(unit.text.split())
+            if len(preview) > PREVIEW_LENGTH:
+                preview = preview[: PREVIEW_LENGTH - 3] + "..."
+            lines.append(f"  {similarity:.2f}  {location.ljust(width)}  {preview}")
+        paragraphs.append("\n".join(lines))
+    return "\n\n".join(paragraphs)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Main entry point for duplicates CLI.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv)
+    """
+    catalog = get_shared_catalog()
+    parser = argparse.ArgumentParser(
+        description=(
+            "Find near-duplicate paragraphs and list items across the local rule "
+            "files so they can be moved into shared blocks"
+        )
+    )
+    parser.add_argument(
+        "--category",
+        action="append",
+        choices=catalog.categories,
+        help="Only analyze files of this category (repeatable)",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.7,
+        help="Minimum similarity of clustered rules, 0.5-1.0 (default: 0.7)",
+    )
+    parser.add_argument(
+        "--min-words",
+        type=int,
+        default=5,
+        help="Ignore rules with fewer words (default: 5)",
+    )
+    parser.add_argument(
+        "--format", choices=["text", "json"], default="text", help="Output format"
+    )
+    args = parser.parse_args(argv)
+
+    files = []
+    for category in args.category or catalog.categories:
+        files.extend(catalog.get_files(category))
+    if not files:
+        print("No rule files found")
+        sys.exit(1)
+
+    try:
+        finder = NearDuplicateFinder(args.threshold, args.min_words)
+        clusters = finder.find_clusters(files)
+    except Exception as e:
+        logger.error(f"An unexpected error occurred: {e}")
+        sys.exit(1)
+
+    if args.format == "json":
+        report = [
+            {
+                "files": cluster.files,
+                "repeated_tokens": cluster.repeated_tokens,
+                "rules": [
+                    {
+                        "source": unit.source,
+                        "line": unit.line,
+                        "similarity": round(similarity, 3),
+                        "text": unit.text,
+                    }
+                    for unit, similarity in cluster.members
+                ],
+            }
+            for cluster in clusters
+        ]
+        print(json.dumps(report, indent=2))
+    elif clusters:
+        print(format_clusters(clusters))
+    else:
+        print("No near-duplicate rules found")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""CLI interface for browsing recorded block versions."""
+
+import argparse
+import sys
+from datetime import datetime
+from typing import List, Optional
+from src.utils.logging_config import setup_logger
+from src.core.block_store import BlockStore
+
+logger = setup_logger(__name__)
+
+
+class HistoryCLI:
+    """CLI interface for browsing recorded block versions."""
+
+    def __init__(self):
+        """Initialize HistoryCLI with required components."""
+        self.block_store = BlockStore()
+
+    def list_blocks(self) -> bool:
+        """
+        Print every block with its number of distinct versions.
+
+        Returns:
+            True if any block has been recorded, False otherwise
+        """
+        blocks = self.block_store.blocks()
+        if not blocks:
+            print("No block versions recorded yet")
+            return False
+
+        for block in blocks:
+            versions = self.block_store.history(block)
+            distinct = len({version.digest for version in versions})
+            print(f"{block:32} {distinct:4} versions  {len(versions):5} sightings")
+        return True
+
+    def list_versions(self, block: str, source: Optional[str]) -> bool:
+        """
+        Print the recorded versions of a block, oldest first.
+
+        Args:
+            block: Block name such as 'LANGUAGE PYTHON'
+            source: Only list sightings in this file
+
+        Returns:
+            True if versions were found, False otherwise
+        """
+        versions = self.block_store.history(block, source)
+        if not versions:
+            print(f"No versions recorded for {block}")
+            return False
+
+        for version in versions:
+            timestamp = datetime.fromtimestamp(version.timestamp)
+            print(
+                f"{version.digest[:12]}  {timestamp:%Y-%m-%d %H:%M:%S}  "
+                f"{version.event:8} {version.source}"
+            )
+        return True
+
+    def show_version(self, digest: str) -> bool:
+        """
+        Print a stored block version.
+
+        Args:
+            digest: Digest or unique digest prefix
+
+        Returns:
+            True if the version was found, False otherwise
+        """
+        text = self.block_store.get_object(digest)
+        if text is None:
+            return False
+        print(text)
+        return True
+
+    def diff_versions(self, old_digest: str, new_digest: str) -> bool:
+        """
+        Print the diff between two stored block versions.
+
+        Args:
+            old_digest: Digest or prefix of the older version
+            new_digest: Digest or prefix of the newer version
+
+        Returns:
+            True if both versions were found, False otherwise
+        """
+        old_text = self.block_store.get_object(old_digest)
+        new_text = self.block_store.get_object(new_digest)
+        if old_text is None or new_text is None:
+            return False
+
+        from src.core.compare.diff_engine import DiffEngine
+
+        block = self.block_store.block_key(new_text) or "BLOCK"
+        diff = DiffEngine(color=sys.stdout.isatty()).render_unified(
+            old_text, new_text, block, (old_digest, new_digest)
+        )
+        print(diff if diff else "Versions are identical")
+        return True
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Main entry point for history CLI.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv)
+    """
+    parser = argparse.ArgumentParser(
+        description="Browse block versions recorded by create, compare and update"
+    )
+    actions = parser.add_subparsers(dest="action", required=True)
+
+    list_parser = actions.add_parser(
+        "list", help="List recorded blocks, or the versions of one block"
+    )
+    list_parser.add_argument(
+        "block", nargs="*", help="Block name, e.g. LANGUAGE PYTHON"
+    )
+    list_parser.add_argument("--source", help="Only list sightings in this file")
+
+    show_parser = actions.add_parser("show", help="Print a stored block version")
+    show_parser.add_argument("digest", help="Version digest or unique prefix")
+
+    diff_parser = actions.add_parser("diff", help="Diff two stored block versions")
+    diff_parser.add_argument("old", help="Digest or prefix of the older version")
+    diff_parser.add_argument("new", help="Digest or prefix of the newer version")
+
+    seen_parser = actions.add_parser(
+        "seen", help="Check whether a block version was ever recorded"
+    )
+    seen_parser.add_argument("digest", help="Version digest or prefix")
+    seen_parser.add_argument("block", nargs="+", help="Block name, e.g. GENERAL RULES")
+    seen_parser.add_argument("--source", help="Only consider sightings in this file")
+    args = parser.parse_args(argv)
+
+    cli = HistoryCLI()
+    if args.action == "list":
+        if args.block:
+            success = cli.list_versions(" ".join(args.block), args.source)
+        else:
+            success = cli.list_blocks()
+    elif args.action == "show":
+        success = cli.show_version(args.digest)
+    elif args.action == "diff":
+        success = cli.diff_versions(args.old, args.new)
+    else:
+        block = " ".join(args.block)
+        success = cli.block_store.has_seen(block, args.digest, args.source)
+        print(f"{block} {args.digest}: {'seen' if success else 'never seen'}")
+
+    if not success:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
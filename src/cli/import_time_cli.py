@@ -0,0 +1,206 @@
+"""CLI interface for checking subcommand import times with -X importtime."""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from typing import Dict, List, Optional, Set, Tuple
+from src.utils.logging_config import setup_logger
+from src.core.file_manager import FileManager
+from src.cli.main import SUBCOMMANDS
+
+logger = setup_logger(__name__)
+
+PROJECT_ROOT = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
+
+# Module every subcommand is started through
+ENTRY_MODULE = "src.cli.main"
+
+# Modules a subcommand must not load just by being imported
+FORBIDDEN_IMPORTS: Dict[str, List[str]] = {
+    "create": ["sqlite3", "difflib", "subprocess", "ctypes", "concurrent.futures"],
+    "compare": ["ctypes", "subprocess", "concurrent.futures"],
+    "update-local": [
+        "sqlite3",
+        "difflib",
+        "subprocess",
+        "ctypes",
+        "concurrent.futures",
+    ],
+    "update-external": [
+        "sqlite3",
+        "difflib",
+        "subprocess",
+        "ctypes",
+        "concurrent.futures",
+    ],
+    "audit": ["difflib", "subprocess", "ctypes", "concurrent.futures"],
+    "drift": ["sqlite3", "difflib", "subprocess", "ctypes", "concurrent.futures"],
+    "history": ["sqlite3", "difflib", "subprocess", "ctypes", "concurrent.futures"],
+    "stats": ["sqlite3", "difflib", "subprocess", "ctypes", "concurrent.futures"],
+    "duplicates": [
+        "sqlite3",
+        "difflib",
+        "subprocess",
+        "ctypes",
+        "concurrent.futures",
+    ],
+    "daemon": ["sqlite3", "difflib", "subprocess", "ctypes", "socketserver"],
+    "client": ["sqlite3", "difflib", "subprocess", "ctypes", "socketserver"],
+}
+
+
+def measure_import(module_name: str) -> Tuple[int, Set[str]]:
+    """
+    Import the entry point and a module in a fresh interpreter with -X importtime.
+
+    Args:
+        module_name: Dotted module name to import after the entry point
+
+    Returns:
+        Tuple of (cumulative import time of both in microseconds, names of all
+        loaded modules)
+    """
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            f"import {ENTRY_MODULE}, {module_name}",
+        ],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    cumulative = 0
+    modules: Set[str] = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        name = parts[2].strip()
+        modules.add(name)
+        if name in (ENTRY_MODULE, module_name):
+            cumulative += int(parts[1])
+    return cumulative, modules
+
+
+def check_import_times(
+    baseline: Optional[Dict[str, int]],
+    tolerance: float,
+    max_ms: Optional[float],
+    repeat: int = 1,
+) -> Tuple[bool, Dict[str, int]]:
+    """
+    Measure every subcommand and compare against limits.
+
+    Args:
+        baseline: Previously recorded times in microseconds per subcommand
+        tolerance: Allowed slowdown factor relative to the baseline
+        max_ms: Absolute limit in milliseconds for any subcommand
+        repeat: Measure each subcommand this many times and keep the fastest
+
+    Returns:
+        Tuple of (True if all checks passed, measured times per subcommand)
+    """
+    passed = True
+    timings: Dict[str, int] = {}
+    for command, (target, _) in SUBCOMMANDS.items():
+        if command == "import-time":
+            continue
+
+        module_name = target.partition(":")[0]
+        runs = [measure_import(module_name) for _ in range(max(repeat, 1))]
+        cumulative = min(elapsed for elapsed, _ in runs)
+        modules = runs[0][1]
+        timings[command] = cumulative
+        status = "ok"
+
+        loaded = [m for m in FORBIDDEN_IMPORTS.get(command, []) if m in modules]
+        if loaded:
+            status = f"loads {', '.join(loaded)}"
+        elif max_ms is not None and cumulative / 1000 > max_ms:
+            status = f"over {max_ms:.1f} ms limit"
+        elif baseline and command in baseline:
+            if cumulative > baseline[command] * tolerance:
+                status = f"slower than baseline {baseline[command] / 1000:.1f} ms"
+
+        if status != "ok":
+            passed = False
+        print(f"{command:16} {cumulative / 1000:8.1f} ms  {status}")
+
+    return passed, timings
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Main entry point for import_time CLI.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv)
+    """
+    parser = argparse.ArgumentParser(
+        description="Check subcommand import times for regressions"
+    )
+    parser.add_argument(
+        "--baseline",
+        help="JSON file with import times recorded on this machine",
+    )
+    parser.add_argument(
+        "--write-baseline",
+        action="store_true",
+        help="Record the measured times into the baseline file",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=1.5,
+        help="Allowed slowdown factor relative to the baseline",
+    )
+    parser.add_argument(
+        "--max-ms", type=float, help="Absolute limit in milliseconds per subcommand"
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=10,
+        help="Measurements per subcommand; the fastest one counts (default: 10)",
+    )
+    args = parser.parse_args(argv)
+
+    if args.write_baseline and not args.baseline:
+        parser.error("--write-baseline requires --baseline")
+
+    baseline = None
+    if args.baseline and not args.write_baseline:
+        if not os.path.exists(args.baseline):
+            logger.warning(
+                f"No baseline at {args.baseline}; only checking forbidden imports "
+                "and limits"
+            )
+        else:
+            content = FileManager.read_file(args.baseline)
+            if content is not None:
+                baseline = json.loads(content)
+
+    passed, timings = check_import_times(
+        baseline, args.tolerance, args.max_ms, args.repeat
+    )
+
+    if args.write_baseline:
+        FileManager.write_file(args.baseline, json.dumps(timings, indent=2))
+        logger.info(f"Baseline written to {args.baseline}")
+
+    if not passed:
+        print("Import time check failed")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+"""Unified command-line entry point with lazily loaded subcommands."""
+
+import importlib
+import sys
+from typing import Dict, List, Optional, Tuple
+
+# Subcommand -> (module[:function] taking argv, description); the function
+# defaults to main. Modules are imported only when their subcommand runs.
+SUBCOMMANDS: Dict[str, Tuple[str, str]] = {
+    "create": (
+        "src.cli.create_rules_cli",
+        "Create a clinerules file from selected rule files",
+    ),
+    "compare": (
+        "src.cli.compare_rules_cli",
+        "Compare clinerules blocks between files",
+    ),
+    "update-local": (
+        "src.cli.update_local_cli",
+        "Update a local rule file with content from an external file",
+    ),
+    "update-external": (
+        "src.cli.update_external_cli",
+        "Update external clinerules files with content from local rule files",
+    ),
+    "audit": (
+        "src.cli.audit_cli",
+        "Compare many external clinerules files against all local blocks",
+    ),
+    "drift": (
+        "src.cli.drift_cli",
+        "Group external blocks by variant and diff each variant once",
+    ),
+    "history": (
+        "src.cli.history_cli",
+        "Browse block versions recorded by create, compare and update",
+    ),
+    "stats": (
+        "src.cli.stats_cli",
+        "Report characters, lines and estimated tokens of rules and blocks",
+    ),
+    "duplicates": (
+        "src.cli.duplicates_cli",
+        "Find near-duplicate rules across the local rule files",
+    ),
+    "daemon": (
+        "src.cli.daemon_cli:serve_main",
+        "Run the daemon serving requests over a Unix domain socket",
+    ),
+    "client": (
+        "src.cli.daemon_cli",
+        "Send a request to the running daemon",
+    ),
+    "import-time": (
+        "src.cli.import_time_cli",
+        "Check subcommand import times for regressions",
+    ),
+}
+
+
+# Options accepted before the subcommand: option -> (value name, description)
+GLOBAL_OPTIONS = {
+    "--profile": (
+        "FILE",
+        "Write stage timings as JSON (or folded stacks for .folded)",
+    ),
+    "--cprofile": (
+        "FILE",
+        "Capture the whole command with cProfile into a .prof file",
+    ),
+    "--log-format": ("FORMAT", "Log output format: text (default) or json"),
+}
+
+# Flags accepted before the subcommand
+GLOBAL_FLAGS = {
+    "--summary": "Count per-file messages and log one summary at the end",
+    "--quiet": "Only log warnings, errors and the final summary",
+}
+
+LOG_FORMATS = ("text", "json")
+
+
+def print_usage() -> None:
+    """Print the list of available subcommands."""
+    print(
+        "usage: cline_tools.py [--profile FILE] [--cprofile FILE] "
+        "[--log-format FORMAT] [--summary] [--quiet] <command> [options]\n"
+    )
+    print("commands:")
+    width = max(
+        [len(name) for name in SUBCOMMANDS]
+        + [len(f"{option} {value}") for option, (value, _) in GLOBAL_OPTIONS.items()]
+    )
+    for name, (_, description) in SUBCOMMANDS.items():
+        print(f"  {name.ljust(width)}  {description}")
+    print("\noptions:")
+    for option, (value_name, description) in GLOBAL_OPTIONS.items():
+        print(f"  {(option + ' ' + value_name).ljust(width)}  {description}")
+    for flag, description in GLOBAL_FLAGS.items():
+        print(f"  {flag.ljust(width)}  {description}")
+    print("\nRun 'cline_tools.py <command> --help' for command options.")
+
+
+def parse_global_options(
+    argv: List[str],
+) -> Optional[Tuple[Dict[str, str], List[str]]]:
+    """
+    Split leading global options from the subcommand arguments.
+
+    Args:
+        argv: Command-line arguments without the program name
+
+    Returns:
+        Tuple of (option -> value, remaining arguments) or None if an option
+        is missing its value; flags map to an empty string
+    """
+    options: Dict[str, str] = {}
+    while argv and (
+        argv[0] in GLOBAL_FLAGS or argv[0].split("=", 1)[0] in GLOBAL_OPTIONS
+    ):
+        if argv[0] in GLOBAL_FLAGS:
+            options[argv[0]], argv = "", argv[1:]
+            continue
+        option, separator, value = argv[0].partition("=")
+        if separator:
+            argv = argv[1:]
+        elif len(argv) > 1:
+            value, argv = argv[1], argv[2:]
+        else:
+            return None
+        options[option] = value
+    return options, argv
+
+
+def run_command(command: str, command_args: List[str], profiled: bool = False) -> int:
+    """
+    Import and run a subcommand.
+
+    Args:
+        command: Subcommand name
+        command_args: Arguments for the subcommand
+        profiled: Record the import and the run as profiling spans
+
+    Returns:
+        Process exit code: the subcommand's return value if it returns an int,
+        0 otherwise (subcommands may also exit through SystemExit)
+    """
+    target, _ = SUBCOMMANDS[command]
+    module_name, _, function_name = target.partition(":")
+    sys.argv = [f"cline_tools.py {command}"] + command_args
+    if not profiled:
+        module = importlib.import_module(module_name)
+        result = getattr(module, function_name or "main")(command_args)
+        return result if isinstance(result, int) else 0
+
+    from src.utils.profiling import span
+
+    with span(f"cli.{command}"):
+        with span("cli.import"):
+            module = importlib.import_module(module_name)
+        result = getattr(module, function_name or "main")(command_args)
+    return result if isinstance(result, int) else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Dispatch to a subcommand.
+
+    Args:
+        argv: Command-line arguments without the program name (defaults to sys.argv)
+
+    Returns:
+        Process exit code
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    parsed = parse_global_options(argv)
+    if parsed is None:
+        print(f"Missing value for {argv[-1]}\n")
+        print_usage()
+        return 2
+
+    options, argv = parsed
+    if not argv or argv[0] in ("-h", "--help"):
+        print_usage()
+        return 0
+
+    command, command_args = argv[0], argv[1:]
+    if command not in SUBCOMMANDS:
+        print(f"Unknown command: {command}\n")
+        print_usage()
+        return 2
+
+    log_format = options.get("--log-format", "text")
+    if log_format not in LOG_FORMATS:
+        print(f"Unknown log format: {log_format}\n")
+        print_usage()
+        return 2
+
+    # Logging and profiling are set up only when asked for, so plain runs
+    # start without loading them
+    logging_options = ("--log-format", "--summary", "--quiet")
+    configured = any(option in options for option in logging_options)
+    if configured:
+        from src.utils.logging_config import configure_logging
+
+        configure_logging(
+            json_lines=log_format == "json",
+            aggregate="--summary" in options,
+            quiet="--quiet" in options,
+        )
+
+    profile_path = options.get("--profile")
+    cprofile_path = options.get("--cprofile")
+    if profile_path:
+        from src.utils.profiling import enable_profiling
+
+        enable_profiling()
+    if cprofile_path:
+        import cProfile
+
+        capture = cProfile.Profile()
+        capture.enable()
+
+    try:
+        return run_command(command, command_args, profiled=bool(profile_path))
+    finally:
+        if cprofile_path:
+            capture.disable()
+            capture.dump_stats(cprofile_path)
+            print(f"cProfile data written to {cprofile_path}", file=sys.stderr)
+        if profile_path:
+            from src.utils.profiling import write_profile
+
+            if write_profile(profile_path):
+                print(f"Profile written to {profile_path}", file=sys.stderr)
+        if configured:
+            from src.utils.logging_config import shutdown_logging
+
+            shutdown_logging()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,139 @@
+"""CLI interface for reporting the size and token cost of rule content."""
+
+import argparse
+import json
+import os
+import sys
+from typing import List, Optional
+from src.utils.logging_config import setup_logger
+from src.core.block_stats import BlockSize, BlockStats
+from src.core.rules.catalog import get_shared_catalog
+
+logger = setup_logger(__name__)
+
+
+class StatsCLI:
+    """CLI interface for reporting the size and token cost of rule content."""
+
+    def __init__(self):
+        """Initialize StatsCLI with required components."""
+        self.block_stats = BlockStats()
+        self.catalog = get_shared_catalog()
+
+    def local_sizes(self) -> List[BlockSize]:
+        """
+        Measure every local rule file.
+
+        Returns:
+            Sizes grouped by category
+        """
+        files = []
+        for category_files in self.catalog.get_files_by_category():
+            files.extend(category_files)
+        return self.block_stats.local_stats(files)
+
+    def external_sizes(self, external_files: List[str]) -> List[BlockSize]:
+        """
+        Measure every block of the given external files.
+
+        Args:
+            external_files: Paths of external clinerules files
+
+        Returns:
+            Sizes per block, file by file
+        """
+        sizes = []
+        for external_file in external_files:
+            sizes.extend(self.block_stats.external_file_stats(external_file))
+        return sizes
+
+    def print_report(
+        self, local: List[BlockSize], external: List[BlockSize], as_json: bool
+    ) -> None:
+        """
+        Print the measured sizes.
+
+        Args:
+            local: Sizes of local rule files
+            external: Sizes of external blocks
+            as_json: Print JSON instead of tables
+        """
+        if as_json:
+            report = {
+                "local": [size._asdict() for size in local],
+                "external": [size._asdict() for size in external],
+            }
+            print(json.dumps(report, indent=2))
+            return
+
+        if local:
+            print("Local rule files:")
+            print(self.block_stats.format_table(local))
+        if external:
+            if local:
+                print()
+            print("External blocks:")
+            print(self.block_stats.format_table(external, os.getcwd()))
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Main entry point for stats CLI.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv)
+    """
+    parser = argparse.ArgumentParser(
+        description=(
+            "Report characters, lines and estimated tokens of every local rule "
+            "file, or of every block of external clinerules files"
+        )
+    )
+    parser.add_argument(
+        "external_files", nargs="*", help="External clinerules files to measure"
+    )
+    parser.add_argument(
+        "--root",
+        action="append",
+        default=[],
+        help="Directory to search for .clinerules files (repeatable)",
+    )
+    parser.add_argument(
+        "--file-list", help="Text file with one external clinerules path per line"
+    )
+    parser.add_argument(
+        "--local",
+        action="store_true",
+        help="Also list local rule files when measuring external files",
+    )
+    parser.add_argument(
+        "--format", choices=["text", "json"], default="text", help="Output format"
+    )
+    args = parser.parse_args(argv)
+
+    external_files = list(args.external_files)
+    if args.root or args.file_list:
+        # Imported here so plain runs skip loading the batch comparer
+        from src.core.compare.batch_comparer import BatchComparer
+
+        external_files.extend(
+            BatchComparer(workers=1).discover_external_files(args.root, args.file_list)
+        )
+
+    try:
+        cli = StatsCLI()
+        local = cli.local_sizes() if args.local or not external_files else []
+        external = cli.external_sizes(external_files)
+        cli.print_report(local, external, args.format == "json")
+        success = bool(local or external)
+    except Exception as e:
+        logger.error(f"An unexpected error occurred: {e}")
+        success = False
+
+    if not success:
+        print("No rule content found")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,11 @@
 """CLI interface for updating external clinerules files with local content."""
 
 import argparse
+from typing import List, Optional
 from src.utils.logging_config import setup_logger
 from src.core.update.update_handler import UpdateHandler
 from src.core.update.block_updater import BlockUpdater
+from src.core.file_manager import FileManager
 
 logger = setup_logger(__name__)
 
@@ -11,10 +13,24 @@ logger = setup_logger(__name__)
 class UpdateExternalCLI:
     """CLI interface for updating external clinerules files with local content."""
 
-    def __init__(self):
-        """Initialize UpdateExternalCLI with required components."""
+    def __init__(self, fsync: bool = False, use_history: bool = True):
+        """
+        Initialize UpdateExternalCLI with required components.
+
+        Args:
+            fsync: Whether to flush written files to disk
+            use_history: Whether to record block versions in the block store
+        """
         self.update_handler = UpdateHandler()
-        self.block_updater = BlockUpdater()
+        block_store = None
+        if use_history:
+            # Imported here so --no-history runs never load the store
+            from src.core.block_store import BlockStore
+
+            block_store = BlockStore()
+        self.block_updater = BlockUpdater(
+            fsync, block_store, update_handler=self.update_handler
+        )
 
     def update_external_file(self, external_file: str) -> bool:
         """
@@ -43,19 +59,98 @@ class UpdateExternalCLI:
             logger.error(f"An unexpected error occurred: {e}")
             return False
 
+    def update_external_files(
+        self,
+        external_files: List[str],
+        local_files: List[str],
+        workers: Optional[int] = None,
+    ) -> bool:
+        """
+        Update many external files with content from several local files.
+
+        Each external file is read and written once regardless of how many
+        blocks are replaced.
+
+        Args:
+            external_files: Paths to external clinerules files
+            local_files: Paths to local rule files to apply
+            workers: Maximum number of external files updated concurrently
+
+        Returns:
+            True if all updates were successful, False otherwise (files that
+            fail validation are skipped and the rest are still updated)
+        """
+        try:
+            # validate_files logs why a file is skipped
+            valid_files = [
+                external_file
+                for external_file in external_files
+                if self.update_handler.validate_files(external_file)
+            ]
+            if not valid_files:
+                return False
+
+            if not local_files:
+                local_file = self.update_handler.select_local_file()
+                if not local_file:
+                    return False
+                local_files = [local_file]
 
-def main() -> None:
-    """Main entry point for update_external CLI."""
+            updated = self.block_updater.update_externals_with_locals(
+                valid_files, local_files, workers
+            )
+            return updated and len(valid_files) == len(external_files)
+
+        except Exception as e:
+            logger.error(f"An unexpected error occurred: {e}")
+            return False
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Main entry point for update_external CLI.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv)
+    """
     parser = argparse.ArgumentParser(
         description="Update external clinerules file with content from local file"
     )
-    parser.add_argument("external_file", help="Path to external clinerules file")
-    args = parser.parse_args()
-
-    cli = UpdateExternalCLI()
-    if not cli.update_external_file(args.external_file):
+    parser.add_argument(
+        "external_files", nargs="+", help="Path(s) to external clinerules file(s)"
+    )
+    parser.add_argument(
+        "--local",
+        action="append",
+        default=[],
+        help="Local rule file to apply (repeatable, prompts if omitted)",
+    )
+    parser.add_argument(
+        "--workers", type=int, help="Maximum number of files updated in parallel"
+    )
+    parser.add_argument(
+        "--fsync", action="store_true", help="Flush written files to disk"
+    )
+    parser.add_argument(
+        "--no-history",
+        action="store_true",
+        help="Do not record block versions in the block store",
+    )
+    args = parser.parse_args(argv)
+
+    cli = UpdateExternalCLI(args.fsync, use_history=not args.no_history)
+    if len(args.external_files) == 1 and not args.local:
+        success = cli.update_external_file(args.external_files[0])
+    else:
+        success = cli.update_external_files(
+            args.external_files, args.local, args.workers
+        )
+    if not success:
         print("Failed to update external file")
 
+    FileManager.flush_pending_syncs()
+    FileManager.log_write_stats()
+
 
 if __name__ == "__main__":
     main()
@@ -1,9 +1,11 @@
 """CLI interface for updating local clinerules files with external content."""
 
 import argparse
+from typing import List, Optional
 from src.utils.logging_config import setup_logger
 from src.core.update.update_handler import UpdateHandler
 from src.core.update.block_updater import BlockUpdater
+from src.core.file_manager import FileManager
 
 logger = setup_logger(__name__)
 
@@ -11,10 +13,24 @@ logger = setup_logger(__name__)
 class UpdateLocalCLI:
     """CLI interface for updating local clinerules files with external content."""
 
-    def __init__(self):
-        """Initialize UpdateLocalCLI with required components."""
+    def __init__(self, fsync: bool = False, use_history: bool = True):
+        """
+        Initialize UpdateLocalCLI with required components.
+
+        Args:
+            fsync: Whether to flush written files to disk
+            use_history: Whether to record block versions in the block store
+        """
         self.update_handler = UpdateHandler()
-        self.block_updater = BlockUpdater()
+        block_store = None
+        if use_history:
+            # Imported here so --no-history runs never load the store
+            from src.core.block_store import BlockStore
+
+            block_store = BlockStore()
+        self.block_updater = BlockUpdater(
+            fsync, block_store, update_handler=self.update_handler
+        )
 
     def update_local_file(self, external_file: str) -> bool:
         """
@@ -44,18 +60,34 @@ class UpdateLocalCLI:
             return False
 
 
-def main() -> None:
-    """Main entry point for update_local CLI."""
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Main entry point for update_local CLI.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv)
+    """
     parser = argparse.ArgumentParser(
         description="Update local clinerules file with content from external file"
     )
     parser.add_argument("external_file", help="Path to external clinerules file")
-    args = parser.parse_args()
+    parser.add_argument(
+        "--fsync", action="store_true", help="Flush written files to disk"
+    )
+    parser.add_argument(
+        "--no-history",
+        action="store_true",
+        help="Do not record block versions in the block store",
+    )
+    args = parser.parse_args(argv)
 
-    cli = UpdateLocalCLI()
+    cli = UpdateLocalCLI(args.fsync, use_history=not args.no_history)
     if not cli.update_local_file(args.external_file):
         print("Failed to update local file")
 
+    FileManager.flush_pending_syncs()
+    FileManager.log_write_stats()
+
 
 if __name__ == "__main__":
     main()
@@ -1,7 +1,12 @@
 import os
 import re
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 from src.utils.logging_config import setup_logger
+from src.core.block_index import BlockIndex, BlockEntry
+from src.core.markers import normalize_name
+from src.core.file_manager import FileManager
+from src.core.document_cache import DocumentCache
+from src.utils.profiling import span
 
 logger = setup_logger(__name__)
 
@@ -9,6 +14,11 @@ logger = setup_logger(__name__)
 class BlockExtractor:
     """Handles extraction of blocks from clinerules files."""
 
+    # Files at least this large are extracted through a memory map
+    MMAP_THRESHOLD = 4 * 1024 * 1024
+
+    LANGUAGE_MARKER = "### BEGIN LANGUAGE"
+
     BLOCK_TYPES = {
         "LANGUAGE": r"clinerules_language_(\w+)\.md",
         "SYSTEM": "SYSTEM",
@@ -73,9 +83,112 @@ class BlockExtractor:
             return f"### BEGIN {block_type}"
         return None
 
+    @classmethod
+    def get_language(cls, filename: str) -> Optional[str]:
+        """
+        Get the normalized language of a language rule file.
+
+        Args:
+            filename: Name of file being processed
+
+        Returns:
+            Language such as 'PYTHON' or 'ARDUINO C', or None if the file name
+            names no language
+        """
+        start_pattern = cls.get_start_pattern("LANGUAGE", filename)
+        if not start_pattern:
+            return None
+        return normalize_name(start_pattern[len(cls.LANGUAGE_MARKER):])
+
+    @staticmethod
+    def find_language_prefix(index: BlockIndex, language: str) -> Optional[BlockEntry]:
+        """
+        Find the language block whose name is the longest word prefix of language.
+
+        Covers file names that are more specific than their marker, e.g.
+        clinerules_language_autohotkey_v1.md holding '### BEGIN LANGUAGE AUTOHOTKEY'.
+
+        Args:
+            index: Index of the document to search
+            language: Normalized language
+
+        Returns:
+            Matching block entry or None if no block name is a prefix
+        """
+        words = language.split()
+        best: Optional[BlockEntry] = None
+        best_length = 0
+        for entry in index.entries:
+            if entry.block_type != "LANGUAGE":
+                continue
+            name_words = entry.name.split()
+            length = len(name_words)
+            if best_length < length <= len(words) and words[:length] == name_words:
+                best, best_length = entry, length
+        return best
+
+    @classmethod
+    def find_block(
+        cls,
+        index: BlockIndex,
+        block_type: str,
+        filename: str,
+        warn_missing: bool = True,
+    ) -> Optional[BlockEntry]:
+        """
+        Look up a block in a document index.
+
+        Language blocks are looked up by the language named in the file name,
+        so documents holding several languages resolve to the right block.
+
+        Args:
+            index: Index of the document to search
+            block_type: Type of block to find (GENERAL, LANGUAGE, SYSTEM, or PROJECT)
+            filename: Name of file being processed
+            warn_missing: Log a warning if the block cannot be found
+
+        Returns:
+            Matching block entry or None if block cannot be found
+        """
+        if block_type == "LANGUAGE":
+            language = cls.get_language(filename)
+            if language is None:
+                # No language in the file name: use the first language block
+                entry = index.find(cls.LANGUAGE_MARKER)
+                if not entry and warn_missing:
+                    logger.warning(
+                        "Could not find '%s' in %s", cls.LANGUAGE_MARKER, filename
+                    )
+                return entry
+
+            entry = index.find_name("LANGUAGE", language)
+            if not entry:
+                entry = cls.find_language_prefix(index, language)
+            if not entry and warn_missing:
+                logger.warning(
+                    "Could not find language block %s in %s", language, filename
+                )
+            return entry
+
+        start_pattern = cls.get_start_pattern(block_type, filename)
+        if not start_pattern:
+            logger.warning("Could not determine start pattern for %s", filename)
+            return None
+
+        entry = index.find(start_pattern)
+        if not entry and warn_missing:
+            logger.warning(
+                "Could not find start pattern '%s' in %s", start_pattern, filename
+            )
+        return entry
+
     @classmethod
     def extract_block(
-        cls, content: str, block_type: str, filename: str
+        cls,
+        content: str,
+        block_type: str,
+        filename: str,
+        index: Optional[BlockIndex] = None,
     ) -> Optional[str]:
         """
         Extract block from content based on type.
@@ -84,55 +197,133 @@ class BlockExtractor:
             content: File content to extract from
             block_type: Type of block to extract (GENERAL, LANGUAGE, SYSTEM, or PROJECT)
             filename: Name of file being processed
+            index: Prebuilt index of content (built on demand if omitted)
 
         Returns:
             Extracted block content or None if block cannot be found
         """
-        # For language blocks, search for lines starting with "### BEGIN LANGUAGE"
-        if block_type == "LANGUAGE":
-            # Find all lines starting with "### BEGIN LANGUAGE"
-            begin_lines = re.finditer(r"### BEGIN LANGUAGE.*", content)
-            start_pattern = None
-            
-            # Use the first matching line as the start pattern
-            for line_match in begin_lines:
-                start_pattern = line_match.group(0)
-                break
-                
-            if not start_pattern:
-                logger.warning(f"Could not find '### BEGIN LANGUAGE' in {filename}")
-                return None
-        else:
-            # For non-language blocks, use the existing approach
-            start_pattern = cls.get_start_pattern(block_type, filename)
-            if not start_pattern:
-                logger.warning(f"Could not determine start pattern for {filename}")
+        with span("block.extract") as stage:
+            stage.add_bytes(len(content))
+            if index is None:
+                index = BlockIndex(content)
+
+            entry = cls.find_block(index, block_type, filename)
+            if not entry:
                 return None
 
-        # Find the start of the block
-        start_match = content.find(start_pattern)
-        if start_match == -1:
-            logger.warning(
-                f"Could not find start pattern '{start_pattern}' in {filename}"
-            )
+            return index.block_text(entry)
+
+    @classmethod
+    def extract_blocks(
+        cls, content: str, index: Optional[BlockIndex] = None
+    ) -> List[Tuple[BlockEntry, str]]:
+        """
+        Extract every block of content in document order.
+
+        Args:
+            content: File content to extract from
+            index: Prebuilt index of content (built on demand if omitted)
+
+        Returns:
+            List of (block entry, stripped block content) tuples
+        """
+        with span("block.extract_all") as stage:
+            stage.add_bytes(len(content))
+            if index is None:
+                index = BlockIndex(content)
+            return [(entry, index.block_text(entry)) for entry in index.entries]
+
+    @classmethod
+    def extract_block_from_file(
+        cls, file_path: str, block_type: str, filename: str
+    ) -> Optional[str]:
+        """
+        Extract a block straight from a file via a memory map.
+
+        Markers are located with a bytes regex over the mapped file and only
+        the requested block's byte range is decoded, so the document is never
+        materialized as a whole string.
+
+        Args:
+            file_path: Path of the file to extract from
+            block_type: Type of block to extract (GENERAL, LANGUAGE, SYSTEM, or PROJECT)
+            filename: Name of file being processed
+
+        Returns:
+            Extracted block content or None if block cannot be found
+        """
+        # Imported here so files below the threshold never load it
+        import mmap
+
+        try:
+            with span("block.extract_mmap") as stage, open(file_path, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                if size == 0:
+                    logger.warning("File is empty: %s", file_path)
+                    return None
+                stage.add_bytes(size)
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    index = BlockIndex.from_buffer(mapped)
+                    entry = cls.find_block(index, block_type, filename)
+                    if not entry:
+                        return None
+                    text = mapped[entry.start:entry.end].decode("utf-8")
+                    # Match the universal newlines of FileManager.read_file
+                    text = text.replace("\r\n", "\n").replace("\r", "\n")
+                    return text.strip()
+        except Exception as e:
+            logger.error("Error reading file %s: %s", file_path, e)
             return None
 
-        # Get content from start pattern
-        block_content = content[start_match:]
+    @classmethod
+    def extract_block_from_path(
+        cls,
+        file_path: str,
+        block_type: str,
+        filename: str,
+        document_cache: Optional[DocumentCache] = None,
+    ) -> Optional[str]:
+        """
+        Extract a block from a file, memory-mapping large files.
 
-        # Find next BEGIN marker if it exists
-        next_begin = re.search(r"### BEGIN", block_content[len(start_pattern) :])
-        if next_begin:
-            # Cut off at next BEGIN
-            block_content = block_content[
-                : len(start_pattern) + next_begin.start()
-            ].strip()
+        Args:
+            file_path: Path of the file to extract from
+            block_type: Type of block to extract (GENERAL, LANGUAGE, SYSTEM, or PROJECT)
+            filename: Name of file being processed
+            document_cache: Optional cache used to read and parse smaller files
 
-        return block_content.strip()
+        Returns:
+            Extracted block content or None if file or block cannot be read
+        """
+        try:
+            size = os.path.getsize(file_path)
+        except OSError as e:
+            logger.error("Could not find file: %s (%s)", file_path, e)
+            return None
+
+        if size >= cls.MMAP_THRESHOLD:
+            return cls.extract_block_from_file(file_path, block_type, filename)
+
+        if document_cache is not None:
+            document = document_cache.get(file_path)
+            if document is None:
+                return None
+            return cls.extract_block(
+                document.content, block_type, filename, document.index
+            )
+
+        content = FileManager.read_file(file_path)
+        if content is None:
+            return None
+        return cls.extract_block(content, block_type, filename)
 
     @classmethod
     def find_block_bounds(
-        cls, content: str, block_type: str, filename: str
+        cls,
+        content: str,
+        block_type: str,
+        filename: str,
+        index: Optional[BlockIndex] = None,
     ) -> Optional[Tuple[int, int]]:
         """
         Find the start and end positions of a block in content.
@@ -141,51 +332,28 @@ class BlockExtractor:
             content: Content to search in
             block_type: Type of block to find
             filename: Name of file being processed
+            index: Prebuilt index of content (built on demand if omitted)
 
         Returns:
             Tuple of (start_pos, end_pos) or None if block not found
         """
-        # For language blocks, search for lines starting with "### BEGIN LANGUAGE"
-        if block_type == "LANGUAGE":
-            # Find all lines starting with "### BEGIN LANGUAGE"
-            begin_lines = re.finditer(r"### BEGIN LANGUAGE.*", content)
-            start_pattern = None
-            
-            # Use the first matching line as the start pattern
-            for line_match in begin_lines:
-                start_pattern = line_match.group(0)
-                break
-                
-            if not start_pattern:
-                logger.warning(f"Could not find '### BEGIN LANGUAGE' in {filename}")
-                return None
-        else:
-            # For non-language blocks, use the existing approach
-            start_pattern = cls.get_start_pattern(block_type, filename)
-            if not start_pattern:
-                logger.warning(f"Could not determine start pattern for {filename}")
-                return None
+        if index is None:
+            index = BlockIndex(content)
 
-        # Find the start of the block
-        start_match = content.find(start_pattern)
-        if start_match == -1:
+        entry = cls.find_block(index, block_type, filename)
+        if not entry:
             return None
 
-        # Get content from start pattern
-        remaining = content[start_match:]
-
-        # Find next BEGIN marker if it exists
-        next_begin = re.search(r"### BEGIN", remaining[len(start_pattern) :])
-        if next_begin:
-            end_pos = start_match + len(start_pattern) + next_begin.start()
-        else:
-            end_pos = len(content)
-
-        return (start_match, end_pos)
+        return (entry.start, entry.end)
 
     @classmethod
     def replace_block(
-        cls, content: str, new_block: str, block_type: str, filename: str
+        cls,
+        content: str,
+        new_block: str,
+        block_type: str,
+        filename: str,
+        index: Optional[BlockIndex] = None,
     ) -> Optional[str]:
         """
         Replace a block in content with new block content.
@@ -195,16 +363,19 @@ class BlockExtractor:
             new_block: New block content to insert
             block_type: Type of block to replace
             filename: Name of file being processed
+            index: Prebuilt index of content (built on demand if omitted)
 
         Returns:
             Updated content with block replaced or None if block not found
         """
-        bounds = cls.find_block_bounds(content, block_type, filename)
-        if not bounds:
-            return None
+        with span("block.replace") as stage:
+            stage.add_bytes(len(content))
+            bounds = cls.find_block_bounds(content, block_type, filename, index)
+            if not bounds:
+                return None
 
-        start_pos, end_pos = bounds
-        return content[:start_pos] + new_block + content[end_pos:]
+            start_pos, end_pos = bounds
+            return content[:start_pos] + new_block + content[end_pos:]
 
     @classmethod
     def compare_blocks(
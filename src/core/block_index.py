@@ -0,0 +1,137 @@
+"""Single-pass index of block markers in clinerules documents."""
+
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from src.core.markers import (
+    find_markers,
+    find_markers_in_buffer,
+    normalize_name,
+    parse_marker,
+)
+
+
+class BlockEntry(NamedTuple):
+    """A single block located in a clinerules document."""
+
+    block_type: str
+    name: str
+    marker: str
+    start: int
+    end: int
+
+
+class BlockIndex:
+    """
+    Table of all block markers in a document with their offsets.
+
+    Markers follow the shared grammar in src.core.markers, so block types
+    and names are stored normalized ('### begin Project' is PROJECT).
+    """
+
+    def __init__(self, content: str, entries: Optional[List[BlockEntry]] = None):
+        """
+        Tokenize content once and record every block.
+
+        Args:
+            content: Document content to index
+            entries: Previously computed entries for content (skips the scan)
+        """
+        self.content = content
+        if entries is None:
+            entries = self._build_entries(find_markers(content), len(content))
+        self.entries: List[BlockEntry] = entries
+        # (block_type, name) -> first entry, built on first lookup
+        self._names: Optional[Dict[Tuple[str, str], BlockEntry]] = None
+
+    @staticmethod
+    def _build_entries(markers: List[Tuple[int, str]], length: int) -> List[BlockEntry]:
+        """
+        Turn marker positions into block entries.
+
+        Args:
+            markers: (offset, marker line) of every marker in document order
+            length: Length of the document
+
+        Returns:
+            List of block entries in document order
+        """
+        entries = []
+        for i, (start, marker) in enumerate(markers):
+            end = markers[i + 1][0] if i + 1 < len(markers) else length
+            block_type, name = parse_marker(marker)
+            entries.append(BlockEntry(block_type, name, marker, start, end))
+        return entries
+
+    @classmethod
+    def from_buffer(cls, buffer) -> "BlockIndex":
+        """
+        Index a bytes-like buffer (e.g. an mmap) without decoding it.
+
+        Only the marker lines are decoded; offsets are byte offsets into the
+        buffer and the returned index carries no content.
+
+        Args:
+            buffer: Bytes-like object holding UTF-8 encoded content
+
+        Returns:
+            BlockIndex with byte-offset entries
+        """
+        entries = cls._build_entries(find_markers_in_buffer(buffer), len(buffer))
+        return cls("", entries)
+
+    def find_name(self, block_type: str, name: str) -> Optional[BlockEntry]:
+        """
+        Find the first block of a type by its name.
+
+        Args:
+            block_type: Block type such as 'LANGUAGE'
+            name: Block name in any spelling accepted by normalize_name
+                (e.g. 'arduino_c')
+
+        Returns:
+            Matching block entry or None if not found
+        """
+        if self._names is None:
+            names: Dict[Tuple[str, str], BlockEntry] = {}
+            for entry in self.entries:
+                names.setdefault((entry.block_type, entry.name), entry)
+            self._names = names
+        return self._names.get((normalize_name(block_type), normalize_name(name)))
+
+    def find(self, start_pattern: str) -> Optional[BlockEntry]:
+        """
+        Find a block by marker, ignoring case and whitespace.
+
+        A block whose identity equals the pattern's wins; otherwise the first
+        block whose name starts with the pattern's name words is returned,
+        so '### BEGIN LANGUAGE' finds any language block.
+
+        Args:
+            start_pattern: Marker to look for, e.g. '### BEGIN PROJECT'
+
+        Returns:
+            Matching block entry or None if not found
+        """
+        block_type, name = parse_marker(start_pattern)
+        entry = self.find_name(block_type, name)
+        if entry is not None:
+            return entry
+
+        words = name.split()
+        for entry in self.entries:
+            if entry.block_type != block_type:
+                continue
+            if entry.name.split()[: len(words)] == words:
+                return entry
+        return None
+
+    def block_text(self, entry: BlockEntry) -> str:
+        """
+        Get the stripped text of a block.
+
+        Args:
+            entry: Block entry from this index
+
+        Returns:
+            Block content without surrounding whitespace
+        """
+        return self.content[entry.start:entry.end].strip()
@@ -0,0 +1,171 @@
+"""Size and token accounting of local rule files and external blocks."""
+
+import os
+from typing import List, NamedTuple, Optional
+from src.utils.logging_config import setup_logger
+from src.core.block_extractor import BlockExtractor
+from src.core.document_cache import DocumentCache, get_shared_document_cache
+from src.core.tokens import TokenCounter, get_shared_token_counter
+
+logger = setup_logger(__name__)
+
+
+class BlockSize(NamedTuple):
+    """Size of one local rule file or one block of an external file."""
+
+    source: str
+    block: str
+    chars: int
+    lines: int
+    tokens: int
+
+
+class BlockStats:
+    """Measures characters, lines and estimated tokens of rule content."""
+
+    def __init__(
+        self,
+        block_extractor: Optional[BlockExtractor] = None,
+        document_cache: Optional[DocumentCache] = None,
+        token_counter: Optional[TokenCounter] = None,
+    ):
+        """
+        Initialize BlockStats with required components.
+
+        Args:
+            block_extractor: Extractor used to split files into blocks
+            document_cache: Cache used to read and index files (defaults to the
+                shared one)
+            token_counter: Token estimator (defaults to the shared one)
+        """
+        self.block_extractor = block_extractor or BlockExtractor()
+        self.document_cache = document_cache or get_shared_document_cache()
+        self.token_counter = token_counter or get_shared_token_counter()
+
+    def measure(self, source: str, block: str, text: str) -> BlockSize:
+        """
+        Measure a piece of rule content.
+
+        Args:
+            source: File the text comes from
+            block: Block name such as 'LANGUAGE PYTHON'
+            text: Content to measure
+
+        Returns:
+            Size of the text
+        """
+        chars, lines, tokens = self.token_counter.measure(text)
+        return BlockSize(source, block, chars, lines, tokens)
+
+    def local_file_stats(self, file_path: str) -> Optional[BlockSize]:
+        """
+        Measure a local rule file as it is merged into the output.
+
+        Args:
+            file_path: Path of the local rule file
+
+        Returns:
+            Size of the file's stripped content or None if it cannot be read
+        """
+        document = self.document_cache.get(file_path)
+        if document is None:
+            return None
+
+        blocks = self.block_extractor.extract_blocks(document.content, document.index)
+        if blocks:
+            entry = blocks[0][0]
+            block = f"{entry.block_type} {entry.name}".strip()
+        else:
+            block = self.block_extractor.determine_block_type(file_path) or ""
+        return self.measure(file_path, block, document.content.strip())
+
+    def local_stats(self, files: List[str]) -> List[BlockSize]:
+        """
+        Measure local rule files, skipping unreadable ones.
+
+        Args:
+            files: Paths of local rule files
+
+        Returns:
+            Sizes in the order of files
+        """
+        sizes = []
+        for file_path in files:
+            size = self.local_file_stats(file_path)
+            if size is not None:
+                sizes.append(size)
+        return sizes
+
+    def external_file_stats(self, file_path: str) -> List[BlockSize]:
+        """
+        Measure every block of an external clinerules file.
+
+        Args:
+            file_path: Path of the external file
+
+        Returns:
+            Size of each block in document order (empty if the file cannot be
+            read or has no blocks)
+        """
+        document = self.document_cache.get(file_path)
+        if document is None:
+            return []
+
+        blocks = self.block_extractor.extract_blocks(document.content, document.index)
+        if not blocks:
+            logger.warning("No blocks found in %s", file_path)
+        return [
+            self.measure(file_path, f"{entry.block_type} {entry.name}".strip(), text)
+            for entry, text in blocks
+        ]
+
+    @staticmethod
+    def format_table(sizes: List[BlockSize], relative_to: Optional[str] = None) -> str:
+        """
+        Format sizes as a table with a total row.
+
+        Args:
+            sizes: Sizes to list
+            relative_to: Directory that source paths are shown relative to (paths
+                on another drive are shown in full)
+
+        Returns:
+            Table of source, block, characters, lines and tokens
+        """
+        if not sizes:
+            return ""
+
+        def source_name(path: str) -> str:
+            if relative_to is None:
+                return os.path.basename(path)
+            try:
+                return os.path.relpath(path, relative_to)
+            except ValueError:
+                # On Windows, paths on another drive have no relative form
+                return os.path.abspath(path)
+
+        rows = [
+            (source_name(size.source), size.block, size.chars, size.lines, size.tokens)
+            for size in sizes
+        ]
+        rows.append(
+            (
+                "Total",
+                "",
+                sum(size.chars for size in sizes),
+                sum(size.lines for size in sizes),
+                sum(size.tokens for size in sizes),
+            )
+        )
+        source_width = max(len("File"), *(len(row[0]) for row in rows))
+        block_width = max(len("Block"), *(len(row[1]) for row in rows))
+        lines = [
+            f"{'File'.ljust(source_width)}  {'Block'.ljust(block_width)}  "
+            f"{'Chars':>9}  {'Lines':>7}  {'Tokens':>8}"
+        ]
+        for source, block, chars, line_count, tokens in rows:
+            lines.append(
+                f"{source.ljust(source_width)}  {block.ljust(block_width)}  "
+                f"{chars:>9,}  {line_count:>7,}  {tokens:>8,}"
+            )
+        return "\n".join(lines)
@@ -0,0 +1,332 @@
+"""Content-addressed store of every block version seen by the tools."""
+
+import hashlib
+import json
+import os
+import threading
+import time
+import zlib
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from src.utils.logging_config import setup_logger
+from src.core.block_index import BlockIndex
+from src.core.markers import is_marker, normalize_name, parse_marker
+from src.core.rules.config import BLOCK_STORE_DIR
+
+logger = setup_logger(__name__)
+
+
+class BlockVersion(NamedTuple):
+    """One recorded sighting of a block version."""
+
+    block: str
+    digest: str
+    source: str
+    event: str
+    timestamp: float
+
+
+class BlockStore:
+    """
+    Git-like object store for block versions.
+
+    Block texts are stored zlib-compressed under objects/<2 hex>/<62 hex>,
+    keyed by their SHA-256, so identical versions are stored once. An
+    append-only index (index.jsonl) maps each block (e.g. 'LANGUAGE PYTHON')
+    to the versions seen, where they were seen and by which command.
+    """
+
+    def __init__(self, root_dir: str = BLOCK_STORE_DIR):
+        """
+        Initialize BlockStore.
+
+        Args:
+            root_dir: Directory holding objects/ and index.jsonl
+        """
+        self.root_dir = root_dir
+        self.objects_dir = os.path.join(root_dir, "objects")
+        self.index_file = os.path.join(root_dir, "index.jsonl")
+        self._lock = threading.Lock()
+        self._history: Optional[Dict[str, List[BlockVersion]]] = None
+        # Latest digest per (block, source), to skip recording repeat sightings
+        self._latest: Dict[Tuple[str, str], str] = {}
+
+    @staticmethod
+    def block_key(text: str) -> Optional[str]:
+        """
+        Get the block name from the marker line of a block.
+
+        Args:
+            text: Block text starting with its '### BEGIN' marker
+
+        Returns:
+            Block name such as 'LANGUAGE PYTHON' or None if text has no marker
+        """
+        marker = text.lstrip().split("\n", 1)[0].rstrip()
+        if not is_marker(marker):
+            return None
+        block_type, name = parse_marker(marker)
+        return f"{block_type} {name}".strip()
+
+    def object_path(self, digest: str) -> str:
+        """
+        Get the path of an object.
+
+        Args:
+            digest: SHA-256 of the block text
+
+        Returns:
+            Path below objects/
+        """
+        return os.path.join(self.objects_dir, digest[:2], digest[2:])
+
+    def has_object(self, digest: str) -> bool:
+        """
+        Check whether a block version is stored.
+
+        Args:
+            digest: SHA-256 of the block text
+
+        Returns:
+            True if the object exists
+        """
+        return os.path.exists(self.object_path(digest))
+
+    def put_object(self, text: str) -> Optional[str]:
+        """
+        Store a block text unless it is already present.
+
+        Args:
+            text: Block text
+
+        Returns:
+            Digest of the text or None if it could not be stored
+        """
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        path = self.object_path(digest)
+        if os.path.exists(path):
+            return digest
+
+        # Imported here so runs that only find stored objects skip loading it
+        import tempfile
+
+        directory = os.path.dirname(path)
+        tmp_path = None
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(zlib.compress(text.encode("utf-8")))
+            os.replace(tmp_path, path)
+            tmp_path = None
+            return digest
+        except OSError as e:
+            logger.error("Error storing block object %s: %s", digest, e)
+            return None
+        finally:
+            if tmp_path and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+    def resolve(self, prefix: str) -> Optional[str]:
+        """
+        Expand an abbreviated digest.
+
+        Args:
+            prefix: Digest or unique digest prefix (at least 4 characters)
+
+        Returns:
+            Full digest or None if the prefix is unknown or ambiguous
+        """
+        prefix = prefix.lower()
+        if len(prefix) < 4:
+            logger.error("Digest prefix too short: %s", prefix)
+            return None
+
+        directory = os.path.join(self.objects_dir, prefix[:2])
+        try:
+            names = [n for n in os.listdir(directory) if not n.endswith(".tmp")]
+        except OSError:
+            names = []
+        matches = [prefix[:2] + name for name in names if name.startswith(prefix[2:])]
+        if len(matches) != 1:
+            problem = "ambiguous" if matches else "unknown"
+            logger.error("Block version %s is %s", prefix, problem)
+            return None
+        return matches[0]
+
+    def get_object(self, digest: str) -> Optional[str]:
+        """
+        Load a stored block text.
+
+        Args:
+            digest: Digest or unique digest prefix
+
+        Returns:
+            Block text or None if it is not stored
+        """
+        full_digest = digest if len(digest) == 64 else self.resolve(digest)
+        if full_digest is None:
+            return None
+
+        try:
+            with open(self.object_path(full_digest), "rb") as f:
+                return zlib.decompress(f.read()).decode("utf-8")
+        except (OSError, zlib.error) as e:
+            logger.error("Error reading block object %s: %s", digest, e)
+            return None
+
+    def _load_index(self) -> Dict[str, List[BlockVersion]]:
+        """
+        Read the index on first use.
+
+        Returns:
+            Mapping of block name to its recorded versions, oldest first
+        """
+        if self._history is not None:
+            return self._history
+
+        history: Dict[str, List[BlockVersion]] = {}
+        if os.path.exists(self.index_file):
+            try:
+                with open(self.index_file, "r", encoding="utf-8") as f:
+                    for line in f:
+                        if not line.strip():
+                            continue
+                        try:
+                            version = BlockVersion(**json.loads(line))
+                        except (TypeError, ValueError):
+                            continue
+                        history.setdefault(version.block, []).append(version)
+                        self._latest[(version.block, version.source)] = version.digest
+            except OSError as e:
+                logger.error("Error reading block index %s: %s", self.index_file, e)
+
+        self._history = history
+        return history
+
+    def is_current(self, marker: str, source: str, digest: str) -> bool:
+        """
+        Check whether a block version is the latest one recorded for a file.
+
+        Args:
+            marker: Marker line of the block
+            source: File the block was seen in
+            digest: Digest of the stripped block text
+
+        Returns:
+            True if nothing new would be recorded for this sighting
+        """
+        block = self.block_key(marker)
+        if block is None:
+            return True
+
+        with self._lock:
+            self._load_index()
+            return self._latest.get((block, os.path.abspath(source))) == digest
+
+    def record_block(self, text: str, source: str, event: str) -> Optional[str]:
+        """
+        Store a block version and note where it was seen.
+
+        Args:
+            text: Block text starting with its marker
+            source: File the block was seen in
+            event: Command that saw it (e.g. 'compare', 'update', 'create')
+
+        Returns:
+            Digest of the block or None if it was not recorded
+        """
+        block = self.block_key(text)
+        if block is None:
+            return None
+
+        text = text.strip()
+        digest = self.put_object(text)
+        if digest is None:
+            return None
+
+        source = os.path.abspath(source)
+        with self._lock:
+            history = self._load_index()
+            if self._latest.get((block, source)) == digest:
+                return digest
+
+            version = BlockVersion(block, digest, source, event, time.time())
+            try:
+                os.makedirs(self.root_dir, exist_ok=True)
+                with open(self.index_file, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(version._asdict()) + "\n")
+            except OSError as e:
+                logger.error("Error writing block index %s: %s", self.index_file, e)
+                return None
+
+            history.setdefault(block, []).append(version)
+            self._latest[(block, source)] = digest
+        return digest
+
+    def record_content(self, content: str, source: str, event: str) -> List[str]:
+        """
+        Record every block of a document.
+
+        Args:
+            content: Document content
+            source: File the content belongs to
+            event: Command that saw it
+
+        Returns:
+            Digests of the recorded blocks
+        """
+        index = BlockIndex(content)
+        digests = []
+        for entry in index.entries:
+            digest = self.record_block(index.block_text(entry), source, event)
+            if digest is not None:
+                digests.append(digest)
+        return digests
+
+    def blocks(self) -> List[str]:
+        """
+        List all blocks with recorded versions.
+
+        Returns:
+            Sorted block names
+        """
+        with self._lock:
+            return sorted(self._load_index())
+
+    def history(
+        self, block: str, source: Optional[str] = None
+    ) -> List[BlockVersion]:
+        """
+        Get the recorded versions of a block.
+
+        Args:
+            block: Block name such as 'LANGUAGE PYTHON'
+            source: Only include sightings in this file
+
+        Returns:
+            Versions oldest first
+        """
+        with self._lock:
+            versions = list(self._load_index().get(normalize_name(block), []))
+        if source is not None:
+            source = os.path.abspath(source)
+            versions = [version for version in versions if version.source == source]
+        return versions
+
+    def has_seen(self, block: str, digest: str, source: Optional[str] = None) -> bool:
+        """
+        Check whether a block version was ever recorded.
+
+        Args:
+            block: Block name such as 'LANGUAGE PYTHON'
+            digest: Digest or digest prefix of the version
+            source: Only consider sightings in this file
+
+        Returns:
+            True if the version was seen (in source, if given)
+        """
+        digest = digest.lower()
+        return any(
+            version.digest.startswith(digest)
+            for version in self.history(block, source)
+        )
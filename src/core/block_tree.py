@@ -0,0 +1,375 @@
+"""Structured tree of clinerules documents: blocks, headings and their content."""
+
+import hashlib
+import re
+from typing import List, Optional, Tuple
+from src.core.block_index import BlockIndex, BlockEntry
+
+HEADING_PATTERN = re.compile(r"(#{1,6})\s+(.*?)\s*#*\s*$")
+FENCE_PATTERN = re.compile(r" {0,3}(```|~~~)")
+LIST_ITEM_PATTERN = re.compile(r"\s*([-*+]|\d+[.)])\s+")
+
+# difflib opcode: (tag, i1, i2, j1, j2)
+Opcode = Tuple[str, int, int, int, int]
+
+
+class TreeNode:
+    """
+    A node of a document tree.
+
+    Kinds are 'block', 'section' (a markdown heading and everything below it
+    up to the next heading of the same or a higher level), 'paragraph',
+    'list_item' and 'code'. Offsets are character offsets into the document,
+    line numbers index its lines; both ends are exclusive.
+    """
+
+    __slots__ = (
+        "kind",
+        "title",
+        "level",
+        "start",
+        "end",
+        "line_start",
+        "line_end",
+        "children",
+        "digest",
+    )
+
+    def __init__(
+        self,
+        kind: str,
+        title: str,
+        level: int,
+        start: int,
+        line_start: int,
+    ):
+        """
+        Initialize TreeNode.
+
+        Args:
+            kind: Node kind
+            title: Heading text or block marker (empty for leaf nodes)
+            level: Heading level (0 for blocks and leaves)
+            start: Offset of the first character
+            line_start: Index of the first line
+        """
+        self.kind = kind
+        self.title = title
+        self.level = level
+        self.start = start
+        self.end = start
+        self.line_start = line_start
+        self.line_end = line_start
+        self.children: List["TreeNode"] = []
+        self.digest: Optional[str] = None
+
+
+class DocumentTree:
+    """Parses a document once into blocks, sections and content nodes."""
+
+    def __init__(self, content: str, index: Optional[BlockIndex] = None):
+        """
+        Build the tree.
+
+        Args:
+            content: Document content
+            index: Prebuilt block index of content (built on demand if omitted)
+        """
+        self.content = content
+        self.index = index if index is not None else BlockIndex(content)
+        self.lines = content.splitlines(keepends=True)
+        self.line_offsets = [0]
+        for line in self.lines:
+            self.line_offsets.append(self.line_offsets[-1] + len(line))
+        self.blocks = [self._parse_block(entry) for entry in self.index.entries]
+
+    def _line_at(self, offset: int) -> int:
+        """
+        Get the index of the line containing an offset.
+
+        Args:
+            offset: Character offset
+
+        Returns:
+            Line index
+        """
+        low, high = 0, len(self.lines)
+        while low < high:
+            middle = (low + high) // 2
+            if self.line_offsets[middle + 1] <= offset:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _close(self, node: TreeNode, line_end: int) -> None:
+        """
+        Set the end of a node to the end of a line range.
+
+        Args:
+            node: Node to close
+            line_end: Index of the first line after the node
+        """
+        node.line_end = max(line_end, node.line_start)
+        node.end = self.line_offsets[node.line_end]
+
+    def _parse_block(self, entry: BlockEntry) -> TreeNode:
+        """
+        Parse one block into sections and content nodes.
+
+        Args:
+            entry: Block entry from the index
+
+        Returns:
+            Block node
+        """
+        first_line = self._line_at(entry.start)
+        last_line = min(
+            self._line_at(max(entry.end - 1, entry.start)) + 1, len(self.lines)
+        )
+        block = TreeNode("block", entry.marker, 0, entry.start, first_line)
+        self._close(block, last_line)
+
+        # Open sections, outermost first; content attaches to the innermost one
+        stack: List[TreeNode] = [block]
+        leaf: Optional[TreeNode] = None
+        fence: Optional[str] = None
+        for number in range(first_line + 1, last_line):
+            line = self.lines[number].rstrip("\r\n")
+
+            if fence is not None:
+                if line.strip().startswith(fence):
+                    self._close(leaf, number + 1)
+                    leaf, fence = None, None
+                continue
+
+            if not line.strip():
+                if leaf is not None:
+                    self._close(leaf, number)
+                    leaf = None
+                continue
+
+            fence_match = FENCE_PATTERN.match(line)
+            heading_match = HEADING_PATTERN.fullmatch(line)
+            item_match = LIST_ITEM_PATTERN.match(line)
+            if fence_match or heading_match or item_match:
+                if leaf is not None:
+                    self._close(leaf, number)
+                    leaf = None
+            elif leaf is not None:
+                # Continuation of the current paragraph or list item
+                continue
+
+            offset = self.line_offsets[number]
+            if fence_match:
+                fence = fence_match.group(1)
+                leaf = TreeNode("code", "", 0, offset, number)
+                stack[-1].children.append(leaf)
+            elif heading_match:
+                level = len(heading_match.group(1))
+                while len(stack) > 1 and stack[-1].level >= level:
+                    self._close(stack.pop(), number)
+                section = TreeNode(
+                    "section", heading_match.group(2), level, offset, number
+                )
+                stack[-1].children.append(section)
+                stack.append(section)
+            else:
+                kind = "list_item" if item_match else "paragraph"
+                leaf = TreeNode(kind, "", 0, offset, number)
+                stack[-1].children.append(leaf)
+
+        if leaf is not None:
+            self._close(leaf, last_line)
+        while len(stack) > 1:
+            self._close(stack.pop(), last_line)
+        return block
+
+    def text(self, node: TreeNode) -> str:
+        """
+        Get the stripped text of a node.
+
+        Args:
+            node: Node of this tree
+
+        Returns:
+            Node text without surrounding whitespace
+        """
+        return self.content[node.start:node.end].strip()
+
+    def digest(self, node: TreeNode) -> str:
+        """
+        Get the content hash of a node, computing it once.
+
+        Args:
+            node: Node of this tree
+
+        Returns:
+            SHA-256 hex digest of the stripped node text
+        """
+        if node.digest is None:
+            node.digest = hashlib.sha256(self.text(node).encode("utf-8")).hexdigest()
+        return node.digest
+
+    def find_block(self, entry: BlockEntry) -> Optional[TreeNode]:
+        """
+        Get the block node of an index entry.
+
+        Args:
+            entry: Block entry from this tree's index
+
+        Returns:
+            Block node or None if the entry is not part of this tree
+        """
+        for block in self.blocks:
+            if block.start == entry.start:
+                return block
+        return None
+
+    def sections(self, node: TreeNode) -> List[TreeNode]:
+        """
+        List all sections below a node, depth first.
+
+        Args:
+            node: Node of this tree
+
+        Returns:
+            Section nodes in document order
+        """
+        found = []
+        for child in node.children:
+            if child.kind == "section":
+                found.append(child)
+                found.extend(self.sections(child))
+        return found
+
+    def units(self, node: TreeNode) -> List[Tuple[int, int, str]]:
+        """
+        Partition the lines of a node at its direct children.
+
+        The first unit holds the node's own header line and anything before
+        the first child; every other unit starts at a child.
+
+        Args:
+            node: Node of this tree
+
+        Returns:
+            List of (line_start, line_end, digest) covering the node's lines
+        """
+        cuts = [node.line_start] + [
+            child.line_start
+            for child in node.children
+            if child.line_start > node.line_start
+        ]
+        cuts.append(node.line_end)
+        units = []
+        for start, end in zip(cuts, cuts[1:]):
+            if end > start:
+                text = "".join(self.lines[start:end])
+                units.append(
+                    (start, end, hashlib.sha256(text.encode("utf-8")).hexdigest())
+                )
+        return units
+
+
+def single_block_tree(text: str) -> Tuple[DocumentTree, TreeNode]:
+    """
+    Parse text holding one block.
+
+    The whole text is treated as a single block, so every line belongs to it
+    even if the marker is missing or not on the first line.
+
+    Args:
+        text: Block text
+
+    Returns:
+        Tuple of (tree, block node)
+    """
+    entries = BlockIndex(text).entries
+    block_type, name, marker = entries[0][:3] if entries else ("", "", "")
+    index = BlockIndex(text, [BlockEntry(block_type, name, marker, 0, len(text))])
+    tree = DocumentTree(text, index)
+    return tree, tree.blocks[0]
+
+
+def section_opcodes(old_text: str, new_text: str) -> List[Opcode]:
+    """
+    Compute line opcodes, diffing only the sections whose hashes differ.
+
+    Top-level sections are aligned by content hash first; unchanged sections
+    become single 'equal' runs and only the remaining line ranges are
+    compared line by line.
+
+    Args:
+        old_text: Old block text
+        new_text: New block text
+
+    Returns:
+        difflib-style opcodes over the lines of both texts
+    """
+    # Imported here so commands that only parse documents skip loading difflib
+    import difflib
+
+    old_tree, old_block = single_block_tree(old_text)
+    new_tree, new_block = single_block_tree(new_text)
+    old_units = old_tree.units(old_block)
+    new_units = new_tree.units(new_block)
+    old_lines = [line.rstrip("\r\n") for line in old_tree.lines]
+    new_lines = [line.rstrip("\r\n") for line in new_tree.lines]
+
+    def line_at(units: List[Tuple[int, int, str]], i: int, total: int) -> int:
+        return units[i][0] if i < len(units) else total
+
+    opcodes: List[Opcode] = []
+    matcher = difflib.SequenceMatcher(
+        None,
+        [digest for _, _, digest in old_units],
+        [digest for _, _, digest in new_units],
+        autojunk=False,
+    )
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        a1 = line_at(old_units, i1, len(old_lines))
+        a2 = line_at(old_units, i2, len(old_lines))
+        b1 = line_at(new_units, j1, len(new_lines))
+        b2 = line_at(new_units, j2, len(new_lines))
+        if tag == "equal":
+            chunk = [("equal", a1, a2, b1, b2)]
+        else:
+            chunk = [
+                (op, a1 + k1, a1 + k2, b1 + l1, b1 + l2)
+                for op, k1, k2, l1, l2 in difflib.SequenceMatcher(
+                    None, old_lines[a1:a2], new_lines[b1:b2]
+                ).get_opcodes()
+            ]
+        for opcode in chunk:
+            previous = opcodes[-1] if opcodes else None
+            if previous and previous[0] == opcode[0] == "equal":
+                opcodes[-1] = ("equal", previous[1], opcode[2], previous[3], opcode[4])
+            else:
+                opcodes.append(opcode)
+    return opcodes
+
+
+def changed_sections(old_text: str, new_text: str) -> List[str]:
+    """
+    List the headings of sections whose content differs between two blocks.
+
+    Args:
+        old_text: Old block text
+        new_text: New block text
+
+    Returns:
+        Titles of changed, added or removed sections in document order
+    """
+    old_tree, old_block = single_block_tree(old_text)
+    new_tree, new_block = single_block_tree(new_text)
+    old_sections = {
+        section.title: old_tree.digest(section)
+        for section in old_tree.sections(old_block)
+    }
+    changed = []
+    for section in new_tree.sections(new_block):
+        if old_sections.pop(section.title, None) != new_tree.digest(section):
+            changed.append(section.title)
+    changed.extend(old_sections)
+    return changed
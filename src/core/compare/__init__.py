@@ -1,9 +1,23 @@
 """Core functionality for comparing clinerules files."""
 
-from .block_comparer import BlockComparer
-from .diff_formatter import DiffFormatter
+import importlib
 
-__all__ = [
-    'BlockComparer',
-    'DiffFormatter',
-]
+# Exports are resolved on first access so importing one submodule does not
+# pull in its siblings.
+_EXPORTS = {
+    'BlockComparer': '.block_comparer',
+    'DiffFormatter': '.diff_formatter',
+    'BatchComparer': '.batch_comparer',
+    'DriftReporter': '.drift_reporter',
+    'AsyncComparePipeline': '.async_pipeline',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    """Import exported names lazily."""
+    if name in _EXPORTS:
+        module = importlib.import_module(_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
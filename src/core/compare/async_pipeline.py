@@ -0,0 +1,189 @@
+"""Asyncio pipeline streaming many external files through block comparison."""
+
+import asyncio
+from typing import AsyncIterator, Callable, Dict, List, Optional
+from src.utils.logging_config import setup_logger
+from src.core.file_manager import FileManager
+from src.core.block_index import BlockIndex
+from src.core.compare.block_comparer import BlockComparer, LocalBlockText
+
+logger = setup_logger(__name__)
+
+DEFAULT_CONCURRENCY = 32
+
+
+class LoadedDocument:
+    """External file content with its block index."""
+
+    def __init__(self, path: str, content: Optional[str]):
+        """
+        Initialize LoadedDocument.
+
+        Args:
+            path: Path of the file
+            content: File content or None if it could not be read
+        """
+        self.path = path
+        self.content = content
+        self.index = BlockIndex(content) if content is not None else None
+
+
+class AsyncComparePipeline:
+    """
+    Reads external files concurrently and compares them as they arrive.
+
+    Blocking reads run in worker threads, bounded by a semaphore, so slow
+    (e.g. network-mounted) files overlap instead of queueing. Each document
+    is compared as soon as it is loaded and results are emitted in
+    completion order.
+    """
+
+    def __init__(
+        self,
+        block_comparer: Optional[BlockComparer] = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ):
+        """
+        Initialize AsyncComparePipeline.
+
+        Args:
+            block_comparer: Comparer used for every document (defaults to a new one)
+            concurrency: Maximum number of files read at the same time
+        """
+        self.block_comparer = block_comparer or BlockComparer()
+        self.concurrency = max(1, concurrency)
+
+    @staticmethod
+    def load_document(path: str) -> LoadedDocument:
+        """
+        Read and index a file (runs in a worker thread).
+
+        Args:
+            path: Path of the file
+
+        Returns:
+            Loaded document
+        """
+        return LoadedDocument(path, FileManager.read_file(path))
+
+    async def read_documents(self, paths: List[str]) -> AsyncIterator[LoadedDocument]:
+        """
+        Load files concurrently, yielding each one as soon as it is read.
+
+        Args:
+            paths: Paths of the files to read
+
+        Yields:
+            Loaded documents in completion order
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def load(path: str) -> LoadedDocument:
+            async with semaphore:
+                return await asyncio.to_thread(self.load_document, path)
+
+        tasks = [asyncio.ensure_future(load(path)) for path in paths]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def compare_document(
+        self, document: LoadedDocument, local_blocks: List[LocalBlockText]
+    ) -> List[Dict[str, str]]:
+        """
+        Compare one loaded document against all local blocks.
+
+        Args:
+            document: Loaded external document
+            local_blocks: Local blocks to compare against
+
+        Returns:
+            Result rows, one per local block
+        """
+        results = []
+        for local_block in local_blocks:
+            if document.content is None:
+                status = "error"
+            else:
+                status = self.block_comparer.compare_block(
+                    document.path, document.content, local_block, document.index
+                )
+            results.append(
+                {
+                    "external_file": document.path,
+                    "local_file": local_block[0],
+                    "block_type": local_block[1],
+                    "status": status,
+                }
+            )
+        return results
+
+    async def compare_stream(
+        self, external_files: List[str], local_blocks: List[LocalBlockText]
+    ) -> AsyncIterator[Dict[str, str]]:
+        """
+        Stream comparison results as external files finish loading.
+
+        Args:
+            external_files: Paths to external rules files
+            local_blocks: Local blocks to compare against
+
+        Yields:
+            Result rows in completion order
+        """
+        async for document in self.read_documents(external_files):
+            for row in self.compare_document(document, local_blocks):
+                yield row
+
+    async def _collect(
+        self,
+        external_files: List[str],
+        local_blocks: List[LocalBlockText],
+        on_result: Optional[Callable[[Dict[str, str]], None]],
+    ) -> List[Dict[str, str]]:
+        """
+        Drain the comparison stream.
+
+        Args:
+            external_files: Paths to external rules files
+            local_blocks: Local blocks to compare against
+            on_result: Called with every row as soon as it is available
+
+        Returns:
+            All result rows
+        """
+        # Size the thread pool to the semaphore so every permit gets a thread
+        from concurrent.futures import ThreadPoolExecutor
+
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(max_workers=self.concurrency)
+        loop.set_default_executor(executor)
+
+        results = []
+        async for row in self.compare_stream(external_files, local_blocks):
+            if on_result is not None:
+                on_result(row)
+            results.append(row)
+        return results
+
+    def run(
+        self,
+        external_files: List[str],
+        local_blocks: List[LocalBlockText],
+        on_result: Optional[Callable[[Dict[str, str]], None]] = None,
+    ) -> List[Dict[str, str]]:
+        """
+        Compare all external files, calling on_result as results complete.
+
+        Args:
+            external_files: Paths to external rules files
+            local_blocks: Local blocks to compare against
+            on_result: Called with every row as soon as it is available
+
+        Returns:
+            All result rows in completion order
+        """
+        return asyncio.run(self._collect(external_files, local_blocks, on_result))
@@ -0,0 +1,453 @@
+"""Batch comparison of many external clinerules files against local blocks."""
+
+import csv
+import io
+import json
+import os
+from itertools import repeat
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional, Tuple
+from src.utils.logging_config import setup_logger
+from src.core.file_manager import FileManager
+from src.core.block_extractor import BlockExtractor
+from src.core.compare.block_comparer import missing_status
+from src.core.hash_cache import HashCache, HashedDocument, hash_text
+from src.core.rules.file_selector import FileSelector
+
+if TYPE_CHECKING:
+    from src.core.block_store import BlockStore
+
+logger = setup_logger(__name__)
+
+EXTERNAL_FILENAME = ".clinerules"
+SKIPPED_DIRECTORIES = {".git", "node_modules", "venv", ".venv", "__pycache__"}
+REPORT_FIELDS = ["external_file", "local_file", "block_type", "status"]
+
+# (local_file, block_type, block_digest)
+LocalBlock = Tuple[str, str, str]
+
+# Hash cache of the current worker process, opened on first use
+_worker_cache: Optional[HashCache] = None
+
+# Block store of the current worker process, opened on first use
+_worker_store: Optional["BlockStore"] = None
+
+
+def _load_document(external_file: str, use_cache: bool) -> Optional[HashedDocument]:
+    """
+    Get the hashed block index of an external file.
+
+    Args:
+        external_file: Path to external rules file
+        use_cache: Whether to consult the persistent hash cache
+
+    Returns:
+        HashedDocument or None if the file cannot be read
+    """
+    global _worker_cache
+    if use_cache:
+        if _worker_cache is None:
+            _worker_cache = HashCache()
+        return _worker_cache.get_document(external_file)
+
+    content = FileManager.read_file(external_file)
+    if content is None:
+        return None
+    return HashedDocument.from_content(content)
+
+
+def _record_versions(external_file: str, document: HashedDocument) -> None:
+    """
+    Record the blocks of an external file in the block store.
+
+    Hash cache hits carry no content, so the file is only read again when
+    one of its blocks is not yet the latest version recorded for it.
+
+    Args:
+        external_file: Path to external rules file
+        document: Hashed block index of the file
+    """
+    global _worker_store
+    if _worker_store is None:
+        # Imported here so --no-history audits never load the store
+        from src.core.block_store import BlockStore
+
+        _worker_store = BlockStore()
+
+    if all(
+        _worker_store.is_current(
+            entry.marker, external_file, document.block_digest(entry)
+        )
+        for entry in document.index.entries
+    ):
+        return
+
+    content = document.index.content or FileManager.read_file(external_file)
+    if content is not None:
+        _worker_store.record_content(content, external_file, "audit")
+
+
+def close_cache() -> None:
+    """Evict stale entries and close the hash cache of this process."""
+    global _worker_cache
+    cache = _worker_cache or HashCache()
+    _worker_cache = None
+    cache.close()
+
+
+def compare_external_file(
+    external_file: str,
+    local_blocks: List[LocalBlock],
+    use_cache: bool = True,
+    use_history: bool = False,
+) -> List[Dict[str, str]]:
+    """
+    Compare one external file against all local blocks by block digest.
+
+    Defined at module level so it can be dispatched to worker processes.
+
+    Args:
+        external_file: Path to external rules file
+        local_blocks: Local blocks to compare against
+        use_cache: Whether to consult the persistent hash cache
+        use_history: Whether to record the blocks of the file in the block store
+
+    Returns:
+        List of result rows, one per local block
+    """
+    document = _load_document(external_file, use_cache)
+    if use_history and document is not None:
+        _record_versions(external_file, document)
+    results = []
+    for local_file, block_type, local_digest in local_blocks:
+        if document is None:
+            status = "error"
+        else:
+            # Missing blocks are reported as such instead of logged
+            entry = BlockExtractor.find_block(
+                document.index, block_type, local_file, warn_missing=False
+            )
+            if entry is None:
+                status = missing_status(block_type)
+            elif document.block_digest(entry) == local_digest:
+                status = "identical"
+            else:
+                status = "different"
+        results.append(
+            {
+                "external_file": external_file,
+                "local_file": local_file,
+                "block_type": block_type,
+                "status": status,
+            }
+        )
+    return results
+
+
+class BatchComparer:
+    """Compares many external clinerules files against every local block."""
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        use_cache: bool = True,
+        use_history: bool = True,
+    ):
+        """
+        Initialize BatchComparer with required components.
+
+        Args:
+            workers: Number of worker processes (defaults to CPU count)
+            use_cache: Whether to use the persistent hash cache
+            use_history: Whether to record external block versions
+        """
+        self.use_cache = use_cache
+        self.use_history = use_history
+        self.file_manager = FileManager()
+        self.block_extractor = BlockExtractor()
+        self.file_selector = FileSelector()
+        self.workers = workers or os.cpu_count() or 1
+
+    def discover_external_files(
+        self, root_dirs: Iterable[str], file_list: Optional[str] = None
+    ) -> List[str]:
+        """
+        Find external clinerules files below root directories and in a file list.
+
+        Args:
+            root_dirs: Directories to search recursively
+            file_list: Optional path to a text file with one path per line
+
+        Returns:
+            Sorted list of unique external file paths
+        """
+        found = set()
+        for root_dir in root_dirs:
+            for dirpath, dirnames, filenames in os.walk(root_dir):
+                dirnames[:] = [d for d in dirnames if d not in SKIPPED_DIRECTORIES]
+                if EXTERNAL_FILENAME in filenames:
+                    found.add(
+                        os.path.normpath(os.path.join(dirpath, EXTERNAL_FILENAME))
+                    )
+
+        if file_list:
+            content = self.file_manager.read_file(file_list)
+            if content is not None:
+                for line in content.splitlines():
+                    path = line.strip()
+                    if path:
+                        found.add(os.path.normpath(path))
+
+        return sorted(found)
+
+    def load_local_blocks(self) -> List[LocalBlock]:
+        """
+        Read every local rule file and hash its block.
+
+        Returns:
+            List of (local_file, block_type, block_digest) tuples
+        """
+        local_blocks = []
+        for files in self.file_selector.get_files_by_category():
+            for local_file in files:
+                block_type = self.block_extractor.determine_block_type(local_file)
+                if not block_type:
+                    continue
+
+                content = self.file_manager.read_file(local_file)
+                if content is None:
+                    continue
+
+                block = self.block_extractor.extract_block(
+                    content, block_type, local_file
+                )
+                if block is not None:
+                    local_blocks.append((local_file, block_type, hash_text(block)))
+        return local_blocks
+
+    def compare_all(
+        self, external_files: List[str], local_blocks: List[LocalBlock]
+    ) -> List[Dict[str, str]]:
+        """
+        Compare all external files against all local blocks.
+
+        Args:
+            external_files: Paths to external rules files
+            local_blocks: Local blocks to compare against
+
+        Returns:
+            List of result rows
+        """
+        results: List[Dict[str, str]] = []
+        if self.workers <= 1 or len(external_files) <= 1:
+            for external_file in external_files:
+                results.extend(
+                    compare_external_file(
+                        external_file, local_blocks, self.use_cache, self.use_history
+                    )
+                )
+            return results
+
+        # Imported here so single-process runs skip loading multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        chunksize = max(1, len(external_files) // (self.workers * 4))
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            for rows in executor.map(
+                compare_external_file,
+                external_files,
+                repeat(local_blocks),
+                repeat(self.use_cache),
+                repeat(self.use_history),
+                chunksize=chunksize,
+            ):
+                results.extend(rows)
+        return results
+
+    @staticmethod
+    def summarize(results: List[Dict[str, str]]) -> Dict[str, int]:
+        """
+        Count results by status.
+
+        Args:
+            results: Result rows
+
+        Returns:
+            Mapping of status to number of occurrences
+        """
+        summary = {
+            "identical": 0,
+            "different": 0,
+            "missing": 0,
+            "absent": 0,
+            "error": 0,
+        }
+        for row in results:
+            summary[row["status"]] = summary.get(row["status"], 0) + 1
+        return summary
+
+    def write_report(
+        self, results: List[Dict[str, str]], report_path: str, report_format: str
+    ) -> bool:
+        """
+        Write results as a JSON or CSV report.
+
+        Args:
+            results: Result rows
+            report_path: Path of the report file
+            report_format: Either 'json' or 'csv'
+
+        Returns:
+            True if report was written successfully, False otherwise
+        """
+        try:
+            report_dir = os.path.dirname(report_path)
+            if report_dir and not self.file_manager.ensure_directory(report_dir):
+                return False
+
+            if report_format == "csv":
+                buffer = io.StringIO(newline="")
+                writer = csv.DictWriter(
+                    buffer, fieldnames=REPORT_FIELDS, lineterminator="\n"
+                )
+                writer.writeheader()
+                writer.writerows(results)
+                return self.file_manager.write_file(report_path, buffer.getvalue())
+
+            report = {"summary": self.summarize(results), "results": results}
+            return self.file_manager.write_file(
+                report_path, json.dumps(report, indent=2)
+            )
+        except Exception as e:
+            logger.error("Error writing report %s: %s", report_path, e)
+            return False
+
+    def run(
+        self,
+        root_dirs: Iterable[str],
+        file_list: Optional[str],
+        report_path: str,
+        report_format: str,
+    ) -> bool:
+        """
+        Discover, compare and report in one run.
+
+        Args:
+            root_dirs: Directories to search recursively
+            file_list: Optional path to a text file with one path per line
+            report_path: Path of the report file
+            report_format: Either 'json' or 'csv'
+
+        Returns:
+            True if the audit completed and the report was written, False otherwise
+        """
+        external_files = self.discover_external_files(root_dirs, file_list)
+        if not external_files:
+            logger.error("No external clinerules files found")
+            return False
+
+        local_blocks = self.load_local_blocks()
+        if not local_blocks:
+            logger.error("No local blocks found")
+            return False
+
+        logger.info(
+            "Comparing %s external files against %s local blocks using %s workers",
+            len(external_files),
+            len(local_blocks),
+            self.workers,
+        )
+        results = self.compare_all(external_files, local_blocks)
+        if self.use_cache:
+            close_cache()
+        return self.finish_report(results, report_path, report_format)
+
+    def run_streaming(
+        self,
+        root_dirs: Iterable[str],
+        file_list: Optional[str],
+        report_path: str,
+        report_format: str,
+        concurrency: int,
+        on_result: Optional[Callable[[Dict[str, str]], None]] = None,
+    ) -> bool:
+        """
+        Discover and compare through the async read pipeline, then report.
+
+        Results are passed to on_result as each external file completes.
+
+        Args:
+            root_dirs: Directories to search recursively
+            file_list: Optional path to a text file with one path per line
+            report_path: Path of the report file
+            report_format: Either 'json' or 'csv'
+            concurrency: Maximum number of files read at the same time
+            on_result: Called with every result row as soon as it is available
+
+        Returns:
+            True if the audit completed and the report was written, False otherwise
+        """
+        # Imported here so process-pool audits skip loading asyncio
+        from src.core.compare.async_pipeline import AsyncComparePipeline
+
+        external_files = self.discover_external_files(root_dirs, file_list)
+        if not external_files:
+            logger.error("No external clinerules files found")
+            return False
+
+        block_comparer = None
+        if self.use_history:
+            # Imported here so --no-history audits never load the store
+            from src.core.block_store import BlockStore
+            from src.core.compare.block_comparer import BlockComparer
+
+            block_comparer = BlockComparer(
+                block_store=BlockStore(), history_event="audit"
+            )
+        pipeline = AsyncComparePipeline(
+            block_comparer=block_comparer, concurrency=concurrency
+        )
+        local_files = [
+            local_file
+            for files in self.file_selector.get_files_by_category()
+            for local_file in files
+        ]
+        local_blocks = pipeline.block_comparer.load_local_blocks(local_files)
+        if not local_blocks:
+            logger.error("No local blocks found")
+            return False
+
+        logger.info(
+            "Streaming %s external files against %s local blocks with %s "
+            "concurrent reads",
+            len(external_files),
+            len(local_blocks),
+            pipeline.concurrency,
+        )
+        results = pipeline.run(external_files, local_blocks, on_result)
+        return self.finish_report(results, report_path, report_format)
+
+    def finish_report(
+        self, results: List[Dict[str, str]], report_path: str, report_format: str
+    ) -> bool:
+        """
+        Write the report and log the summary.
+
+        Args:
+            results: Result rows
+            report_path: Path of the report file
+            report_format: Either 'json' or 'csv'
+
+        Returns:
+            True if the report was written, False otherwise
+        """
+        if not self.write_report(results, report_path, report_format):
+            return False
+
+        summary = self.summarize(results)
+        logger.info(
+            "Identical: %(identical)s, different: %(different)s, "
+            "missing: %(missing)s, absent: %(absent)s, errors: %(error)s",
+            summary,
+        )
+        logger.info("Report written to %s", report_path)
+        return True
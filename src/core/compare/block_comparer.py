@@ -1,21 +1,105 @@
 """Block comparison functionality for clinerules files."""
 
 import os
-from typing import Optional, Tuple
+from typing import TYPE_CHECKING, List, Optional, Tuple
 from src.utils.logging_config import setup_logger
-from src.core.file_manager import FileManager
 from src.core.block_extractor import BlockExtractor
+from src.core.block_index import BlockIndex
+from src.core.document_cache import DocumentCache, get_shared_document_cache
+
+if TYPE_CHECKING:
+    from src.core.block_store import BlockStore
+    from src.core.hash_cache import HashCache
 
 logger = setup_logger(__name__)
 
+# (local_file, block_type, local_block)
+LocalBlockText = Tuple[str, str, str]
+
+# Block types a project only has when it uses them; absent ones are not
+# reported as missing
+OPTIONAL_BLOCK_TYPES = {"LANGUAGE"}
+
+
+def missing_status(block_type: str) -> str:
+    """
+    Get the status of a block that an external file does not contain.
+
+    Args:
+        block_type: Type of the local block
+
+    Returns:
+        'absent' for optional block types, 'missing' otherwise
+    """
+    return "absent" if block_type in OPTIONAL_BLOCK_TYPES else "missing"
+
 
 class BlockComparer:
     """Handles comparison of clinerules blocks."""
 
-    def __init__(self):
-        """Initialize BlockComparer with required components."""
-        self.file_manager = FileManager()
-        self.block_extractor = BlockExtractor()
+    def __init__(
+        self,
+        hash_cache: Optional["HashCache"] = None,
+        block_store: Optional["BlockStore"] = None,
+        document_cache: Optional[DocumentCache] = None,
+        block_extractor: Optional[BlockExtractor] = None,
+        history_event: str = "compare",
+    ):
+        """
+        Initialize BlockComparer with required components.
+
+        Args:
+            hash_cache: Optional content-hash cache used to skip unchanged files
+            block_store: Optional store recording every extracted block version
+            document_cache: Parsed-document cache (defaults to the shared one)
+            block_extractor: Block extractor (defaults to a new one)
+            history_event: Event name block versions are recorded under
+        """
+        self.block_extractor = block_extractor or BlockExtractor()
+        self.document_cache = document_cache or get_shared_document_cache()
+        self.hash_cache = hash_cache
+        self.block_store = block_store
+        self.history_event = history_event
+
+    def compare_hashes(self, external_file: str, local_file: str) -> Optional[bool]:
+        """
+        Compare blocks by their cached digests without extracting them.
+
+        Uncached files above the memory-mapping threshold are not read here, so
+        the caller extracts their blocks through the memory map instead.
+
+        Args:
+            external_file: Path to external rules file
+            local_file: Path to local rules file
+
+        Returns:
+            True/False if both block digests are known, None otherwise
+        """
+        if self.hash_cache is None:
+            return None
+
+        block_type = self.block_extractor.determine_block_type(local_file)
+        if not block_type:
+            return None
+
+        max_read_size = self.block_extractor.MMAP_THRESHOLD
+        external_document = self.hash_cache.get_document(external_file, max_read_size)
+        local_document = self.hash_cache.get_document(local_file, max_read_size)
+        if external_document is None or local_document is None:
+            return None
+
+        external_entry = self.block_extractor.find_block(
+            external_document.index, block_type, local_file
+        )
+        local_entry = self.block_extractor.find_block(
+            local_document.index, block_type, local_file
+        )
+        if external_entry is None or local_entry is None:
+            return None
+
+        return external_document.block_digest(
+            external_entry
+        ) == local_document.block_digest(local_entry)
 
     def extract_blocks(
         self, external_file: str, local_file: str
@@ -31,38 +115,110 @@ class BlockComparer:
             Tuple of (external_block, local_block, block_type) or None if extraction fails
         """
         try:
-            # Read file contents
-            external_content = self.file_manager.read_file(external_file)
-            local_content = self.file_manager.read_file(local_file)
-
-            if external_content is None or local_content is None:
+            # Read local file contents
+            local_document = self.document_cache.get(local_file)
+            if local_document is None:
                 logger.error("Error reading files")
                 return None
 
             # Determine block type
             block_type = self.block_extractor.determine_block_type(local_file)
             if not block_type:
-                logger.error(f"Could not determine block type from path: {local_file}")
+                logger.error("Could not determine block type from path: %s", local_file)
                 return None
 
-            # Extract blocks
-            external_block = self.block_extractor.extract_block(
-                external_content, block_type, local_file
+            # Extract blocks (large external files are memory-mapped)
+            external_block = self.block_extractor.extract_block_from_path(
+                external_file, block_type, local_file, self.document_cache
             )
             local_block = self.block_extractor.extract_block(
-                local_content, block_type, local_file
+                local_document.content, block_type, local_file, local_document.index
             )
 
             if external_block is None or local_block is None:
                 logger.error("Could not extract blocks for comparison")
                 return None
 
+            if self.block_store is not None:
+                self.block_store.record_block(
+                    external_block, external_file, self.history_event
+                )
+                self.block_store.record_block(
+                    local_block, local_file, self.history_event
+                )
+
             return external_block, local_block, block_type
 
         except Exception as e:
-            logger.error(f"Error extracting blocks: {e}")
+            logger.error("Error extracting blocks: %s", e)
             return None
 
+    def load_local_blocks(self, local_files: List[str]) -> List[LocalBlockText]:
+        """
+        Read and extract the blocks of local rule files once.
+
+        Args:
+            local_files: Paths to local rule files
+
+        Returns:
+            List of (local_file, block_type, local_block) for files with a block
+        """
+        local_blocks = []
+        for local_file in local_files:
+            block_type = self.block_extractor.determine_block_type(local_file)
+            if not block_type:
+                continue
+
+            local_document = self.document_cache.get(local_file)
+            if local_document is None:
+                continue
+
+            local_block = self.block_extractor.extract_block(
+                local_document.content, block_type, local_file, local_document.index
+            )
+            if local_block is not None:
+                local_blocks.append((local_file, block_type, local_block))
+        return local_blocks
+
+    def compare_block(
+        self,
+        external_file: str,
+        external_content: str,
+        local_block: LocalBlockText,
+        index: Optional[BlockIndex] = None,
+    ) -> str:
+        """
+        Compare one local block against already loaded external content.
+
+        Args:
+            external_file: Path of the external file (for the block store)
+            external_content: Content of the external file
+            local_block: (local_file, block_type, local_block) to compare
+            index: Prebuilt index of external_content
+
+        Returns:
+            'identical', 'different', 'missing', or 'absent' for a language
+            block the external file does not have
+        """
+        local_file, block_type, local_text = local_block
+        if index is None:
+            index = BlockIndex(external_content)
+        # Missing blocks are reported as such instead of logged
+        entry = self.block_extractor.find_block(
+            index, block_type, local_file, warn_missing=False
+        )
+        if entry is None:
+            return missing_status(block_type)
+        external_block = index.block_text(entry)
+
+        if self.block_store is not None:
+            self.block_store.record_block(
+                external_block, external_file, self.history_event
+            )
+        if self.are_blocks_identical(external_block, local_text):
+            return "identical"
+        return "different"
+
     def are_blocks_identical(self, external_block: str, local_block: str) -> bool:
         """
         Check if blocks are identical.
@@ -88,11 +244,11 @@ class BlockComparer:
             True if both files exist, False otherwise
         """
         if not os.path.exists(external_file):
-            logger.error(f"External file not found: {external_file}")
+            logger.error("External file not found: %s", external_file)
             return False
 
         if not os.path.exists(local_file):
-            logger.error(f"Local file not found: {local_file}")
+            logger.error("Local file not found: %s", local_file)
             return False
 
         return True
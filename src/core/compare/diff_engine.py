@@ -0,0 +1,291 @@
+"""In-process line and word diff rendering for clinerules blocks."""
+
+import difflib
+import json
+import re
+import shutil
+from typing import Dict, List, Optional, Tuple
+from src.core.block_tree import section_opcodes
+
+RED = "\033[31m"
+GREEN = "\033[32m"
+CYAN = "\033[36m"
+BOLD = "\033[1m"
+REVERSE = "\033[7m"
+RESET = "\033[0m"
+
+WORD_PATTERN = re.compile(r"\s+|\w+|[^\w\s]")
+
+
+class PresetMatcher(difflib.SequenceMatcher):
+    """SequenceMatcher replaying precomputed opcodes (used for hunk grouping)."""
+
+    def __init__(self, opcodes: List[Tuple[str, int, int, int, int]]):
+        """
+        Initialize PresetMatcher.
+
+        Args:
+            opcodes: difflib-style opcodes covering both sequences
+        """
+        super().__init__(None, [], [])
+        self.opcodes = opcodes
+
+
+class DiffEngine:
+    """Computes line/word diffs between two blocks without external tools."""
+
+    def __init__(self, context_lines: int = 3, color: bool = True):
+        """
+        Initialize DiffEngine.
+
+        Args:
+            context_lines: Number of unchanged lines shown around each change
+            color: Whether to emit ANSI colors
+        """
+        self.context_lines = context_lines
+        self.color = color
+
+    def _paint(self, text: str, *codes: str) -> str:
+        """
+        Wrap text in ANSI codes if colors are enabled.
+
+        Args:
+            text: Text to color
+            codes: ANSI escape codes to apply
+
+        Returns:
+            Colored or unchanged text
+        """
+        if not self.color or not codes:
+            return text
+        return "".join(codes) + text + RESET
+
+    def grouped_opcodes(
+        self, external_lines: List[str], local_lines: List[str]
+    ) -> List[List[Tuple[str, int, int, int, int]]]:
+        """
+        Compute line-level change hunks.
+
+        Sections whose hashes match on both sides are skipped as a whole, so
+        only the changed sections are diffed line by line.
+
+        Args:
+            external_lines: Lines of the external block
+            local_lines: Lines of the local block
+
+        Returns:
+            List of hunks, each a list of difflib opcodes
+        """
+        opcodes = section_opcodes("\n".join(external_lines), "\n".join(local_lines))
+        return list(PresetMatcher(opcodes).get_grouped_opcodes(self.context_lines))
+
+    def word_diff(self, external_line: str, local_line: str) -> Tuple[str, str]:
+        """
+        Highlight changed words within a pair of lines.
+
+        Args:
+            external_line: Line from the external block
+            local_line: Corresponding line from the local block
+
+        Returns:
+            Tuple of (rendered_external_line, rendered_local_line)
+        """
+        old_words = WORD_PATTERN.findall(external_line)
+        new_words = WORD_PATTERN.findall(local_line)
+        matcher = difflib.SequenceMatcher(None, old_words, new_words, autojunk=False)
+
+        old_parts: List[str] = []
+        new_parts: List[str] = []
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            old_text = "".join(old_words[i1:i2])
+            new_text = "".join(new_words[j1:j2])
+            if tag == "equal":
+                old_parts.append(self._paint(old_text, RED))
+                new_parts.append(self._paint(new_text, GREEN))
+            else:
+                if old_text:
+                    old_parts.append(self._paint(old_text, RED, REVERSE))
+                if new_text:
+                    new_parts.append(self._paint(new_text, GREEN, REVERSE))
+        return "".join(old_parts), "".join(new_parts)
+
+    def render_unified(
+        self,
+        external_block: str,
+        local_block: str,
+        block_type: str,
+        labels: Optional[Tuple[str, str]] = None,
+    ) -> str:
+        """
+        Render a unified diff with word-level highlighting.
+
+        Args:
+            external_block: Content from external file
+            local_block: Content from local file
+            block_type: Type of block being compared
+            labels: Header names of both sides (defaults to external/local)
+
+        Returns:
+            Rendered diff text (empty if blocks are identical)
+        """
+        external_lines = external_block.splitlines()
+        local_lines = local_block.splitlines()
+        hunks = self.grouped_opcodes(external_lines, local_lines)
+        if not hunks:
+            return ""
+
+        old_label, new_label = labels or (
+            f"external/{block_type.lower()}",
+            f"local/{block_type.lower()}",
+        )
+        output = [
+            self._paint(f"--- {old_label}", BOLD),
+            self._paint(f"+++ {new_label}", BOLD),
+        ]
+        for hunk in hunks:
+            first, last = hunk[0], hunk[-1]
+            output.append(
+                self._paint(
+                    f"@@ -{first[1] + 1},{last[2] - first[1]} "
+                    f"+{first[3] + 1},{last[4] - first[3]} @@",
+                    CYAN,
+                )
+            )
+            for tag, i1, i2, j1, j2 in hunk:
+                if tag == "equal":
+                    output.extend(f" {line}" for line in external_lines[i1:i2])
+                    continue
+
+                old_lines = external_lines[i1:i2]
+                new_lines = local_lines[j1:j2]
+                if tag == "replace" and self.color:
+                    pairs = min(len(old_lines), len(new_lines))
+                    rendered = [
+                        self.word_diff(old_lines[k], new_lines[k]) for k in range(pairs)
+                    ]
+                    old_rendered = [old for old, _ in rendered] + [
+                        self._paint(line, RED) for line in old_lines[pairs:]
+                    ]
+                    new_rendered = [new for _, new in rendered] + [
+                        self._paint(line, GREEN) for line in new_lines[pairs:]
+                    ]
+                else:
+                    old_rendered = [self._paint(line, RED) for line in old_lines]
+                    new_rendered = [self._paint(line, GREEN) for line in new_lines]
+
+                output.extend(self._paint("-", RED) + line for line in old_rendered)
+                output.extend(self._paint("+", GREEN) + line for line in new_rendered)
+        return "\n".join(output)
+
+    def render_side_by_side(
+        self, external_block: str, local_block: str, block_type: str
+    ) -> str:
+        """
+        Render changed hunks as two columns (external left, local right).
+
+        Args:
+            external_block: Content from external file
+            local_block: Content from local file
+            block_type: Type of block being compared
+
+        Returns:
+            Rendered diff text (empty if blocks are identical)
+        """
+        external_lines = external_block.splitlines()
+        local_lines = local_block.splitlines()
+        hunks = self.grouped_opcodes(external_lines, local_lines)
+        if not hunks:
+            return ""
+
+        width = max(20, (shutil.get_terminal_size().columns - 3) // 2)
+
+        def cell(text: str) -> str:
+            text = text.expandtabs(4)
+            return text[:width].ljust(width)
+
+        output = [
+            self._paint(cell(f"external/{block_type.lower()}"), BOLD)
+            + "   "
+            + self._paint(f"local/{block_type.lower()}", BOLD)
+        ]
+        for number, hunk in enumerate(hunks):
+            if number:
+                output.append(self._paint("...".ljust(width) + "   ...", CYAN))
+            for tag, i1, i2, j1, j2 in hunk:
+                old_lines = external_lines[i1:i2]
+                new_lines = local_lines[j1:j2]
+                for k in range(max(len(old_lines), len(new_lines))):
+                    old = old_lines[k] if k < len(old_lines) else ""
+                    new = new_lines[k] if k < len(new_lines) else ""
+                    if tag == "equal":
+                        output.append(f"{cell(old)}   {new}")
+                    elif k >= len(new_lines):
+                        output.append(self._paint(cell(old), RED) + " < ")
+                    elif k >= len(old_lines):
+                        output.append(cell("") + " > " + self._paint(new, GREEN))
+                    else:
+                        output.append(
+                            self._paint(cell(old), RED)
+                            + " | "
+                            + self._paint(new, GREEN)
+                        )
+        return "\n".join(output)
+
+    def to_dict(self, external_block: str, local_block: str, block_type: str) -> Dict:
+        """
+        Describe the diff as plain data.
+
+        Args:
+            external_block: Content from external file
+            local_block: Content from local file
+            block_type: Type of block being compared
+
+        Returns:
+            Dictionary with block type, identity flag and hunks
+        """
+        external_lines = external_block.splitlines()
+        local_lines = local_block.splitlines()
+        hunks = []
+        for hunk in self.grouped_opcodes(external_lines, local_lines):
+            first, last = hunk[0], hunk[-1]
+            lines = []
+            for tag, i1, i2, j1, j2 in hunk:
+                if tag == "equal":
+                    lines.extend(
+                        {"op": "equal", "text": line} for line in external_lines[i1:i2]
+                    )
+                    continue
+                lines.extend(
+                    {"op": "delete", "text": line} for line in external_lines[i1:i2]
+                )
+                lines.extend(
+                    {"op": "insert", "text": line} for line in local_lines[j1:j2]
+                )
+            hunks.append(
+                {
+                    "external_start": first[1] + 1,
+                    "external_lines": last[2] - first[1],
+                    "local_start": first[3] + 1,
+                    "local_lines": last[4] - first[3],
+                    "lines": lines,
+                }
+            )
+        return {"block_type": block_type, "identical": not hunks, "hunks": hunks}
+
+    def render_json(
+        self, external_block: str, local_block: str, block_type: str
+    ) -> str:
+        """
+        Render the diff as JSON.
+
+        Args:
+            external_block: Content from external file
+            local_block: Content from local file
+            block_type: Type of block being compared
+
+        Returns:
+            JSON document describing the diff
+        """
+        return json.dumps(
+            self.to_dict(external_block, local_block, block_type), indent=2
+        )
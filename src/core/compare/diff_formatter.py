@@ -1,11 +1,8 @@
 """Diff formatting functionality for clinerules files."""
 
 import os
-import tempfile
-import subprocess
-from typing import Optional, Tuple
+import sys
 from src.utils.logging_config import setup_logger
-from src.core.diff_handler import DiffHandler
 
 logger = setup_logger(__name__)
 
@@ -13,87 +10,94 @@ logger = setup_logger(__name__)
 class DiffFormatter:
     """Handles formatting and display of file differences."""
 
+    BUILTIN_VIEWS = ("unified", "side-by-side", "json")
+    EXTERNAL_VIEWS = ("git", "vscode")
+    VIEWS = BUILTIN_VIEWS + EXTERNAL_VIEWS
+
     def __init__(self):
         """Initialize DiffFormatter with required components."""
-        self.diff_handler = DiffHandler()
-
-    def create_temp_files(
-        self, external_block: str, local_block: str, block_type: str
-    ) -> Tuple[str, str]:
+        self._diff_engine = None
+        self._diff_handler = None
+
+    @property
+    def diff_engine(self):
+        """Built-in diff engine, created on first use."""
+        if self._diff_engine is None:
+            # Imported here so identical blocks never load difflib
+            from src.core.compare.diff_engine import DiffEngine
+
+            self._diff_engine = DiffEngine(color=sys.stdout.isatty())
+        return self._diff_engine
+
+    @property
+    def diff_handler(self):
+        """External diff tool handler, created on first use."""
+        if self._diff_handler is None:
+            # Imported here so built-in views never load subprocess
+            from src.core.diff_handler import DiffHandler
+
+            self._diff_handler = DiffHandler()
+        return self._diff_handler
+
+    def render_diff(
+        self, external_block: str, local_block: str, block_type: str, view: str
+    ) -> str:
         """
-        Create temporary files for diff comparison.
+        Render differences between blocks with the built-in diff engine.
 
         Args:
             external_block: Content from external file
             local_block: Content from local file
             block_type: Type of block being compared
+            view: One of 'unified', 'side-by-side' or 'json'
 
         Returns:
-            Tuple of (external_temp_path, local_temp_path)
-        """
-        # Create temp files with meaningful names
-        ext_fd, ext_path = tempfile.mkstemp(prefix=f"external_{block_type}_", suffix=".md")
-        loc_fd, loc_path = tempfile.mkstemp(prefix=f"local_{block_type}_", suffix=".md")
-
-        try:
-            with os.fdopen(ext_fd, 'w') as ext_file:
-                ext_file.write(external_block)
-            with os.fdopen(loc_fd, 'w') as loc_file:
-                loc_file.write(local_block)
-        except Exception as e:
-            logger.error(f"Error writing temp files: {e}")
-            os.unlink(ext_path)
-            os.unlink(loc_path)
-            raise
-
-        return ext_path, loc_path
-
-    def cleanup_temp_files(self, *file_paths: str) -> None:
+            Rendered diff text
         """
-        Clean up temporary files.
-
-        Args:
-            file_paths: Paths to files to delete
-        """
-        for path in file_paths:
-            try:
-                os.unlink(path)
-            except Exception as e:
-                logger.error(f"Error deleting temp file {path}: {e}")
+        if view == "side-by-side":
+            return self.diff_engine.render_side_by_side(
+                external_block, local_block, block_type
+            )
+        if view == "json":
+            return self.diff_engine.render_json(
+                external_block, local_block, block_type
+            )
+        return self.diff_engine.render_unified(external_block, local_block, block_type)
 
     def show_diff(
-        self, external_block: str, local_block: str, block_type: str, use_git_diff: bool
+        self,
+        external_block: str,
+        local_block: str,
+        block_type: str,
+        view: str = "unified",
     ) -> bool:
         """
-        Show differences between blocks using selected diff tool.
+        Show differences between blocks using the selected view.
+
+        Built-in views are rendered in-process; 'git' and 'vscode' hand the
+        blocks to the corresponding external viewer.
 
         Args:
             external_block: Content from external file
             local_block: Content from local file
             block_type: Type of block being compared
-            use_git_diff: Whether to use git diff instead of VS Code
+            view: One of 'unified', 'side-by-side', 'json', 'git' or 'vscode'
 
         Returns:
             True if diff was displayed successfully, False otherwise
         """
         try:
-            # Create temp files
-            ext_path, loc_path = self.create_temp_files(
-                external_block, local_block, block_type
-            )
+            if view in self.BUILTIN_VIEWS:
+                print(self.render_diff(external_block, local_block, block_type, view))
+                return True
 
             # Show diff using selected tool
-            success = self.diff_handler.compare_with_diff_tool(
-                external_block, local_block, block_type, use_git_diff
+            return self.diff_handler.compare_with_diff_tool(
+                external_block, local_block, block_type, view == "git"
             )
 
-            # Cleanup
-            self.cleanup_temp_files(ext_path, loc_path)
-
-            return success
-
         except Exception as e:
-            logger.error(f"Error showing diff: {e}")
+            logger.error("Error showing diff: %s", e)
             return False
 
     def format_block_info(self, block_type: str, file_path: str) -> str:
@@ -112,3 +116,21 @@ class DiffFormatter:
             f"File: {os.path.basename(file_path)}\n"
             f"Path: {file_path}\n"
         )
+
+    def format_changed_sections(self, external_block: str, local_block: str) -> str:
+        """
+        Format the headings of the sections that differ between blocks.
+
+        Args:
+            external_block: Content from external file
+            local_block: Content from local file
+
+        Returns:
+            Formatted section list (empty if no section heading changed)
+        """
+        from src.core.block_tree import changed_sections
+
+        sections = changed_sections(external_block, local_block)
+        if not sections:
+            return ""
+        return "Changed sections: " + ", ".join(sections) + "\n"
@@ -0,0 +1,456 @@
+"""Fleet drift report grouping external blocks by normalized fingerprint."""
+
+import json
+import os
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+from src.utils.logging_config import setup_logger
+from src.core.file_manager import FileManager
+from src.core.block_extractor import BlockExtractor
+from src.core.block_index import BlockIndex
+from src.core.hash_cache import hash_text
+from src.core.markers import canonical_marker, is_marker
+from src.core.compare.batch_comparer import BatchComparer
+from src.core.compare.diff_engine import DiffEngine
+from src.core.rules.catalog import RuleCatalog, get_shared_catalog
+
+logger = setup_logger(__name__)
+
+BLANK_LINES_PATTERN = re.compile(r"\n{3,}")
+
+VARIANT_LABELS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+# (block_type, name) identifying a block across files
+BlockKey = Tuple[str, str]
+
+# (block_type, name, fingerprint) of one block in an external file
+BlockPrint = Tuple[str, str, str]
+
+
+def normalize_block(text: str) -> str:
+    """
+    Normalize a block so formatting-only differences do not count as drift.
+
+    Line endings are unified, trailing whitespace is dropped, marker lines
+    are rewritten in their normalized form and runs of blank lines are
+    collapsed.
+
+    Args:
+        text: Block text
+
+    Returns:
+        Normalized block text
+    """
+    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    text = "\n".join(
+        canonical_marker(line) if is_marker(line) else line.rstrip()
+        for line in text.split("\n")
+    )
+    return BLANK_LINES_PATTERN.sub("\n\n", text).strip()
+
+
+def fingerprint_block(text: str) -> str:
+    """
+    Compute the normalized SHA-256 fingerprint of a block.
+
+    Args:
+        text: Block text
+
+    Returns:
+        Hex digest of the normalized block
+    """
+    return hash_text(normalize_block(text))
+
+
+def fingerprint_external_file(external_file: str) -> Optional[List[BlockPrint]]:
+    """
+    Fingerprint every block of an external file.
+
+    Defined at module level so it can be dispatched to worker processes.
+
+    Args:
+        external_file: Path to external rules file
+
+    Returns:
+        List of (block_type, name, fingerprint) or None if the file cannot be read
+    """
+    content = FileManager.read_file(external_file)
+    if content is None:
+        return None
+
+    index = BlockIndex(content)
+    prints = []
+    seen = set()
+    for entry in index.entries:
+        key = (entry.block_type, entry.name)
+        # Lookups use the first block with a marker, so later duplicates are ignored
+        if key in seen:
+            continue
+        seen.add(key)
+        prints.append(
+            (entry.block_type, entry.name, fingerprint_block(index.block_text(entry)))
+        )
+    return prints
+
+
+class BlockVariant:
+    """One distinct version of a block and the files that contain it."""
+
+    def __init__(self, fingerprint: str, canonical: bool):
+        """
+        Initialize BlockVariant.
+
+        Args:
+            fingerprint: Normalized fingerprint of the block
+            canonical: Whether the block matches the local rule file
+        """
+        self.fingerprint = fingerprint
+        self.canonical = canonical
+        self.files: List[str] = []
+        self.label = "canonical" if canonical else ""
+        self.text: Optional[str] = None
+
+
+class BlockDrift:
+    """All variants of one block found across the fleet."""
+
+    def __init__(self, key: BlockKey, local_file: Optional[str]):
+        """
+        Initialize BlockDrift.
+
+        Args:
+            key: (block_type, name) of the block
+            local_file: Local rule file holding the canonical block, if any
+        """
+        self.block_type, self.name = key
+        self.local_file = local_file
+        self.variants: Dict[str, BlockVariant] = {}
+
+    @property
+    def title(self) -> str:
+        """Block marker text, e.g. 'LANGUAGE PYTHON'."""
+        return f"{self.block_type} {self.name}".strip()
+
+    def ordered_variants(self) -> List[BlockVariant]:
+        """
+        Get variants with the canonical one first, then by file count.
+
+        Returns:
+            Sorted list of variants
+        """
+        return sorted(
+            self.variants.values(),
+            key=lambda variant: (not variant.canonical, -len(variant.files)),
+        )
+
+    def summary(self) -> str:
+        """
+        Describe the variant distribution in one line.
+
+        Returns:
+            Summary such as 'block GENERAL RULES: 2 variants, 10 repos canonical'
+        """
+        variants = self.ordered_variants()
+        noun = "variant" if len(variants) == 1 else "variants"
+        parts = [f"block {self.title}: {len(variants)} {noun}"]
+        for variant in variants:
+            if variant.canonical:
+                parts.append(f"{len(variant.files):,} repos canonical")
+            else:
+                parts.append(f"{len(variant.files):,} on variant {variant.label}")
+        if self.local_file is None:
+            parts.append("no local block")
+        return ", ".join(parts)
+
+
+class DriftReporter:
+    """Groups external blocks by fingerprint and diffs each variant once."""
+
+    def __init__(
+        self, workers: Optional[int] = None, catalog: Optional[RuleCatalog] = None
+    ):
+        """
+        Initialize DriftReporter with required components.
+
+        Args:
+            workers: Number of worker processes (defaults to CPU count)
+            catalog: Local rule catalog (defaults to the shared one)
+        """
+        self.file_manager = FileManager()
+        self.block_extractor = BlockExtractor()
+        self.catalog = catalog or get_shared_catalog()
+        self.batch_comparer = BatchComparer(workers, use_cache=False)
+        self.workers = self.batch_comparer.workers
+
+    def load_local_blocks(self) -> Dict[BlockKey, Tuple[str, str]]:
+        """
+        Read the canonical block of every local rule file.
+
+        Returns:
+            Mapping of (block_type, name) to (local_file, block_text)
+        """
+        local_blocks = {}
+        for files in self.catalog.get_files_by_category():
+            for local_file in files:
+                block_type = self.block_extractor.determine_block_type(local_file)
+                if not block_type:
+                    continue
+
+                content = self.file_manager.read_file(local_file)
+                if content is None:
+                    continue
+
+                index = BlockIndex(content)
+                entry = self.block_extractor.find_block(index, block_type, local_file)
+                if entry is not None:
+                    local_blocks[(entry.block_type, entry.name)] = (
+                        local_file,
+                        index.block_text(entry),
+                    )
+        return local_blocks
+
+    def fingerprint_all(
+        self, external_files: List[str]
+    ) -> Dict[str, Optional[List[BlockPrint]]]:
+        """
+        Fingerprint the blocks of all external files.
+
+        Args:
+            external_files: Paths to external rules files
+
+        Returns:
+            Mapping of external file to its block fingerprints (None if unreadable)
+        """
+        if self.workers <= 1 or len(external_files) <= 1:
+            return {
+                external_file: fingerprint_external_file(external_file)
+                for external_file in external_files
+            }
+
+        # Imported here so single-process runs skip loading multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        chunksize = max(1, len(external_files) // (self.workers * 4))
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            results = executor.map(
+                fingerprint_external_file, external_files, chunksize=chunksize
+            )
+            return dict(zip(external_files, results))
+
+    def group(
+        self,
+        fingerprints: Dict[str, Optional[List[BlockPrint]]],
+        local_blocks: Dict[BlockKey, Tuple[str, str]],
+    ) -> List[BlockDrift]:
+        """
+        Group external files by block fingerprint.
+
+        Args:
+            fingerprints: Block fingerprints per external file
+            local_blocks: Canonical local blocks
+
+        Returns:
+            Drift per block, ordered by block type and name
+        """
+        local_prints = {
+            key: fingerprint_block(text) for key, (_, text) in local_blocks.items()
+        }
+        drifts: Dict[BlockKey, BlockDrift] = {}
+        for external_file, prints in fingerprints.items():
+            for block_type, name, fingerprint in prints or []:
+                key = (block_type, name)
+                drift = drifts.get(key)
+                if drift is None:
+                    local = local_blocks.get(key)
+                    drift = drifts[key] = BlockDrift(key, local[0] if local else None)
+
+                variant = drift.variants.get(fingerprint)
+                if variant is None:
+                    variant = drift.variants[fingerprint] = BlockVariant(
+                        fingerprint, local_prints.get(key) == fingerprint
+                    )
+                variant.files.append(external_file)
+
+        for drift in drifts.values():
+            letters = VARIANT_LABELS
+            # 'A' stands for the canonical variant when the fleet has one
+            if any(variant.canonical for variant in drift.variants.values()):
+                letters = letters[1:]
+            labels = iter(letters)
+            for number, variant in enumerate(drift.ordered_variants()):
+                if not variant.canonical:
+                    variant.label = next(labels, f"#{number + 1}")
+        return [drifts[key] for key in sorted(drifts)]
+
+    def load_variant_texts(self, drifts: List[BlockDrift]) -> None:
+        """
+        Extract the text of each non-canonical variant from one of its files.
+
+        Args:
+            drifts: Drift per block
+        """
+        for drift in drifts:
+            for variant in drift.variants.values():
+                if variant.canonical:
+                    continue
+                for external_file in variant.files:
+                    content = self.file_manager.read_file(external_file)
+                    if content is None:
+                        continue
+                    index = BlockIndex(content)
+                    entry = next(
+                        (
+                            entry
+                            for entry in index.entries
+                            if (entry.block_type, entry.name)
+                            == (drift.block_type, drift.name)
+                        ),
+                        None,
+                    )
+                    if entry is not None:
+                        variant.text = index.block_text(entry)
+                        break
+
+    def build_report(
+        self,
+        drifts: List[BlockDrift],
+        local_blocks: Dict[BlockKey, Tuple[str, str]],
+        external_count: int,
+    ) -> Dict:
+        """
+        Describe the drift as plain data, with one diff per variant.
+
+        Args:
+            drifts: Drift per block
+            local_blocks: Canonical local blocks
+            external_count: Number of external files examined
+
+        Returns:
+            JSON-serializable report
+        """
+        diff_engine = DiffEngine(color=False)
+        blocks = []
+        for drift in drifts:
+            local = local_blocks.get((drift.block_type, drift.name))
+            variants = []
+            for variant in drift.ordered_variants():
+                entry = {
+                    "label": variant.label,
+                    "fingerprint": variant.fingerprint,
+                    "canonical": variant.canonical,
+                    "count": len(variant.files),
+                    "files": variant.files,
+                }
+                if local and variant.text is not None:
+                    entry["diff"] = diff_engine.to_dict(
+                        variant.text, local[1], drift.block_type
+                    )["hunks"]
+                variants.append(entry)
+            blocks.append(
+                {
+                    "block": drift.title,
+                    "local_file": drift.local_file,
+                    "summary": drift.summary(),
+                    "variants": variants,
+                }
+            )
+        return {"external_files": external_count, "blocks": blocks}
+
+    def render_diffs(
+        self,
+        drifts: List[BlockDrift],
+        local_blocks: Dict[BlockKey, Tuple[str, str]],
+        diff_engine: DiffEngine,
+    ) -> str:
+        """
+        Render each non-canonical variant against its local block.
+
+        Args:
+            drifts: Drift per block
+            local_blocks: Canonical local blocks
+            diff_engine: Engine used to render the diffs
+
+        Returns:
+            Rendered diffs
+        """
+        output = []
+        for drift in drifts:
+            local = local_blocks.get((drift.block_type, drift.name))
+            if local is None:
+                continue
+            for variant in drift.ordered_variants():
+                if variant.canonical or variant.text is None:
+                    continue
+                diff = diff_engine.render_unified(
+                    variant.text, local[1], drift.block_type
+                )
+                if not diff:
+                    continue
+                output.append(
+                    f"\n=== {drift.title}, variant {variant.label} "
+                    f"({len(variant.files):,} repos, e.g. {variant.files[0]})"
+                )
+                output.append(diff)
+        return "\n".join(output)
+
+    def run(
+        self,
+        root_dirs: Iterable[str],
+        file_list: Optional[str],
+        report_path: Optional[str],
+        show_diffs: bool = True,
+        color: bool = False,
+    ) -> bool:
+        """
+        Discover, fingerprint, group and report in one run.
+
+        Args:
+            root_dirs: Directories to search recursively
+            file_list: Optional path to a text file with one path per line
+            report_path: Optional path of a JSON report
+            show_diffs: Whether to print one diff per variant
+            color: Whether printed diffs use ANSI colors
+
+        Returns:
+            True if the report was produced, False otherwise
+        """
+        external_files = self.batch_comparer.discover_external_files(
+            root_dirs, file_list
+        )
+        if not external_files:
+            logger.error("No external clinerules files found")
+            return False
+
+        local_blocks = self.load_local_blocks()
+        logger.info(
+            "Fingerprinting %s external files using %s workers",
+            len(external_files),
+            self.workers,
+        )
+        fingerprints = self.fingerprint_all(external_files)
+        unreadable = [path for path, prints in fingerprints.items() if prints is None]
+        if unreadable:
+            logger.warning("Could not read %s external files", len(unreadable))
+
+        drifts = self.group(fingerprints, local_blocks)
+        self.load_variant_texts(drifts)
+
+        for drift in drifts:
+            print(drift.summary())
+
+        if show_diffs:
+            diffs = self.render_diffs(drifts, local_blocks, DiffEngine(color=color))
+            if diffs:
+                print(diffs)
+
+        if report_path:
+            report_dir = os.path.dirname(report_path)
+            if report_dir and not self.file_manager.ensure_directory(report_dir):
+                return False
+            report = self.build_report(drifts, local_blocks, len(external_files))
+            if not self.file_manager.write_file(
+                report_path, json.dumps(report, indent=2)
+            ):
+                return False
+            logger.info("Report written to %s", report_path)
+        return True
@@ -1,59 +1,169 @@
+import atexit
 import os
+import re
+import shutil
 import subprocess
-from typing import Optional, Tuple
+import tempfile
+import threading
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Tuple
 from src.utils.logging_config import setup_logger
-from src.core.file_manager import FileManager
+from src.utils.profiling import span
 
 logger = setup_logger(__name__)
 
+# git diff --no-index reads named pipes (and /dev/fd/N) from this version on
+GIT_PIPE_VERSION = (2, 42)
+
+_scratch_dir: Optional[str] = None
+_scratch_lock = threading.Lock()
+
+
+def _remove_scratch_dir() -> None:
+    """Delete the per-process scratch directory and everything left in it."""
+    global _scratch_dir
+    if _scratch_dir is not None:
+        shutil.rmtree(_scratch_dir, ignore_errors=True)
+        _scratch_dir = None
+
+
+def get_scratch_dir() -> str:
+    """
+    Get the per-process scratch directory, creating it on first use.
+
+    The directory is unique to this process and removed when it exits.
+
+    Returns:
+        Path of the scratch directory
+    """
+    global _scratch_dir
+    with _scratch_lock:
+        if _scratch_dir is None:
+            _scratch_dir = tempfile.mkdtemp(prefix=f"cline-tools-{os.getpid()}-")
+            atexit.register(_remove_scratch_dir)
+        return _scratch_dir
+
 
 class DiffHandler:
     """Handles diff operations between files."""
 
     def __init__(self):
-        """Initialize DiffHandler with a temporary directory."""
-        self.tmp_dir = "tmp"
-        FileManager.ensure_directory(self.tmp_dir)
+        """Initialize DiffHandler."""
+        self._git_pipes: Optional[bool] = None
 
-    def create_temp_files(
+    def git_supports_pipes(self) -> bool:
+        """
+        Check whether git diff can read both sides from pipes.
+
+        Returns:
+            True on POSIX systems with a recent enough git
+        """
+        if self._git_pipes is None:
+            self._git_pipes = False
+            if os.name == "posix":
+                try:
+                    output = subprocess.run(
+                        ["git", "--version"], capture_output=True, text=True
+                    ).stdout
+                    match = re.search(r"(\d+)\.(\d+)", output)
+                    if match:
+                        version = (int(match.group(1)), int(match.group(2)))
+                        self._git_pipes = version >= GIT_PIPE_VERSION
+                except OSError as e:
+                    logger.error("Error running git: %s", e)
+        return self._git_pipes
+
+    @contextmanager
+    def temp_files(
         self, external_block: str, local_block: str, block_type: str
-    ) -> Tuple[Optional[str], Optional[str]]:
+    ) -> Iterator[Tuple[str, str]]:
         """
-        Create temporary files for diff comparison.
+        Write both blocks to uniquely named files in the scratch directory.
+
+        The files are deleted when the context exits.
 
         Args:
             external_block: Content from external file
             local_block: Content from local file
             block_type: Type of block being compared
 
-        Returns:
-            Tuple of (external_tmp_path, local_tmp_path) or (None, None) on error
+        Yields:
+            Tuple of (external_tmp_path, local_tmp_path)
         """
+        scratch_dir = get_scratch_dir()
+        paths: List[str] = []
         try:
-            external_tmp = os.path.join(
-                self.tmp_dir, f"external_{block_type.lower()}_block.md"
-            )
-            local_tmp = os.path.join(
-                self.tmp_dir, f"local_{block_type.lower()}_block.md"
-            )
-
-            if not FileManager.write_file(external_tmp, external_block):
-                return None, None
-            if not FileManager.write_file(local_tmp, local_block):
-                return None, None
-
-            return external_tmp, local_tmp
-        except Exception as e:
-            logger.error(f"Error creating temporary files: {e}")
-            return None, None
+            with span("diff.temp_files") as stage:
+                stage.add_bytes(len(external_block) + len(local_block))
+                sides = (("external", external_block), ("local", local_block))
+                for side, content in sides:
+                    fd, path = tempfile.mkstemp(
+                        prefix=f"{side}_{block_type.lower()}_",
+                        suffix=".md",
+                        dir=scratch_dir,
+                    )
+                    paths.append(path)
+                    with os.fdopen(fd, "w", encoding="utf-8") as f:
+                        f.write(content)
+            yield paths[0], paths[1]
+        finally:
+            for path in paths:
+                try:
+                    os.unlink(path)
+                except OSError as e:
+                    logger.error("Error deleting temp file %s: %s", path, e)
+
+    @contextmanager
+    def pipes(self, *contents: str) -> Iterator[List[int]]:
+        """
+        Expose in-memory contents as pipes readable through /dev/fd/N.
 
-    def run_git_diff(self, external_tmp: str, local_tmp: str) -> bool:
+        Each pipe is fed from its own thread so large blocks cannot dead-lock
+        against the reading process.
+
+        Args:
+            contents: Texts to expose
+
+        Yields:
+            One read descriptor per text, to be passed to the child process
+            with pass_fds
+        """
+        read_fds: List[int] = []
+        writers: List[threading.Thread] = []
+
+        def feed(fd: int, data: bytes) -> None:
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+            except BrokenPipeError:
+                pass
+
+        try:
+            for content in contents:
+                read_fd, write_fd = os.pipe()
+                read_fds.append(read_fd)
+                writer = threading.Thread(
+                    target=feed, args=(write_fd, content.encode("utf-8")), daemon=True
+                )
+                writer.start()
+                writers.append(writer)
+            yield read_fds
+        finally:
+            for fd in read_fds:
+                os.close(fd)
+            for writer in writers:
+                writer.join()
+
+    def run_git_diff(
+        self, external_path: str, local_path: str, pass_fds: Tuple[int, ...] = ()
+    ) -> bool:
         """
         Run git diff command between two files.
 
         Args:
-            external_tmp: Path to external temporary file
-            local_tmp: Path to local temporary file
+            external_path: Path of the external side
+            local_path: Path of the local side
+            pass_fds: Descriptors the paths refer to (for /dev/fd paths)
 
         Returns:
             True if diff command executed successfully, False otherwise
@@ -65,35 +175,40 @@ class DiffHandler:
                 "--no-index",
                 "--color=always",
                 "--word-diff=color",
-                external_tmp,
-                local_tmp,
+                external_path,
+                local_path,
             ]
-            subprocess.run(diff_command)
-            return True
-        except subprocess.CalledProcessError:
-            # git diff returns non-zero exit code if files are different
+            with span("diff.git"):
+                # git diff returns non-zero exit code if files are different
+                subprocess.run(diff_command, pass_fds=pass_fds)
             return True
         except Exception as e:
-            logger.error(f"Error running git diff: {e}")
+            logger.error("Error running git diff: %s", e)
             return False
 
-    def run_vscode_diff(self, external_tmp: str, local_tmp: str) -> bool:
+    def run_vscode_diff(self, external_path: str, local_path: str) -> bool:
         """
-        Run VS Code diff command between two files.
+        Run VS Code diff between two files and wait until it is closed.
 
         Args:
-            external_tmp: Path to external temporary file
-            local_tmp: Path to local temporary file
+            external_path: Path of the external side
+            local_path: Path of the local side
 
         Returns:
             True if diff command executed successfully, False otherwise
         """
+        code = shutil.which("code")
+        if code is None:
+            logger.error("VS Code command 'code' not found on PATH")
+            return False
+
         try:
-            diff_command = f'code --diff "{external_tmp}" "{local_tmp}"'
-            subprocess.run(diff_command, shell=True)
+            with span("diff.vscode"):
+                # --wait keeps the files alive until the diff tab is closed
+                subprocess.run([code, "--wait", "--diff", external_path, local_path])
             return True
         except Exception as e:
-            logger.error(f"Error running VS Code diff: {e}")
+            logger.error("Error running VS Code diff: %s", e)
             return False
 
     def compare_with_diff_tool(
@@ -106,6 +221,9 @@ class DiffHandler:
         """
         Compare blocks using selected diff tool.
 
+        git reads the blocks straight from pipes when it supports them; other
+        viewers get short-lived files in the per-process scratch directory.
+
         Args:
             external_block: Content from external file
             local_block: Content from local file
@@ -115,15 +233,17 @@ class DiffHandler:
         Returns:
             True if diff operation was successful, False otherwise
         """
-        # Create temporary files
-        tmp_files = self.create_temp_files(external_block, local_block, block_type)
-        if tmp_files == (None, None):
+        try:
+            if use_git_diff and self.git_supports_pipes():
+                with self.pipes(external_block, local_block) as (external, local):
+                    return self.run_git_diff(
+                        f"/dev/fd/{external}", f"/dev/fd/{local}", (external, local)
+                    )
+
+            with self.temp_files(external_block, local_block, block_type) as paths:
+                if use_git_diff:
+                    return self.run_git_diff(*paths)
+                return self.run_vscode_diff(*paths)
+        except OSError as e:
+            logger.error("Error preparing diff: %s", e)
             return False
-
-        external_tmp, local_tmp = tmp_files
-
-        # Run diff command
-        if use_git_diff:
-            return self.run_git_diff(external_tmp, local_tmp)
-        else:
-            return self.run_vscode_diff(external_tmp, local_tmp)
@@ -0,0 +1,186 @@
+"""Process-wide LRU cache of parsed clinerules documents."""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+from src.utils.logging_config import setup_logger
+from src.core.file_manager import FileManager
+from src.core.block_index import BlockIndex
+from src.core.rules.config import DOCUMENT_CACHE_MAX_BYTES
+
+logger = setup_logger(__name__)
+
+
+class CachedDocument:
+    """File content with its block index, valid for one (mtime, size) pair."""
+
+    def __init__(self, mtime_ns: int, size: int, content: str):
+        """
+        Initialize CachedDocument.
+
+        Args:
+            mtime_ns: Modification time of the file when read
+            size: Size of the file in bytes when read
+            content: File content
+        """
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.content = content
+        self.index = BlockIndex(content)
+
+
+class DocumentCache:
+    """
+    Reads and parses files once per (path, mtime_ns, size).
+
+    Documents are kept in least-recently-used order and evicted once their
+    combined size exceeds the byte budget. Files larger than the whole budget
+    are parsed but not kept.
+    """
+
+    def __init__(self, max_bytes: int = DOCUMENT_CACHE_MAX_BYTES):
+        """
+        Initialize DocumentCache.
+
+        Args:
+            max_bytes: Maximum combined size of cached files
+        """
+        self.max_bytes = max_bytes
+        self.documents: "OrderedDict[str, CachedDocument]" = OrderedDict()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def stat(file_path: str) -> Optional[Tuple[str, int, int]]:
+        """
+        Get the cache key of a file.
+
+        Args:
+            file_path: Path to the file
+
+        Returns:
+            Tuple of (absolute_path, mtime_ns, size) or None if the file is missing
+        """
+        path = os.path.abspath(file_path)
+        try:
+            stat = os.stat(path)
+        except OSError as e:
+            logger.error("Could not find file: %s (%s)", file_path, e)
+            return None
+        return path, stat.st_mtime_ns, stat.st_size
+
+    def get(self, file_path: str) -> Optional[CachedDocument]:
+        """
+        Get a parsed document, reading the file only if it changed.
+
+        Args:
+            file_path: Path to the file
+
+        Returns:
+            Parsed document or None if the file cannot be read
+        """
+        key = self.stat(file_path)
+        if key is None:
+            return None
+        path, mtime_ns, size = key
+
+        with self._lock:
+            document = self.documents.get(path)
+            if document and document.mtime_ns == mtime_ns and document.size == size:
+                self.documents.move_to_end(path)
+                self.hits += 1
+                return document
+            self.misses += 1
+
+        content = FileManager.read_file(file_path)
+        if content is None:
+            self.invalidate(file_path)
+            return None
+
+        document = CachedDocument(mtime_ns, size, content)
+        with self._lock:
+            self._remove(path)
+            if size <= self.max_bytes:
+                self.documents[path] = document
+                self.total_bytes += size
+                while self.total_bytes > self.max_bytes:
+                    _, evicted = self.documents.popitem(last=False)
+                    self.total_bytes -= evicted.size
+                    self.evictions += 1
+        return document
+
+    def read(self, file_path: str) -> Optional[str]:
+        """
+        Get the content of a file through the cache.
+
+        Args:
+            file_path: Path to the file
+
+        Returns:
+            File content or None if the file cannot be read
+        """
+        document = self.get(file_path)
+        return document.content if document is not None else None
+
+    def _remove(self, path: str) -> None:
+        """
+        Drop a document; the caller must hold the lock.
+
+        Args:
+            path: Absolute path of the file
+        """
+        document = self.documents.pop(path, None)
+        if document is not None:
+            self.total_bytes -= document.size
+
+    def invalidate(self, file_path: str) -> None:
+        """
+        Forget a file, e.g. after writing it.
+
+        Args:
+            file_path: Path to the file
+        """
+        with self._lock:
+            self._remove(os.path.abspath(file_path))
+
+    def clear(self) -> None:
+        """Forget all documents."""
+        with self._lock:
+            self.documents.clear()
+            self.total_bytes = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get cache counters.
+
+        Returns:
+            Dictionary with documents, bytes, hits, misses and evictions
+        """
+        with self._lock:
+            return {
+                "documents": len(self.documents),
+                "bytes": self.total_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+_shared_document_cache: Optional[DocumentCache] = None
+
+
+def get_shared_document_cache() -> DocumentCache:
+    """
+    Get the process-wide document cache.
+
+    Returns:
+        Shared DocumentCache instance
+    """
+    global _shared_document_cache
+    if _shared_document_cache is None:
+        _shared_document_cache = DocumentCache()
+    return _shared_document_cache
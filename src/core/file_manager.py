@@ -1,7 +1,9 @@
 import os
 import glob
-from typing import List, Optional
+import threading
+from typing import Dict, List, Optional, Set
 from src.utils.logging_config import setup_logger
+from src.utils.profiling import span
 
 logger = setup_logger(__name__)
 
@@ -9,6 +11,13 @@ logger = setup_logger(__name__)
 class FileManager:
     """Handles file operations for the clinerules system."""
 
+    _stats_lock = threading.Lock()
+    _write_stats: Dict[str, int] = {"written": 0, "skipped": 0}
+    _pending_syncs: Set[str] = set()
+    # Process umask, read on the first write of a new file
+    _umask: Optional[int] = None
+    _umask_lock = threading.Lock()
+
     @staticmethod
     def list_files(pattern: str) -> List[str]:
         """
@@ -35,34 +44,226 @@ class FileManager:
             File content as string or None if file cannot be read
         """
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                return f.read()
+            with span("file.read") as stage:
+                with open(file_path, "r", encoding="utf-8") as f:
+                    content = f.read()
+                    # Bytes on disk; len(content) would count characters
+                    stage.add_bytes(os.fstat(f.fileno()).st_size)
+            return content
         except FileNotFoundError:
-            logger.error(f"Could not find file: {file_path}")
+            logger.error("Could not find file: %s", file_path)
             return None
         except Exception as e:
-            logger.error(f"Error reading file {file_path}: {e}")
+            logger.error("Error reading file %s: %s", file_path, e)
             return None
 
     @staticmethod
-    def write_file(file_path: str, content: str) -> bool:
+    def encode_content(content: str) -> bytes:
+        """
+        Encode content the way a text-mode write would store it.
+
+        Args:
+            content: Content to encode
+
+        Returns:
+            UTF-8 bytes with platform line endings
+        """
+        if os.linesep != "\n":
+            content = content.replace("\n", os.linesep)
+        return content.encode("utf-8")
+
+    @staticmethod
+    def is_unchanged(file_path: str, data: bytes) -> bool:
+        """
+        Check whether a file already holds exactly the given bytes.
+
+        Args:
+            file_path: Path to the file
+            data: Bytes that would be written
+
+        Returns:
+            True if the file exists with identical content, False otherwise
+        """
+        try:
+            if os.path.getsize(file_path) != len(data):
+                return False
+            with open(file_path, "rb") as f:
+                existing = f.read()
+        except OSError:
+            return False
+        return existing == data
+
+    @classmethod
+    def _record_write(cls, key: str) -> None:
+        """
+        Increment a write counter.
+
+        Args:
+            key: Counter name ('written' or 'skipped')
+        """
+        with cls._stats_lock:
+            cls._write_stats[key] += 1
+
+    @classmethod
+    def get_write_stats(cls) -> Dict[str, int]:
+        """
+        Get the number of performed and skipped writes in this process.
+
+        Returns:
+            Dictionary with 'written' and 'skipped' counts
+        """
+        with cls._stats_lock:
+            return dict(cls._write_stats)
+
+    @classmethod
+    def log_write_stats(cls) -> None:
+        """Log how many writes were performed and how many were skipped."""
+        stats = cls.get_write_stats()
+        if stats["written"] or stats["skipped"]:
+            logger.info(
+                "Wrote %s files, skipped %s unchanged",
+                stats["written"],
+                stats["skipped"],
+            )
+
+    @classmethod
+    def write_file(cls, file_path: str, content: str, fsync: bool = False) -> bool:
         """
-        Write content to a file.
+        Write content to a file atomically, skipping writes that change nothing.
+
+        The content goes to a temporary file next to the target, which then
+        replaces the target, so readers never see a partially written file.
 
         Args:
             file_path: Path to the file to write
             content: Content to write to the file
+            fsync: Whether to flush the file to disk before replacing the target
+                (directory syncs are batched until flush_pending_syncs)
+
+        Returns:
+            True if write was successful (or skipped as unchanged), False otherwise
+        """
+        with span("file.write") as stage:
+            data = cls.encode_content(content)
+            stage.add_bytes(len(data))
+            if cls.is_unchanged(file_path, data):
+                cls._record_write("skipped")
+                return True
+            return cls._write_atomic(file_path, data, fsync)
+
+    @classmethod
+    def _default_mode(cls) -> int:
+        """
+        Get the permissions of a newly created file under the process umask.
+
+        Returns:
+            Permission bits
+        """
+        if cls._umask is None:
+            with cls._umask_lock:
+                if cls._umask is None:
+                    # The umask can only be read by setting it
+                    umask = os.umask(0)
+                    os.umask(umask)
+                    cls._umask = umask
+        return 0o666 & ~cls._umask
+
+    @classmethod
+    def _write_atomic(cls, file_path: str, data: bytes, fsync: bool) -> bool:
+        """
+        Write bytes to a temporary file and move it over the target.
+
+        Symlinks are resolved so the file they point to is replaced. Files with
+        several hard links cannot be replaced without detaching this path from
+        the other links, so the temporary file is copied back over them in
+        place. That copy is not atomic: if it fails, the temporary file is kept
+        and its path logged so the new content can be recovered.
+
+        Args:
+            file_path: Path to the file to write
+            data: Encoded content
+            fsync: Whether to flush the file to disk before replacing the target
 
         Returns:
             True if write was successful, False otherwise
         """
+        # Imported here so commands that never write skip loading it
+        import tempfile
+
+        target = os.path.realpath(file_path)
+        directory = os.path.dirname(target)
+        tmp_path = None
         try:
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(content)
+            existing = os.stat(target) if os.path.exists(target) else None
+            fd, tmp_path = tempfile.mkstemp(
+                dir=directory,
+                prefix=f".{os.path.basename(target)}.",
+                suffix=".tmp",
+            )
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+                if fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+
+            if existing is not None and existing.st_nlink > 1:
+                try:
+                    with open(target, "r+b") as f:
+                        f.write(data)
+                        f.truncate()
+                        if fsync:
+                            f.flush()
+                            os.fsync(f.fileno())
+                except OSError as e:
+                    logger.error(
+                        "Error writing to file %s: %s (new content kept in %s)",
+                        file_path,
+                        e,
+                        tmp_path,
+                    )
+                    tmp_path = None
+                    return False
+                cls._record_write("written")
+                return True
+
+            if existing is not None:
+                os.chmod(tmp_path, existing.st_mode & 0o7777)
+            else:
+                os.chmod(tmp_path, cls._default_mode())
+
+            os.replace(tmp_path, target)
+            tmp_path = None
+            if fsync:
+                with cls._stats_lock:
+                    cls._pending_syncs.add(directory)
+            cls._record_write("written")
             return True
         except Exception as e:
-            logger.error(f"Error writing to file {file_path}: {e}")
+            logger.error("Error writing to file %s: %s", file_path, e)
             return False
+        finally:
+            if tmp_path and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+    @classmethod
+    def flush_pending_syncs(cls) -> None:
+        """Fsync the directories of all files written with fsync=True."""
+        with cls._stats_lock:
+            directories = list(cls._pending_syncs)
+            cls._pending_syncs.clear()
+
+        for directory in directories:
+            try:
+                fd = os.open(directory, os.O_RDONLY)
+            except OSError:
+                # Directories cannot be opened for syncing on Windows
+                continue
+            try:
+                os.fsync(fd)
+            except OSError as e:
+                logger.warning("Could not sync directory %s: %s", directory, e)
+            finally:
+                os.close(fd)
 
     @staticmethod
     def ensure_directory(directory: str) -> bool:
@@ -79,7 +280,7 @@ class FileManager:
             os.makedirs(directory, exist_ok=True)
             return True
         except Exception as e:
-            logger.error(f"Error creating directory {directory}: {e}")
+            logger.error("Error creating directory %s: %s", directory, e)
             return False
 
     @staticmethod
@@ -103,5 +304,5 @@ class FileManager:
                     return None
             return "\n\n".join(content)
         except Exception as e:
-            logger.error(f"Error merging files: {e}")
+            logger.error("Error merging files: %s", e)
             return None
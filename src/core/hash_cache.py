@@ -0,0 +1,256 @@
+"""Persistent content-hash cache for clinerules files and their blocks."""
+
+import hashlib
+import json
+import os
+import time
+from typing import Dict, Optional
+from src.utils.logging_config import setup_logger
+from src.core.file_manager import FileManager
+from src.core.block_index import BlockIndex, BlockEntry
+from src.core.rules.config import (
+    HASH_CACHE_FILE,
+    HASH_CACHE_MAX_ENTRIES,
+    HASH_CACHE_MAX_AGE_DAYS,
+)
+
+logger = setup_logger(__name__)
+
+# Bump whenever the stored block layout or marker parsing changes
+CACHE_VERSION = 2
+
+# Only refresh the access time of an entry once per interval to avoid writes
+TOUCH_INTERVAL_SECONDS = 24 * 60 * 60
+
+
+def hash_text(text: str) -> str:
+    """
+    Compute the SHA-256 digest of text.
+
+    Args:
+        text: Text to hash
+
+    Returns:
+        Hex digest of the UTF-8 encoded text
+    """
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class HashedDocument:
+    """Block index of a file together with the digest of every block."""
+
+    def __init__(
+        self, digest: str, index: BlockIndex, block_digests: Dict[int, str]
+    ):
+        """
+        Initialize HashedDocument.
+
+        Args:
+            digest: SHA-256 of the whole file content
+            index: Block index (content may be empty when loaded from cache)
+            block_digests: Mapping of block start offset to block digest
+        """
+        self.digest = digest
+        self.index = index
+        self.block_digests = block_digests
+
+    @classmethod
+    def from_content(cls, content: str) -> "HashedDocument":
+        """
+        Index and hash file content.
+
+        Args:
+            content: File content
+
+        Returns:
+            HashedDocument for the content
+        """
+        index = BlockIndex(content)
+        block_digests = {
+            entry.start: hash_text(index.block_text(entry)) for entry in index.entries
+        }
+        return cls(hash_text(content), index, block_digests)
+
+    def block_digest(self, entry: BlockEntry) -> str:
+        """
+        Get the digest of a block.
+
+        Args:
+            entry: Block entry from this document's index
+
+        Returns:
+            Hex digest of the stripped block content
+        """
+        return self.block_digests[entry.start]
+
+
+class HashCache:
+    """SQLite-backed cache of file and block digests keyed by path, mtime and size."""
+
+    def __init__(
+        self,
+        cache_file: str = HASH_CACHE_FILE,
+        max_entries: int = HASH_CACHE_MAX_ENTRIES,
+        max_age_days: int = HASH_CACHE_MAX_AGE_DAYS,
+    ):
+        """
+        Initialize HashCache and open (or create) the database.
+
+        Args:
+            cache_file: Path to the SQLite database
+            max_entries: Maximum number of files kept after eviction
+            max_age_days: Entries not accessed for this many days are evicted
+        """
+        self.cache_file = cache_file
+        self.max_entries = max_entries
+        self.max_age_days = max_age_days
+        self.hits = 0
+        self.misses = 0
+
+        # Imported here so loading the module does not load sqlite3
+        import sqlite3
+
+        FileManager.ensure_directory(os.path.dirname(cache_file))
+        self.connection = sqlite3.connect(cache_file, timeout=30)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS files ("
+            "path TEXT PRIMARY KEY, version INTEGER, mtime_ns INTEGER, size INTEGER, "
+            "digest TEXT, blocks TEXT, accessed REAL)"
+        )
+        self.connection.commit()
+
+    def get_document(
+        self, file_path: str, max_read_size: Optional[int] = None
+    ) -> Optional[HashedDocument]:
+        """
+        Get the hashed block index of a file, reading it only if it changed.
+
+        Args:
+            file_path: Path to the file
+            max_read_size: On a cache miss, do not read files of this many bytes
+                or more
+
+        Returns:
+            HashedDocument or None if the file cannot be read (or is too large
+            to read)
+        """
+        path = os.path.abspath(file_path)
+        try:
+            stat = os.stat(path)
+        except OSError as e:
+            logger.error("Could not stat file %s: %s", file_path, e)
+            return None
+
+        row = self.connection.execute(
+            "SELECT version, mtime_ns, size, digest, blocks, accessed "
+            "FROM files WHERE path = ?",
+            (path,),
+        ).fetchone()
+        now = time.time()
+        if (
+            row
+            and row[0] == CACHE_VERSION
+            and row[1] == stat.st_mtime_ns
+            and row[2] == stat.st_size
+        ):
+            self.hits += 1
+            if now - row[5] > TOUCH_INTERVAL_SECONDS:
+                self.connection.execute(
+                    "UPDATE files SET accessed = ? WHERE path = ?", (now, path)
+                )
+                self.connection.commit()
+            return self._decode(row[3], row[4])
+
+        self.misses += 1
+        if max_read_size is not None and stat.st_size >= max_read_size:
+            return None
+        content = FileManager.read_file(path)
+        if content is None:
+            return None
+
+        document = HashedDocument.from_content(content)
+        self.connection.execute(
+            "INSERT OR REPLACE INTO files "
+            "(path, version, mtime_ns, size, digest, blocks, accessed) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                path,
+                CACHE_VERSION,
+                stat.st_mtime_ns,
+                stat.st_size,
+                document.digest,
+                self._encode(document),
+                now,
+            ),
+        )
+        self.connection.commit()
+        return document
+
+    @staticmethod
+    def _encode(document: HashedDocument) -> str:
+        """
+        Serialize block entries and digests.
+
+        Args:
+            document: Document to serialize
+
+        Returns:
+            JSON string of block rows
+        """
+        return json.dumps(
+            [
+                list(entry) + [document.block_digest(entry)]
+                for entry in document.index.entries
+            ]
+        )
+
+    @staticmethod
+    def _decode(digest: str, blocks: str) -> HashedDocument:
+        """
+        Rebuild a document from its serialized block rows.
+
+        Args:
+            digest: File digest
+            blocks: JSON string of block rows
+
+        Returns:
+            HashedDocument without content
+        """
+        entries = []
+        block_digests = {}
+        for row in json.loads(blocks):
+            entry = BlockEntry(*row[:5])
+            entries.append(entry)
+            block_digests[entry.start] = row[5]
+        return HashedDocument(digest, BlockIndex("", entries), block_digests)
+
+    def evict(self) -> int:
+        """
+        Remove stale entries and trim the cache to its maximum size.
+
+        Returns:
+            Number of removed entries
+        """
+        cutoff = time.time() - self.max_age_days * 24 * 60 * 60
+        removed = self.connection.execute(
+            "DELETE FROM files WHERE accessed < ? OR version != ?",
+            (cutoff, CACHE_VERSION),
+        ).rowcount
+        removed += self.connection.execute(
+            "DELETE FROM files WHERE path NOT IN "
+            "(SELECT path FROM files ORDER BY accessed DESC LIMIT ?)",
+            (self.max_entries,),
+        ).rowcount
+        self.connection.commit()
+        return removed
+
+    def close(self) -> None:
+        """Evict stale entries and close the database."""
+        try:
+            removed = self.evict()
+            if removed:
+                logger.info("Evicted %s entries from hash cache", removed)
+        finally:
+            self.connection.close()
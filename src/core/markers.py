@@ -0,0 +1,117 @@
+"""Grammar of '### BEGIN' block markers shared by everything reading clinerules."""
+
+import re
+from typing import List, Tuple
+
+# A marker: '###', 'BEGIN' in any case, then the block type and name up to
+# the end of the line (excluding any '\r'). The pattern starts with a literal
+# so the regex engine can scan for it quickly; that only indentation (or a
+# byte order mark) precedes it on its line is checked separately.
+MARKER_PATTERN = re.compile(r"###[ \t]*BEGIN\b[^\r\n]*", re.IGNORECASE)
+BYTES_MARKER_PATTERN = re.compile(rb"###[ \t]*BEGIN\b[^\r\n]*", re.IGNORECASE)
+
+# Characters allowed before a marker on its line
+INDENT_CHARS = " \t\ufeff"
+BYTES_INDENT_CHARS = b" \t\xef\xbb\xbf"
+
+# Start of a single marker line, used to split off the block identity
+MARKER_PREFIX_PATTERN = re.compile(r"[ \t\ufeff]*###[ \t]*BEGIN\b", re.IGNORECASE)
+
+SEPARATOR_PATTERN = re.compile(r"[_-]")
+
+
+def normalize_name(name: str) -> str:
+    """
+    Normalize a block name for lookups.
+
+    Case, underscores, hyphens and runs of whitespace are ignored, so
+    'arduino_c' and 'Arduino  C' both become 'ARDUINO C'.
+
+    Args:
+        name: Block name from a marker or file name
+
+    Returns:
+        Normalized name
+    """
+    return " ".join(SEPARATOR_PATTERN.sub(" ", name).upper().split())
+
+
+def is_marker(line: str) -> bool:
+    """
+    Check whether a line is a block marker.
+
+    Args:
+        line: Line of a document
+
+    Returns:
+        True if the line starts a block
+    """
+    return MARKER_PREFIX_PATTERN.match(line) is not None
+
+
+def parse_marker(marker: str) -> Tuple[str, str]:
+    """
+    Split a marker line into its normalized block type and name.
+
+    Args:
+        marker: Marker line, e.g. '### BEGIN LANGUAGE PYTHON' or '### begin Project'
+
+    Returns:
+        Tuple of (block_type, name), e.g. ('LANGUAGE', 'PYTHON') or ('PROJECT', '')
+    """
+    prefix = MARKER_PREFIX_PATTERN.match(marker)
+    words = normalize_name(marker[prefix.end():] if prefix else marker).split()
+    if not words:
+        return "", ""
+    return words[0], " ".join(words[1:])
+
+
+def canonical_marker(marker: str) -> str:
+    """
+    Rewrite a marker line in its normalized form.
+
+    Args:
+        marker: Marker line, e.g. '  ### begin project_x '
+
+    Returns:
+        Normalized marker, e.g. '### BEGIN PROJECT X'
+    """
+    return " ".join(["### BEGIN", *parse_marker(marker)]).strip()
+
+
+def find_markers(content: str) -> List[Tuple[int, str]]:
+    """
+    Locate every marker line of a document.
+
+    Args:
+        content: Document content
+
+    Returns:
+        List of (offset of '###', marker line without trailing whitespace)
+    """
+    markers = []
+    for match in MARKER_PATTERN.finditer(content):
+        line_start = content.rfind("\n", 0, match.start()) + 1
+        if not content[line_start:match.start()].strip(INDENT_CHARS):
+            markers.append((match.start(), match.group(0).rstrip()))
+    return markers
+
+
+def find_markers_in_buffer(buffer) -> List[Tuple[int, str]]:
+    """
+    Locate every marker line of a bytes-like buffer without decoding it.
+
+    Args:
+        buffer: Bytes-like object holding UTF-8 encoded content
+
+    Returns:
+        List of (byte offset of '###', decoded marker line without trailing
+        whitespace)
+    """
+    markers = []
+    for match in BYTES_MARKER_PATTERN.finditer(buffer):
+        line_start = buffer.rfind(b"\n", 0, match.start()) + 1
+        if not buffer[line_start:match.start()].strip(BYTES_INDENT_CHARS):
+            marker = match.group(0).decode("utf-8", errors="replace").rstrip()
+            markers.append((match.start(), marker))
+    return markers
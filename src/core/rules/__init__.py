@@ -1,14 +1,25 @@
 """Core functionality for managing clinerules files."""
 
-from .config import CLINERULES_DIR, OUTPUT_DIR
-from .validator import validate_directory_structure
-from .file_selector import FileSelector
-from .output_handler import OutputHandler
-
-__all__ = [
-    'CLINERULES_DIR',
-    'OUTPUT_DIR',
-    'validate_directory_structure',
-    'FileSelector',
-    'OutputHandler',
-]
+import importlib
+
+# Exports are resolved on first access so importing one submodule does not
+# pull in its siblings.
+_EXPORTS = {
+    'CLINERULES_DIR': '.config',
+    'OUTPUT_DIR': '.config',
+    'validate_directory_structure': '.validator',
+    'RuleCatalog': '.catalog',
+    'get_shared_catalog': '.catalog',
+    'FileSelector': '.file_selector',
+    'OutputHandler': '.output_handler',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    """Import exported names lazily."""
+    if name in _EXPORTS:
+        module = importlib.import_module(_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,132 @@
+"""Cached catalog of local clinerules files."""
+
+import fnmatch
+import os
+import threading
+from typing import Dict, List, Optional, Tuple
+from src.utils.logging_config import setup_logger
+from .config import CLINERULES_DIR, DIRECTORY_STRUCTURE, RULE_FILE_PATTERN
+
+logger = setup_logger(__name__)
+
+
+class RuleCatalog:
+    """Lists rule files by category with a single scandir pass per change."""
+
+    def __init__(self, root_dir: str = CLINERULES_DIR):
+        """
+        Initialize RuleCatalog.
+
+        Args:
+            root_dir: Root of the clinerules tree
+        """
+        self.root_dir = root_dir
+        self.categories: List[str] = DIRECTORY_STRUCTURE["clinerules"]
+        self._lock = threading.Lock()
+        self._mtimes: Optional[Tuple[Optional[int], ...]] = None
+        self._files: Dict[str, List[str]] = {}
+
+    def _directory_mtimes(self) -> Tuple[Optional[int], ...]:
+        """
+        Get modification times of the root and every category directory.
+
+        Returns:
+            Tuple of mtimes in nanoseconds (None for missing directories)
+        """
+        mtimes = []
+        for directory in [self.root_dir] + [
+            os.path.join(self.root_dir, category) for category in self.categories
+        ]:
+            try:
+                mtimes.append(os.stat(directory).st_mtime_ns)
+            except OSError:
+                mtimes.append(None)
+        return tuple(mtimes)
+
+    def _scan(self) -> Dict[str, List[str]]:
+        """
+        Walk the clinerules tree once and classify rule files by category.
+
+        Returns:
+            Mapping of category to sorted list of normalized file paths
+        """
+        files: Dict[str, List[str]] = {category: [] for category in self.categories}
+        try:
+            with os.scandir(self.root_dir) as root_entries:
+                category_dirs = [
+                    entry
+                    for entry in root_entries
+                    if entry.name in files and entry.is_dir()
+                ]
+            for category_dir in category_dirs:
+                with os.scandir(category_dir.path) as entries:
+                    files[category_dir.name] = sorted(
+                        os.path.normpath(entry.path)
+                        for entry in entries
+                        if fnmatch.fnmatch(entry.name, RULE_FILE_PATTERN)
+                        and entry.is_file()
+                    )
+        except OSError as e:
+            logger.error("Error scanning rules directory %s: %s", self.root_dir, e)
+        return files
+
+    def refresh(self) -> Dict[str, List[str]]:
+        """
+        Rescan the tree if any directory changed since the last scan.
+
+        Returns:
+            Mapping of category to sorted list of normalized file paths
+        """
+        with self._lock:
+            mtimes = self._directory_mtimes()
+            if mtimes != self._mtimes:
+                self._files = self._scan()
+                self._mtimes = mtimes
+            return self._files
+
+    def get_files(self, category: str) -> List[str]:
+        """
+        Get rule files of one category.
+
+        Args:
+            category: Category directory name (e.g. 'general', 'languages')
+
+        Returns:
+            Sorted list of normalized file paths
+        """
+        return list(self.refresh().get(category, []))
+
+    def get_files_by_category(
+        self,
+    ) -> Tuple[List[str], List[str], List[str], List[str], List[str]]:
+        """
+        Get rule files organized by category.
+
+        Returns:
+            Tuple of (general_files, system_files, project_files, language_files,
+            cline_files)
+        """
+        files = self.refresh()
+        return (
+            list(files.get("general", [])),
+            list(files.get("system", [])),
+            list(files.get("project", [])),
+            list(files.get("languages", [])),
+            list(files.get("cline", [])),
+        )
+
+
+_shared_catalog: Optional[RuleCatalog] = None
+
+
+def get_shared_catalog() -> RuleCatalog:
+    """
+    Get the process-wide rule catalog.
+
+    Returns:
+        Shared RuleCatalog instance
+    """
+    global _shared_catalog
+    if _shared_catalog is None:
+        _shared_catalog = RuleCatalog()
+    return _shared_catalog
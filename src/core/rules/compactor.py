@@ -0,0 +1,214 @@
+"""Compaction of merged rule files before they are written to .clinerules."""
+
+import re
+from typing import Dict, List, Tuple
+from src.core.block_tree import (
+    DocumentTree,
+    FENCE_PATTERN,
+    LIST_ITEM_PATTERN,
+    TreeNode,
+    single_block_tree,
+)
+from src.core.markers import is_marker
+
+# Node kinds holding a single rule
+RULE_KINDS = ("paragraph", "list_item")
+
+# Shorter rules (e.g. 'Example:') are too generic to treat as duplicates
+MIN_RULE_LENGTH = 12
+
+SPACES_PATTERN = re.compile(r"[ \t]+")
+
+# (line_start, line_end) range to remove
+LineRange = Tuple[int, int]
+
+
+def normalize_rule(text: str) -> str:
+    """
+    Normalize a rule so equal rules compare equal across files.
+
+    The list marker, case, whitespace and a trailing period are ignored.
+
+    Args:
+        text: Paragraph or list item text
+
+    Returns:
+        Normalized rule text
+    """
+    match = LIST_ITEM_PATTERN.match(text)
+    if match:
+        text = text[match.end():]
+    return " ".join(text.lower().split()).rstrip(".")
+
+
+def collapse_whitespace(text: str) -> str:
+    """
+    Remove redundant whitespace outside code fences.
+
+    Trailing whitespace and runs of inner spaces are dropped and runs of
+    blank lines become one; indentation and fenced code are kept as is.
+
+    Args:
+        text: Markdown text
+
+    Returns:
+        Compacted text without surrounding whitespace
+    """
+    lines: List[str] = []
+    fence = None
+    for line in text.replace("\r\n", "\n").split("\n"):
+        if fence is not None:
+            lines.append(line)
+            if line.strip().startswith(fence):
+                fence = None
+            continue
+
+        fence_match = FENCE_PATTERN.match(line)
+        if fence_match:
+            fence = fence_match.group(1)
+            lines.append(line.rstrip())
+            continue
+
+        stripped = line.strip()
+        if not stripped:
+            if lines and lines[-1]:
+                lines.append("")
+            continue
+
+        indent = line[: len(line) - len(line.lstrip())]
+        lines.append(indent + SPACES_PATTERN.sub(" ", stripped))
+    return "\n".join(lines).strip()
+
+
+class OutputCompactor:
+    """Shrinks merged rule files without changing the rules they contain."""
+
+    def __init__(self, collapse: bool = True, drop_duplicates: bool = True):
+        """
+        Initialize OutputCompactor.
+
+        Args:
+            collapse: Whether to collapse redundant whitespace
+            drop_duplicates: Whether to drop rules already seen in an earlier file
+        """
+        self.collapse = collapse
+        self.drop_duplicates = drop_duplicates
+
+    def _duplicate_ranges(
+        self, tree: DocumentTree, node: TreeNode, seen: Dict[str, int], segment: int
+    ) -> Tuple[List[LineRange], bool]:
+        """
+        Find the lines of rules below a node that an earlier segment contains.
+
+        Args:
+            tree: Tree of the segment
+            node: Block or section to examine
+            seen: Normalized rule -> first segment containing it (updated in place)
+            segment: Number of the segment being examined
+
+        Returns:
+            Tuple of (line ranges to remove, whether every child is removed)
+        """
+        ranges: List[LineRange] = []
+        removed_all = bool(node.children)
+        children = node.children
+        number = 0
+        while number < len(children):
+            child = children[number]
+            number += 1
+            if child.kind == "section":
+                child_ranges, child_removed = self._duplicate_ranges(
+                    tree, child, seen, segment
+                )
+                if child_removed and not is_marker(tree.lines[child.line_start]):
+                    # Drop the heading together with its emptied section
+                    ranges.append((child.line_start, child.line_end))
+                else:
+                    ranges.extend(child_ranges)
+                    removed_all = False
+                continue
+
+            if child.kind in RULE_KINDS:
+                # A rule owns the more deeply indented items, paragraphs and
+                # code that follow it, so it is kept or dropped as a whole
+                indent = self._indent(tree, child)
+                line_end = child.line_end
+                while (
+                    number < len(children)
+                    and children[number].kind != "section"
+                    and self._indent(tree, children[number]) > indent
+                ):
+                    line_end = children[number].line_end
+                    number += 1
+
+                rule = normalize_rule("".join(tree.lines[child.line_start:line_end]))
+                # Lines ending in ':' introduce what follows, e.g. an example
+                if len(rule) >= MIN_RULE_LENGTH and not rule.endswith(":"):
+                    first = seen.setdefault(rule, segment)
+                    if first != segment:
+                        ranges.append((child.line_start, line_end))
+                        continue
+            removed_all = False
+        return ranges, removed_all
+
+    @staticmethod
+    def _indent(tree: DocumentTree, node: TreeNode) -> int:
+        """
+        Get the indentation of a node's first line.
+
+        Args:
+            tree: Tree of the segment
+            node: Content node
+
+        Returns:
+            Number of leading whitespace characters
+        """
+        line = tree.lines[node.line_start]
+        return len(line) - len(line.lstrip())
+
+    def remove_duplicates(self, text: str, seen: Dict[str, int], segment: int) -> str:
+        """
+        Drop rules of a segment that already appeared in an earlier one.
+
+        Repeats within the same segment are kept. Sections left without
+        content lose their heading as well.
+
+        Args:
+            text: Content of one rule file
+            seen: Normalized rule -> first segment containing it (updated in place)
+            segment: Number of the segment
+
+        Returns:
+            Segment without duplicated rules
+        """
+        tree, block = single_block_tree(text)
+        ranges, _ = self._duplicate_ranges(tree, block, seen, segment)
+        if not ranges:
+            return text
+
+        removed = set()
+        for start, end in ranges:
+            removed.update(range(start, end))
+        return "".join(
+            line for number, line in enumerate(tree.lines) if number not in removed
+        )
+
+    def compact(self, segments: List[str]) -> List[str]:
+        """
+        Compact the segments of a merge in order.
+
+        Args:
+            segments: Content of each selected file, in output order
+
+        Returns:
+            Compacted segments (same order and length)
+        """
+        seen: Dict[str, int] = {}
+        compacted = []
+        for number, segment in enumerate(segments):
+            if self.drop_duplicates:
+                segment = self.remove_duplicates(segment, seen, number)
+            if self.collapse:
+                segment = collapse_whitespace(segment)
+            compacted.append(segment.strip())
+        return compacted
@@ -6,8 +6,10 @@ from typing import Dict, List
 # Directory paths
 CLINERULES_DIR = os.path.join(os.getcwd(), "clinerules")
 OUTPUT_DIR = os.path.join(os.getcwd(), "output")
+CACHE_DIR = os.path.join(os.getcwd(), ".cache")
 
 # File patterns
+RULE_FILE_PATTERN = "clinerules*.md"
 GENERAL_PATTERN = os.path.join(CLINERULES_DIR, "general", "clinerules*.md")
 SYSTEM_PATTERN = os.path.join(CLINERULES_DIR, "system", "clinerules*.md")
 PROJECT_PATTERN = os.path.join(CLINERULES_DIR, "project", "clinerules*.md")
@@ -16,6 +18,21 @@ CLINE_PATTERN = os.path.join(CLINERULES_DIR, "cline", "clinerules*.md")
 
 # Output file
 OUTPUT_FILE = os.path.join(OUTPUT_DIR, ".clinerules")
+SELECTION_FILE = os.path.join(OUTPUT_DIR, ".clinerules.selection.json")
+
+# Hash cache
+HASH_CACHE_FILE = os.path.join(CACHE_DIR, "hash_cache.sqlite")
+HASH_CACHE_MAX_ENTRIES = 50000
+HASH_CACHE_MAX_AGE_DAYS = 30
+
+# Block version store
+BLOCK_STORE_DIR = os.path.join(CACHE_DIR, "blocks")
+
+# Parsed-document cache shared by comparer, updater and daemon
+DOCUMENT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# Daemon socket
+DAEMON_SOCKET = os.path.join(CACHE_DIR, "daemon.sock")
 
 # Directory structure for validation
 DIRECTORY_STRUCTURE: Dict[str, List[str]] = {
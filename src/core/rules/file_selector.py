@@ -1,17 +1,13 @@
 """File selection functionality for clinerules files."""
 
 import os
-from typing import List, Optional, Tuple
-from src.utils.logging_config import setup_logger
+from typing import TYPE_CHECKING, List, Optional, Tuple
+from src.utils.logging_config import setup_logger, flush_logging
 from src.utils.input_handler import InputHandler
-from src.core.file_manager import FileManager
-from .config import (
-    GENERAL_PATTERN,
-    SYSTEM_PATTERN,
-    PROJECT_PATTERN,
-    LANGUAGE_PATTERN,
-    CLINE_PATTERN,
-)
+from .catalog import RuleCatalog, get_shared_catalog
+
+if TYPE_CHECKING:
+    from src.core.block_stats import BlockStats
 
 logger = setup_logger(__name__)
 
@@ -19,24 +15,56 @@ logger = setup_logger(__name__)
 class FileSelector:
     """Handles selection of clinerules files."""
 
-    def __init__(self):
-        """Initialize FileSelector with required components."""
-        self.file_manager = FileManager()
+    def __init__(
+        self,
+        catalog: Optional[RuleCatalog] = None,
+        block_stats: Optional["BlockStats"] = None,
+    ):
+        """
+        Initialize FileSelector with required components.
+
+        Args:
+            catalog: Rule catalog to list files from (defaults to the shared one)
+            block_stats: Optional sizer used to show the running token total
+                while selecting
+        """
+        self.catalog = catalog or get_shared_catalog()
         self.input_handler = InputHandler()
+        self.block_stats = block_stats
+        self.selected_tokens = 0
 
-    def get_files_by_category(self) -> Tuple[List[str], List[str], List[str], List[str]]:
+    def track_selection(self, file_path: Optional[str]) -> None:
+        """
+        Add a selected file to the running token total and print the total.
+
+        Args:
+            file_path: Selected file path (None if the section was skipped)
+        """
+        if file_path is None or self.block_stats is None:
+            return
+
+        size = self.block_stats.local_file_stats(file_path)
+        if size is None:
+            return
+        self.selected_tokens += size.tokens
+        # Keep the total below messages still queued for the log writer
+        flush_logging()
+        print(
+            f"{os.path.basename(file_path)}: ~{size.tokens:,} tokens, "
+            f"running total ~{self.selected_tokens:,} tokens"
+        )
+
+    def get_files_by_category(
+        self,
+    ) -> Tuple[List[str], List[str], List[str], List[str], List[str]]:
         """
         Get files organized by category.
 
         Returns:
-            Tuple of (general_files, system_files, project_files, language_files)
+            Tuple of (general_files, system_files, project_files, language_files,
+            cline_files)
         """
-        general_files = self.file_manager.list_files(GENERAL_PATTERN)
-        system_files = self.file_manager.list_files(SYSTEM_PATTERN)
-        project_files = self.file_manager.list_files(PROJECT_PATTERN)
-        language_files = self.file_manager.list_files(LANGUAGE_PATTERN)
-        cline_files = self.file_manager.list_files(CLINE_PATTERN)
-        return general_files, system_files, project_files, language_files, cline_files
+        return self.catalog.get_files_by_category()
 
     def display_files_by_category(
         self,
@@ -54,6 +82,7 @@ class FileSelector:
             system_files: List of system rule files
             project_files: List of project rule files
             language_files: List of language rule files
+            cline_files: List of cline rule files
         """
         current_number = 1
         if cline_files:
@@ -84,7 +113,7 @@ class FileSelector:
         Returns:
             Selected general file path or None if no selection made
         """
-        general_files = self.file_manager.list_files(GENERAL_PATTERN)
+        general_files = self.catalog.get_files("general")
         if not general_files:
             logger.info("No general files found")
             return None
@@ -102,7 +131,7 @@ class FileSelector:
         Returns:
             Selected system file path or None if no selection made
         """
-        system_files = self.file_manager.list_files(SYSTEM_PATTERN)
+        system_files = self.catalog.get_files("system")
         if not system_files:
             logger.info("No system files found")
             return None
@@ -120,7 +149,7 @@ class FileSelector:
         Returns:
             Selected project file path or None if no selection made
         """
-        project_files = self.file_manager.list_files(PROJECT_PATTERN)
+        project_files = self.catalog.get_files("project")
         if not project_files:
             logger.info("No project files found")
             return None
@@ -138,7 +167,7 @@ class FileSelector:
         Returns:
             List of selected language file paths
         """
-        language_files = self.file_manager.list_files(LANGUAGE_PATTERN)
+        language_files = self.catalog.get_files("languages")
         if not language_files:
             logger.info("No language files found")
             return []
@@ -159,7 +188,8 @@ class FileSelector:
             if choice is None:
                 break
             selected.append(choice)
-            logger.info(f"Added {os.path.basename(choice)}")
+            logger.info("Added %s", os.path.basename(choice))
+            self.track_selection(choice)
 
         return selected
 
@@ -170,7 +200,7 @@ class FileSelector:
         Returns:
             Selected cline file path or None if no selection made
         """
-        cline_files = self.file_manager.list_files(CLINE_PATTERN)
+        cline_files = self.catalog.get_files("cline")
         if not cline_files:
             logger.info("No cline files found")
             return None
@@ -189,12 +219,17 @@ class FileSelector:
             List of all selected file paths
         """
         all_files = []
+        self.selected_tokens = 0
 
         # Select files from each section
         cline_file = self.select_cline_file()
+        self.track_selection(cline_file)
         general_file = self.select_general_file()
+        self.track_selection(general_file)
         system_file = self.select_system_file()
+        self.track_selection(system_file)
         project_file = self.select_project_file()
+        self.track_selection(project_file)
         language_files = self.select_language_files()
 
         # Collect only selected files
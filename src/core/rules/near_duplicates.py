@@ -0,0 +1,316 @@
+"""Detection of near-duplicate rules across rule files with MinHash and LSH."""
+
+import hashlib
+import random
+import re
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+from src.utils.logging_config import setup_logger
+from src.core.block_tree import single_block_tree
+from src.core.document_cache import DocumentCache, get_shared_document_cache
+from src.core.tokens import TokenCounter, get_shared_token_counter
+from src.utils.profiling import span
+from .compactor import RULE_KINDS, normalize_rule
+
+logger = setup_logger(__name__)
+
+WORD_PATTERN = re.compile(r"\w+")
+
+# Rules are compared as sets of overlapping word n-grams of this length
+SHINGLE_SIZE = 3
+
+# Rules with fewer words are too generic to report
+MIN_RULE_WORDS = 5
+
+# Signature length = LSH_BANDS * LSH_ROWS. Pairs become candidates at a
+# similarity of about (1 / bands) ** (1 / rows), here roughly 0.42.
+LSH_BANDS = 32
+LSH_ROWS = 4
+
+# Modulus of the permutations h -> (a * h + b) % MINHASH_PRIME
+MINHASH_PRIME = (1 << 61) - 1
+
+# Fixed so repeated runs report the same clusters
+MINHASH_SEED = 1
+
+
+class RuleUnit(NamedTuple):
+    """A paragraph or list item of a rule file."""
+
+    source: str
+    line: int
+    text: str
+
+
+class DuplicateCluster(NamedTuple):
+    """Rules similar enough to be factored into one shared rule."""
+
+    # (rule, similarity to the first rule), most frequent variant first
+    members: List[Tuple[RuleUnit, float]]
+    files: int
+    repeated_tokens: int
+
+
+class _UnionFind:
+    """Disjoint sets over 0..size-1."""
+
+    def __init__(self, size: int):
+        """
+        Initialize _UnionFind.
+
+        Args:
+            size: Number of elements
+        """
+        self.parents = list(range(size))
+
+    def find(self, item: int) -> int:
+        """
+        Get the representative of an element's set.
+
+        Args:
+            item: Element
+
+        Returns:
+            Representative element
+        """
+        while self.parents[item] != item:
+            self.parents[item] = self.parents[self.parents[item]]
+            item = self.parents[item]
+        return item
+
+    def union(self, first: int, second: int) -> None:
+        """
+        Merge the sets of two elements.
+
+        Args:
+            first: Element of the first set
+            second: Element of the second set
+        """
+        self.parents[self.find(first)] = self.find(second)
+
+
+def shingles(text: str) -> Set[int]:
+    """
+    Hash the word n-grams of a normalized rule.
+
+    Args:
+        text: Normalized rule text
+
+    Returns:
+        Set of 64-bit shingle hashes
+    """
+    words = WORD_PATTERN.findall(text)
+    grams = [
+        " ".join(words[i:i + SHINGLE_SIZE])
+        for i in range(max(len(words) - SHINGLE_SIZE + 1, 1))
+    ]
+    return {
+        int.from_bytes(
+            hashlib.blake2b(gram.encode("utf-8"), digest_size=8).digest(), "big"
+        )
+        for gram in grams
+    }
+
+
+def jaccard(first: Set[int], second: Set[int]) -> float:
+    """
+    Get the Jaccard similarity of two shingle sets.
+
+    Args:
+        first: Shingle set
+        second: Shingle set
+
+    Returns:
+        Size of the intersection divided by the size of the union
+    """
+    if not first and not second:
+        return 1.0
+    return len(first & second) / len(first | second)
+
+
+class NearDuplicateFinder:
+    """
+    Clusters similar rules of many files without comparing every pair.
+
+    Each distinct rule gets a MinHash signature of its word shingles; rules
+    sharing all rows of any LSH band become candidates, and only candidates
+    have their exact Jaccard similarity computed.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.7,
+        min_words: int = MIN_RULE_WORDS,
+        document_cache: Optional[DocumentCache] = None,
+        token_counter: Optional[TokenCounter] = None,
+    ):
+        """
+        Initialize NearDuplicateFinder with required components.
+
+        Args:
+            threshold: Minimum Jaccard similarity of rules in one cluster
+            min_words: Ignore rules with fewer words
+            document_cache: Cache used to read and index files (defaults to the
+                shared one)
+            token_counter: Token estimator (defaults to the shared one)
+        """
+        self.threshold = threshold
+        self.min_words = min_words
+        self.document_cache = document_cache or get_shared_document_cache()
+        self.token_counter = token_counter or get_shared_token_counter()
+        generator = random.Random(MINHASH_SEED)
+        self.permutations = [
+            (generator.randrange(1, MINHASH_PRIME), generator.randrange(MINHASH_PRIME))
+            for _ in range(LSH_BANDS * LSH_ROWS)
+        ]
+
+    def collect_units(self, files: List[str]) -> List[RuleUnit]:
+        """
+        Split rule files into paragraphs and list items.
+
+        Args:
+            files: Paths of rule files
+
+        Returns:
+            Rules with at least min_words words, in file order
+        """
+        units = []
+        for file_path in files:
+            content = self.document_cache.read(file_path)
+            if content is None:
+                continue
+
+            tree, block = single_block_tree(content)
+            nodes = block.children + [
+                child for section in tree.sections(block) for child in section.children
+            ]
+            for node in sorted(nodes, key=lambda node: node.line_start):
+                if node.kind not in RULE_KINDS:
+                    continue
+                text = tree.text(node)
+                # Lines ending in ':' introduce an example rather than state a rule
+                if normalize_rule(text).endswith(":"):
+                    continue
+                if len(WORD_PATTERN.findall(text)) >= self.min_words:
+                    units.append(RuleUnit(file_path, node.line_start + 1, text))
+        return units
+
+    def signature(self, shingle_set: Set[int]) -> Tuple[int, ...]:
+        """
+        Compute the MinHash signature of a shingle set.
+
+        Args:
+            shingle_set: Shingle hashes of a rule
+
+        Returns:
+            Minimum of every permutation over the set
+        """
+        return tuple(
+            min((a * value + b) % MINHASH_PRIME for value in shingle_set)
+            for a, b in self.permutations
+        )
+
+    @staticmethod
+    def candidate_pairs(signatures: List[Tuple[int, ...]]) -> Set[Tuple[int, int]]:
+        """
+        Find pairs of signatures that agree on all rows of some band.
+
+        Args:
+            signatures: MinHash signature per distinct rule
+
+        Returns:
+            Set of (lower, higher) indexes into signatures
+        """
+        pairs: Set[Tuple[int, int]] = set()
+        for band in range(LSH_BANDS):
+            start = band * LSH_ROWS
+            buckets: Dict[Tuple[int, ...], List[int]] = {}
+            for number, signature in enumerate(signatures):
+                key = signature[start:start + LSH_ROWS]
+                buckets.setdefault(key, []).append(number)
+            for bucket in buckets.values():
+                for i, first in enumerate(bucket):
+                    for second in bucket[i + 1:]:
+                        pairs.add((first, second))
+        return pairs
+
+    def find_clusters(self, files: List[str]) -> List[DuplicateCluster]:
+        """
+        Cluster the near-duplicate rules of rule files.
+
+        Args:
+            files: Paths of rule files
+
+        Returns:
+            Clusters with at least two rules, most repeated tokens first
+        """
+        with span("duplicates.find") as stage:
+            units = self.collect_units(files)
+            stage.add_bytes(sum(len(unit.text) for unit in units))
+
+            # Identical rules share one variant so they are hashed once
+            variants: Dict[str, List[RuleUnit]] = {}
+            for unit in units:
+                variants.setdefault(normalize_rule(unit.text), []).append(unit)
+            texts = list(variants)
+            shingle_sets = [shingles(text) for text in texts]
+            signatures = [self.signature(shingle_set) for shingle_set in shingle_sets]
+
+            groups = _UnionFind(len(texts))
+            candidates = self.candidate_pairs(signatures)
+            for first, second in candidates:
+                if jaccard(shingle_sets[first], shingle_sets[second]) >= self.threshold:
+                    groups.union(first, second)
+            logger.debug(
+                "Compared %d candidate pairs of %d distinct rules from %d rules",
+                len(candidates),
+                len(texts),
+                len(units),
+            )
+
+            members: Dict[int, List[int]] = {}
+            for number in range(len(texts)):
+                members.setdefault(groups.find(number), []).append(number)
+
+            clusters = []
+            for numbers in members.values():
+                if sum(len(variants[texts[number]]) for number in numbers) < 2:
+                    continue
+                clusters.append(
+                    self._build_cluster(numbers, texts, variants, shingle_sets)
+                )
+
+        clusters.sort(key=lambda cluster: (-cluster.repeated_tokens, -cluster.files))
+        return clusters
+
+    def _build_cluster(
+        self,
+        numbers: List[int],
+        texts: List[str],
+        variants: Dict[str, List[RuleUnit]],
+        shingle_sets: List[Set[int]],
+    ) -> DuplicateCluster:
+        """
+        Describe one group of similar variants.
+
+        Args:
+            numbers: Indexes of the variants in the group
+            texts: Normalized text of every variant
+            variants: Rules per normalized text
+            shingle_sets: Shingle set of every variant
+
+        Returns:
+            Cluster with the similarity of each rule to the most frequent one
+        """
+        numbers = sorted(numbers, key=lambda number: -len(variants[texts[number]]))
+        reference = shingle_sets[numbers[0]]
+        rules: List[Tuple[RuleUnit, float]] = []
+        for number in numbers:
+            similarity = jaccard(reference, shingle_sets[number])
+            rules.extend((unit, similarity) for unit in variants[texts[number]])
+
+        tokens = [self.token_counter.count(unit.text) for unit, _ in rules]
+        return DuplicateCluster(
+            rules,
+            len({unit.source for unit, _ in rules}),
+            sum(tokens) - max(tokens),
+        )
@@ -1,10 +1,16 @@
 """Output handling functionality for clinerules files."""
 
 import os
-from typing import List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 from src.utils.logging_config import setup_logger
 from src.core.file_manager import FileManager
-from .config import OUTPUT_DIR, OUTPUT_FILE
+from src.core.tokens import TokenCounter, get_shared_token_counter
+from src.utils.profiling import span
+from .compactor import OutputCompactor
+from .config import OUTPUT_DIR, OUTPUT_FILE, SELECTION_FILE
+
+if TYPE_CHECKING:
+    from src.core.block_store import BlockStore
 
 logger = setup_logger(__name__)
 
@@ -12,9 +18,61 @@ logger = setup_logger(__name__)
 class OutputHandler:
     """Handles output file creation and management."""
 
-    def __init__(self):
-        """Initialize OutputHandler with required components."""
+    def __init__(
+        self,
+        block_store: Optional["BlockStore"] = None,
+        compactor: Optional[OutputCompactor] = None,
+        max_tokens: Optional[int] = None,
+        token_counter: Optional[TokenCounter] = None,
+    ):
+        """
+        Initialize OutputHandler with required components.
+
+        Args:
+            block_store: Optional store recording the blocks of created files
+            compactor: Optional compaction stage applied to merged files
+            max_tokens: Refuse to write output estimated above this many tokens
+            token_counter: Token estimator (defaults to the shared one)
+        """
         self.file_manager = FileManager()
+        self.block_store = block_store
+        self.compactor = compactor
+        self.max_tokens = max_tokens
+        self.token_counter = token_counter or get_shared_token_counter()
+        # path -> (mtime_ns, size, stripped content) of previously merged files
+        self.segments: Dict[str, Tuple[int, int, str]] = {}
+        # (file, tokens before, tokens after compaction) of the last merge
+        self.token_report: List[Tuple[str, int, int]] = []
+
+    def read_segment(self, file: str) -> Optional[str]:
+        """
+        Read a file's stripped content, reusing the cached copy if unchanged.
+
+        Args:
+            file: Path to the file
+
+        Returns:
+            Stripped file content or None if file cannot be read
+        """
+        try:
+            stat = os.stat(file)
+        except OSError as e:
+            logger.error("Error reading file %s: %s", file, e)
+            self.segments.pop(file, None)
+            return None
+
+        cached = self.segments.get(file)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+
+        file_content = self.file_manager.read_file(file)
+        if file_content is None:
+            self.segments.pop(file, None)
+            return None
+
+        segment = file_content.strip()
+        self.segments[file] = (stat.st_mtime_ns, stat.st_size, segment)
+        return segment
 
     def ensure_output_directory(self) -> bool:
         """
@@ -28,13 +86,17 @@ class OutputHandler:
                 os.makedirs(OUTPUT_DIR)
             return True
         except Exception as e:
-            logger.error(f"Error creating output directory: {e}")
+            logger.error("Error creating output directory: %s", e)
             return False
 
     def merge_files(self, files: List[str]) -> Optional[str]:
         """
         Merge content from multiple files.
 
+        Files unchanged since the previous merge are served from the segment
+        cache. With a compactor, segments are compacted and the token count of
+        each file before and after is kept in token_report.
+
         Args:
             files: List of file paths to merge
 
@@ -46,18 +108,69 @@ class OutputHandler:
             return None
 
         try:
-            content = []
-            for file in files:
-                file_content = self.file_manager.read_file(file)
-                if file_content is not None:
-                    content.append(file_content.strip())
-                else:
-                    return None
-            return "\n\n".join(content)
+            with span("output.merge") as stage:
+                content = []
+                for file in files:
+                    segment = self.read_segment(file)
+                    if segment is None:
+                        return None
+                    content.append(segment)
+
+                if self.compactor is not None:
+                    compacted = self.compactor.compact(content)
+                    count = self.token_counter.count
+                    self.token_report = [
+                        (file, count(before), count(after))
+                        for file, before, after in zip(files, content, compacted)
+                    ]
+                    content = [segment for segment in compacted if segment]
+                merged = "\n\n".join(content)
+                stage.add_bytes(len(merged))
+            return merged
         except Exception as e:
-            logger.error(f"Error merging files: {e}")
+            logger.error("Error merging files: %s", e)
             return None
 
+    def save_selection(self, files: List[str]) -> bool:
+        """
+        Remember the selected files for later runs.
+
+        Args:
+            files: Selected file paths
+
+        Returns:
+            True if selection was saved, False otherwise
+        """
+        import json
+
+        if not self.ensure_output_directory():
+            return False
+        return self.file_manager.write_file(
+            SELECTION_FILE, json.dumps({"files": files}, indent=2)
+        )
+
+    def load_selection(self) -> List[str]:
+        """
+        Load the previously saved selection.
+
+        Returns:
+            Previously selected file paths (empty if none saved)
+        """
+        if not os.path.exists(SELECTION_FILE):
+            return []
+
+        content = self.file_manager.read_file(SELECTION_FILE)
+        if content is None:
+            return []
+
+        import json
+
+        try:
+            return list(json.loads(content).get("files", []))
+        except (ValueError, AttributeError) as e:
+            logger.error("Invalid selection file %s: %s", SELECTION_FILE, e)
+            return []
+
     def create_output_file(self, content: str) -> bool:
         """
         Create output file with provided content.
@@ -91,12 +204,51 @@ class OutputHandler:
         if merged_content is None:
             return False
 
+        if self.max_tokens is not None:
+            tokens = self.token_counter.count(merged_content)
+            if tokens > self.max_tokens:
+                logger.error(
+                    "Output needs about %s tokens, more than the budget of %s",
+                    f"{tokens:,}",
+                    f"{self.max_tokens:,}",
+                )
+                return False
+
         if not self.create_output_file(merged_content):
             return False
 
-        logger.info(f"Files merged successfully into {OUTPUT_FILE}")
+        if self.block_store is not None:
+            self.block_store.record_content(merged_content, OUTPUT_FILE, "create")
+
+        logger.info("Files merged successfully into %s", OUTPUT_FILE)
         logger.info("Merged files:")
         for file in files:
-            logger.info(f"- {os.path.basename(file)}")
+            logger.info("- %s", os.path.basename(file), extra={"tally": "merged"})
 
         return True
+
+    def format_token_report(self) -> str:
+        """
+        Format the token counts of the last compacted merge.
+
+        Returns:
+            Table of estimated tokens per file before and after compaction
+            (empty if nothing was compacted)
+        """
+        if not self.token_report:
+            return ""
+
+        rows = [
+            (os.path.basename(file), before, after)
+            for file, before, after in self.token_report
+        ]
+        total_before = sum(before for _, before, _ in rows)
+        total_after = sum(after for _, _, after in rows)
+        rows.append(("Total", total_before, total_after))
+
+        width = max(len(name) for name, _, _ in rows)
+        lines = [f"{'File'.ljust(width)}  {'Before':>8}  {'After':>8}  {'Saved':>6}"]
+        for name, before, after in rows:
+            saved = f"{(before - after) / before:.0%}" if before else "-"
+            lines.append(f"{name.ljust(width)}  {before:>8,}  {after:>8,}  {saved:>6}")
+        return "\n".join(lines)
@@ -59,6 +59,6 @@ def validate_files_exist(files: List[str]) -> bool:
     """
     for file in files:
         if not os.path.exists(file):
-            logger.error(f"File not found: {file}")
+            logger.error("File not found: %s", file)
             return False
     return True
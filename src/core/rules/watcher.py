@@ -0,0 +1,149 @@
+"""Change detection for the clinerules source directories."""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from typing import Dict, List, Optional, Set, Tuple
+from src.utils.logging_config import setup_logger
+from .config import DIRECTORY_STRUCTURE
+
+logger = setup_logger(__name__)
+
+# inotify event mask: file written, moved, created or deleted
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+IN_NONBLOCK = os.O_NONBLOCK
+EVENT_HEADER = struct.Struct("iIII")
+
+# (mtime_ns, size) per file path
+Snapshot = Dict[str, Tuple[int, int]]
+
+
+class RulesWatcher:
+    """Watches the clinerules subdirectories using inotify or polling."""
+
+    def __init__(self, base_dir: Optional[str] = None, interval: float = 1.0):
+        """
+        Initialize RulesWatcher.
+
+        Args:
+            base_dir: Directory containing the clinerules tree (defaults to cwd)
+            interval: Polling interval in seconds (also the inotify wait timeout)
+        """
+        base_dir = base_dir or os.getcwd()
+        self.interval = interval
+        self.directories = [
+            os.path.join(base_dir, parent, subdir)
+            for parent, subdirs in DIRECTORY_STRUCTURE.items()
+            for subdir in subdirs
+        ]
+        self.snapshot = self.take_snapshot()
+        self.inotify_fd = self._init_inotify()
+
+    def _init_inotify(self) -> Optional[int]:
+        """
+        Set up inotify watches on all directories.
+
+        Returns:
+            inotify file descriptor or None if inotify is unavailable
+        """
+        if not sys.platform.startswith("linux"):
+            return None
+
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+            fd = libc.inotify_init1(IN_NONBLOCK)
+            if fd < 0:
+                return None
+            for directory in self.directories:
+                if os.path.isdir(directory):
+                    libc.inotify_add_watch(fd, directory.encode(), WATCH_MASK)
+            logger.info("Watching rule directories with inotify")
+            return fd
+        except (OSError, AttributeError) as e:
+            logger.info("inotify unavailable, falling back to polling: %s", e)
+            return None
+
+    def take_snapshot(self) -> Snapshot:
+        """
+        Record modification time and size of every file in the watched directories.
+
+        Returns:
+            Mapping of normalized file path to (mtime_ns, size)
+        """
+        snapshot: Snapshot = {}
+        for directory in self.directories:
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_file():
+                            stat = entry.stat()
+                            snapshot[os.path.normpath(entry.path)] = (
+                                stat.st_mtime_ns,
+                                stat.st_size,
+                            )
+            except OSError:
+                continue
+        return snapshot
+
+    def _wait(self) -> None:
+        """Block until inotify reports activity or the interval elapses."""
+        if self.inotify_fd is None:
+            time.sleep(self.interval)
+            return
+
+        readable, _, _ = select.select([self.inotify_fd], [], [], self.interval)
+        if readable:
+            # Drain pending events; the snapshot comparison decides what changed
+            try:
+                while os.read(self.inotify_fd, 64 * EVENT_HEADER.size + 4096):
+                    pass
+            except BlockingIOError:
+                pass
+
+    def wait_for_changes(self) -> Set[str]:
+        """
+        Block until at least one watched file changes.
+
+        Returns:
+            Set of normalized paths that were modified, created or deleted
+        """
+        while True:
+            self._wait()
+            current = self.take_snapshot()
+            changed = {
+                path
+                for path in set(current) | set(self.snapshot)
+                if current.get(path) != self.snapshot.get(path)
+            }
+            self.snapshot = current
+            if changed:
+                return changed
+
+    def close(self) -> None:
+        """Release the inotify file descriptor."""
+        if self.inotify_fd is not None:
+            os.close(self.inotify_fd)
+            self.inotify_fd = None
+
+    @staticmethod
+    def affected(changed: Set[str], selection: List[str]) -> List[str]:
+        """
+        Filter changed paths down to the selected files.
+
+        Args:
+            changed: Changed paths
+            selection: Selected file paths
+
+        Returns:
+            Selected files that changed
+        """
+        return [f for f in selection if os.path.normpath(f) in changed]
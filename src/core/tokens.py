@@ -0,0 +1,204 @@
+"""Offline estimate of how many model tokens a piece of text costs."""
+
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from typing import NamedTuple, Optional
+
+# Pre-tokenizer in the style of byte-pair encoders: contractions, words and
+# digit groups with their leading space, punctuation runs and whitespace runs
+PRETOKEN_PATTERN = re.compile(
+    r"'(?:s|t|re|ve|m|ll|d)"
+    r"| ?[A-Za-z]+"
+    r"| ?\d{1,3}"
+    r"| ?[^\sA-Za-z\d]+"
+    r"|\s+"
+)
+
+# camelCase and ALLCAPS boundaries, which encoders rarely merge across
+SUBWORD_PATTERN = re.compile(r"[A-Z]?[a-z]+|[A-Z]+(?![a-z])")
+
+# Words up to this length are usually a single merged token
+COMMON_WORD_LENGTH = 7
+
+# Longer words are split into pieces of roughly this many characters
+CHARS_PER_SUBWORD = 4
+
+# Punctuation runs such as '**' or '```' merge into pieces of this size
+CHARS_PER_SYMBOL_TOKEN = 2
+
+# Number of memoized texts kept by a TokenCounter
+TOKEN_CACHE_SIZE = 4096
+
+
+class TextStats(NamedTuple):
+    """Size of a piece of text."""
+
+    chars: int
+    lines: int
+    tokens: int
+
+
+def _word_tokens(word: str) -> int:
+    """
+    Estimate the tokens of a run of ASCII letters.
+
+    Args:
+        word: Letters without surrounding whitespace
+
+    Returns:
+        Estimated number of tokens
+    """
+    count = 0
+    for subword in SUBWORD_PATTERN.findall(word) or [word]:
+        if len(subword) <= COMMON_WORD_LENGTH:
+            count += 1
+        else:
+            count += -(-len(subword) // CHARS_PER_SUBWORD)
+    return count
+
+
+def _symbol_tokens(symbols: str) -> int:
+    """
+    Estimate the tokens of a run of punctuation and non-ASCII characters.
+
+    Args:
+        symbols: Characters without surrounding whitespace
+
+    Returns:
+        Estimated number of tokens
+    """
+    ascii_count = sum(1 for char in symbols if char.isascii())
+    # Non-ASCII characters take at least one token each
+    return -(-ascii_count // CHARS_PER_SYMBOL_TOKEN) + len(symbols) - ascii_count
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the token count of text.
+
+    Approximates a byte-pair encoder: a leading space merges into the next
+    word, short words and digit groups of up to three are one token, long
+    words and camelCase are split into pieces, punctuation runs merge in
+    pairs and runs of whitespace are one token.
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        Estimated number of tokens
+    """
+    count = 0
+    for piece in PRETOKEN_PATTERN.findall(text):
+        body = piece.lstrip(" ")
+        if not body or body.isspace() or body[0] in "'0123456789":
+            count += 1
+        elif body.isascii() and body.isalpha():
+            count += _word_tokens(body)
+        else:
+            count += _symbol_tokens(body)
+    return count
+
+
+def measure_text(text: str, tokens: Optional[int] = None) -> TextStats:
+    """
+    Measure characters, lines and estimated tokens of text.
+
+    Args:
+        text: Text to measure
+        tokens: Token count if already known
+
+    Returns:
+        Size of the text
+    """
+    if tokens is None:
+        tokens = estimate_tokens(text)
+    return TextStats(len(text), len(text.splitlines()), tokens)
+
+
+class TokenCounter:
+    """Estimates tokens once per distinct text, keyed by its SHA-256."""
+
+    def __init__(self, max_entries: int = TOKEN_CACHE_SIZE):
+        """
+        Initialize TokenCounter.
+
+        Args:
+            max_entries: Number of counts to keep (least recently used go first)
+        """
+        self.max_entries = max_entries
+        self.counts: "OrderedDict[str, int]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def digest(text: str) -> str:
+        """
+        Get the key of a text, the same digest the block store uses.
+
+        Args:
+            text: Block or file text
+
+        Returns:
+            Hex SHA-256 of the UTF-8 encoded text
+        """
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def count(self, text: str, digest: Optional[str] = None) -> int:
+        """
+        Get the estimated token count of text.
+
+        Args:
+            text: Text to measure
+            digest: SHA-256 of text if already known
+
+        Returns:
+            Estimated number of tokens
+        """
+        if digest is None:
+            digest = self.digest(text)
+        with self._lock:
+            tokens = self.counts.get(digest)
+            if tokens is not None:
+                self.counts.move_to_end(digest)
+                self.hits += 1
+                return tokens
+            self.misses += 1
+
+        tokens = estimate_tokens(text)
+        with self._lock:
+            self.counts[digest] = tokens
+            if len(self.counts) > self.max_entries:
+                self.counts.popitem(last=False)
+        return tokens
+
+    def measure(self, text: str, digest: Optional[str] = None) -> TextStats:
+        """
+        Measure text, reusing the memoized token count.
+
+        Args:
+            text: Text to measure
+            digest: SHA-256 of text if already known
+
+        Returns:
+            Size of the text
+        """
+        return measure_text(text, self.count(text, digest))
+
+
+_shared_token_counter: Optional[TokenCounter] = None
+
+
+def get_shared_token_counter() -> TokenCounter:
+    """
+    Get the process-wide token counter.
+
+    Returns:
+        Shared TokenCounter instance
+    """
+    global _shared_token_counter
+    if _shared_token_counter is None:
+        _shared_token_counter = TokenCounter()
+    return _shared_token_counter
@@ -1,9 +1,20 @@
 """Core functionality for updating clinerules files."""
 
-from .update_handler import UpdateHandler
-from .block_updater import BlockUpdater
+import importlib
 
-__all__ = [
-    'UpdateHandler',
-    'BlockUpdater',
-]
+# Exports are resolved on first access so importing one submodule does not
+# pull in its siblings.
+_EXPORTS = {
+    'UpdateHandler': '.update_handler',
+    'BlockUpdater': '.block_updater',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    """Import exported names lazily."""
+    if name in _EXPORTS:
+        module = importlib.import_module(_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,23 +1,60 @@
 """Block update functionality for clinerules files."""
 
 import os
-from typing import Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 from src.utils.logging_config import setup_logger
 from src.core.file_manager import FileManager
-from src.core.block_extractor import BlockExtractor
+from src.core.block_index import BlockIndex
+from src.core.document_cache import DocumentCache, get_shared_document_cache
 from .update_handler import UpdateHandler
 
+if TYPE_CHECKING:
+    from src.core.block_store import BlockStore
+
 logger = setup_logger(__name__)
 
+# (local_file, block_type, local_content)
+LocalRule = Tuple[str, str, str]
+
 
 class BlockUpdater:
     """Handles block update operations for clinerules files."""
 
-    def __init__(self):
-        """Initialize BlockUpdater with required components."""
+    def __init__(
+        self,
+        fsync: bool = False,
+        block_store: Optional["BlockStore"] = None,
+        document_cache: Optional[DocumentCache] = None,
+        update_handler: Optional[UpdateHandler] = None,
+    ):
+        """
+        Initialize BlockUpdater with required components.
+
+        Args:
+            fsync: Whether to flush every written file to disk
+            block_store: Optional store recording block versions before and
+                after each update
+            document_cache: Parsed-document cache (defaults to the shared one)
+            update_handler: Update handler whose block extractor is shared
+                (defaults to a new one)
+        """
+        self.fsync = fsync
+        self.block_store = block_store
         self.file_manager = FileManager()
-        self.block_extractor = BlockExtractor()
-        self.update_handler = UpdateHandler()
+        self.document_cache = document_cache or get_shared_document_cache()
+        self.update_handler = update_handler or UpdateHandler()
+        self.block_extractor = self.update_handler.block_extractor
+
+    def record_versions(self, content: str, source: str) -> None:
+        """
+        Record the blocks of a file in the block store, if one is configured.
+
+        Args:
+            content: File content
+            source: Path of the file
+        """
+        if self.block_store is not None:
+            self.block_store.record_content(content, source, "update")
 
     def update_local_with_external(self, external_file: str, local_file: str) -> bool:
         """
@@ -31,35 +68,43 @@ class BlockUpdater:
             True if update was successful, False otherwise
         """
         try:
-            # Read file contents
-            external_content = self.file_manager.read_file(external_file)
-            if external_content is None:
-                logger.error(f"Error reading external file: {external_file}")
-                return False
-
             # Determine block type
             block_type = self.block_extractor.determine_block_type(local_file)
             if not block_type:
-                logger.error(f"Could not determine block type from path: {local_file}")
+                logger.error("Could not determine block type from path: %s", local_file)
                 return False
 
-            # Extract block from external file
-            block = self.update_handler.extract_block(
-                external_content, block_type, local_file
+            # Extract block from external file (memory-mapped if large)
+            block = self.block_extractor.extract_block_from_path(
+                external_file, block_type, local_file, self.document_cache
             )
             if block is None:
+                logger.error("Could not extract block from file: %s", local_file)
                 return False
 
+            # Keep the version about to be overwritten
+            if self.block_store is not None and os.path.exists(local_file):
+                previous = self.document_cache.read(local_file)
+                if previous is not None:
+                    self.record_versions(previous, local_file)
+
             # Write block to local file
-            if not self.file_manager.write_file(local_file, block):
-                logger.error(f"Error writing to local file: {local_file}")
+            written = self.file_manager.write_file(local_file, block, self.fsync)
+            self.document_cache.invalidate(local_file)
+            if not written:
+                logger.error("Error writing to local file: %s", local_file)
                 return False
+            self.record_versions(block, local_file)
 
-            logger.info(f"Successfully updated {os.path.basename(local_file)}")
+            logger.info(
+                "Successfully updated %s",
+                os.path.basename(local_file),
+                extra={"tally": "updated"},
+            )
             return True
 
         except Exception as e:
-            logger.error(f"Error updating local file: {e}")
+            logger.error("Error updating local file: %s", e)
             return False
 
     def update_external_with_local(self, external_file: str, local_file: str) -> bool:
@@ -75,34 +120,263 @@ class BlockUpdater:
         """
         try:
             # Read file contents
-            local_content = self.file_manager.read_file(local_file)
-            external_content = self.file_manager.read_file(external_file)
-            if local_content is None or external_content is None:
+            local_content = self.document_cache.read(local_file)
+            external_document = self.document_cache.get(external_file)
+            if local_content is None or external_document is None:
                 logger.error("Error reading files")
                 return False
+            external_content = external_document.content
 
             # Determine block type
             block_type = self.block_extractor.determine_block_type(local_file)
             if not block_type:
-                logger.error(f"Could not determine block type from path: {local_file}")
+                logger.error("Could not determine block type from path: %s", local_file)
                 return False
 
             # Replace block in external file
             updated_content = self.update_handler.replace_block(
-                external_content, local_content, block_type, local_file
+                external_content,
+                local_content,
+                block_type,
+                local_file,
+                external_document.index,
             )
             if updated_content is None:
                 return False
+            if updated_content == external_content:
+                logger.info(
+                    "Block in %s is up to date",
+                    os.path.basename(external_file),
+                    extra={"tally": "up to date"},
+                )
+                return True
 
             # Write updated content back to external file
-            if not self.file_manager.write_file(external_file, updated_content):
-                logger.error(f"Error writing to external file: {external_file}")
+            self.record_versions(external_content, external_file)
+            written = self.file_manager.write_file(
+                external_file, updated_content, self.fsync
+            )
+            self.document_cache.invalidate(external_file)
+            if not written:
+                logger.error("Error writing to external file: %s", external_file)
+                return False
+            self.record_versions(updated_content, external_file)
+
+            logger.info(
+                "Successfully updated block in %s using content from %s",
+                os.path.basename(external_file),
+                os.path.basename(local_file),
+                extra={"tally": "updated"},
+            )
+            return True
+
+        except Exception as e:
+            logger.error("Error updating external file: %s", e)
+            return False
+
+    def read_local_rules(self, local_files: List[str]) -> Optional[List[LocalRule]]:
+        """
+        Read local rule files and determine their block types.
+
+        Args:
+            local_files: Paths to local files to use
+
+        Returns:
+            List of (local_file, block_type, local_content) or None on error
+        """
+        local_rules = []
+        for local_file in local_files:
+            block_type = self.block_extractor.determine_block_type(local_file)
+            if not block_type:
+                logger.error("Could not determine block type from path: %s", local_file)
+                return None
+
+            local_content = self.document_cache.read(local_file)
+            if local_content is None:
+                logger.error("Error reading local file: %s", local_file)
+                return None
+
+            local_rules.append((local_file, block_type, local_content))
+        return local_rules
+
+    def apply_local_rules(
+        self,
+        external_content: str,
+        local_rules: List[LocalRule],
+        external_file: str,
+        index: Optional[BlockIndex] = None,
+    ) -> Optional[str]:
+        """
+        Replace all matching blocks in one pass over a single parsed view.
+
+        Args:
+            external_content: Content of the external file
+            local_rules: Local rules to apply
+            external_file: Path to external file (for messages)
+            index: Prebuilt index of external_content (built on demand if omitted)
+
+        Returns:
+            Updated content (unchanged if every block is already up to date)
+            or None if no block could be replaced
+        """
+        # Imported here so commands that never update skip loading the parser
+        from src.core.block_tree import changed_sections
+
+        if index is None:
+            index = BlockIndex(external_content)
+        replacements: Dict[int, Tuple[int, str, str]] = {}
+        unchanged = 0
+        for local_file, block_type, local_content in local_rules:
+            # Logged once below instead of also by find_block
+            entry = self.block_extractor.find_block(
+                index, block_type, local_file, warn_missing=False
+            )
+            if entry is None:
+                logger.warning(
+                    "Skipping %s: block not found in %s",
+                    os.path.basename(local_file),
+                    external_file,
+                )
+                continue
+            # Leave blocks whose content already matches untouched
+            block_text = index.block_text(entry)
+            if block_text == local_content.strip():
+                unchanged += 1
+                continue
+            sections = changed_sections(block_text, local_content)
+            if sections:
+                logger.info(
+                    "Block '%s' in %s: changed sections %s",
+                    entry.marker,
+                    external_file,
+                    ", ".join(sections),
+                    extra={"tally": "blocks changed"},
+                )
+            if entry.start in replacements:
+                logger.warning(
+                    "Block '%s' in %s is targeted by several files, using %s",
+                    entry.marker,
+                    external_file,
+                    os.path.basename(local_file),
+                )
+            replacements[entry.start] = (entry.end, local_content, local_file)
+
+        if not replacements:
+            if unchanged:
+                return external_content
+            logger.error("No matching blocks found in %s", external_file)
+            return None
+
+        # Splice from the end so earlier offsets stay valid
+        parts = []
+        position = len(external_content)
+        for start in sorted(replacements, reverse=True):
+            end, local_content, _ = replacements[start]
+            parts.append(external_content[end:position])
+            parts.append(local_content)
+            position = start
+        parts.append(external_content[:position])
+        return "".join(reversed(parts))
+
+    def update_external_with_locals(
+        self, external_file: str, local_rules: List[LocalRule]
+    ) -> bool:
+        """
+        Update several blocks of an external file with one read and one write.
+
+        Args:
+            external_file: Path to external rules file
+            local_rules: Local rules to apply (see read_local_rules)
+
+        Returns:
+            True if update was successful, False otherwise
+        """
+        try:
+            external_document = self.document_cache.get(external_file)
+            if external_document is None:
+                logger.error("Error reading external file: %s", external_file)
                 return False
 
-            logger.info(f"Successfully updated block in {os.path.basename(external_file)}")
-            logger.info(f"Using content from {os.path.basename(local_file)}")
+            external_content = external_document.content
+            updated_content = self.apply_local_rules(
+                external_content, local_rules, external_file, external_document.index
+            )
+            if updated_content is None:
+                return False
+            if updated_content == external_content:
+                logger.info(
+                    "Blocks in %s are already up to date",
+                    external_file,
+                    extra={"tally": "up to date"},
+                )
+                return True
+
+            self.record_versions(external_content, external_file)
+            written = self.file_manager.write_file(
+                external_file, updated_content, self.fsync
+            )
+            self.document_cache.invalidate(external_file)
+            if not written:
+                logger.error("Error writing to external file: %s", external_file)
+                return False
+            self.record_versions(updated_content, external_file)
+
+            logger.info(
+                "Successfully updated blocks in %s",
+                external_file,
+                extra={"tally": "updated"},
+            )
             return True
 
         except Exception as e:
-            logger.error(f"Error updating external file: {e}")
+            logger.error("Error updating external file %s: %s", external_file, e)
             return False
+
+    def update_externals_with_locals(
+        self,
+        external_files: List[str],
+        local_files: List[str],
+        workers: Optional[int] = None,
+    ) -> bool:
+        """
+        Update many external files with several local files in parallel.
+
+        Local files are read once and shared by all workers.
+
+        Args:
+            external_files: Paths to external rules files
+            local_files: Paths to local files to use
+            workers: Maximum number of concurrent updates
+
+        Returns:
+            True if every external file was updated, False otherwise
+        """
+        local_rules = self.read_local_rules(local_files)
+        if local_rules is None:
+            return False
+
+        # Imported here so single-file updates skip loading the executor machinery
+        from concurrent.futures import ThreadPoolExecutor
+
+        max_workers = workers or min(32, (os.cpu_count() or 1) + 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(
+                executor.map(
+                    lambda external_file: self.update_external_with_locals(
+                        external_file, local_rules
+                    ),
+                    external_files,
+                )
+            )
+
+        if self.fsync:
+            self.file_manager.flush_pending_syncs()
+
+        failed = results.count(False)
+        logger.info(
+            "Updated %s of %s external files using %s local files",
+            len(results) - failed,
+            len(results),
+            len(local_rules),
+        )
+        return failed == 0
@@ -3,8 +3,8 @@
 import os
 from typing import Optional, Tuple
 from src.utils.logging_config import setup_logger
-from src.core.file_manager import FileManager
 from src.core.block_extractor import BlockExtractor
+from src.core.block_index import BlockIndex
 from src.core.rules.file_selector import FileSelector
 from src.utils.input_handler import InputHandler
 
@@ -14,11 +14,20 @@ logger = setup_logger(__name__)
 class UpdateHandler:
     """Handles update operations for clinerules files."""
 
-    def __init__(self):
-        """Initialize UpdateHandler with required components."""
-        self.file_manager = FileManager()
-        self.block_extractor = BlockExtractor()
-        self.file_selector = FileSelector()
+    def __init__(
+        self,
+        block_extractor: Optional[BlockExtractor] = None,
+        file_selector: Optional[FileSelector] = None,
+    ):
+        """
+        Initialize UpdateHandler with required components.
+
+        Args:
+            block_extractor: Block extractor (defaults to a new one)
+            file_selector: Local file selector (defaults to a new one)
+        """
+        self.block_extractor = block_extractor or BlockExtractor()
+        self.file_selector = file_selector or FileSelector()
         self.input_handler = InputHandler()
 
     def validate_files(self, external_file: str) -> bool:
@@ -33,12 +42,11 @@ class UpdateHandler:
         """
         # Check if external file exists
         if not os.path.exists(external_file):
-            logger.error(f"External file not found: {external_file}")
+            logger.error("External file not found: %s", external_file)
             return False
 
         # Get local files
-        general_files, system_files, project_files, language_files = self.file_selector.get_files_by_category()
-        if not any([general_files, system_files, project_files, language_files]):
+        if not any(self.file_selector.get_files_by_category()):
             logger.error("No local files found")
             return False
 
@@ -52,15 +60,19 @@ class UpdateHandler:
             Selected file path or None if no selection made
         """
         # Get files by category
-        general_files, system_files, project_files, language_files = self.file_selector.get_files_by_category()
+        general_files, system_files, project_files, language_files, cline_files = (
+            self.file_selector.get_files_by_category()
+        )
 
         # Display files by category
         self.file_selector.display_files_by_category(
-            general_files, system_files, project_files, language_files
+            general_files, system_files, project_files, language_files, cline_files
         )
 
-        # Get user selection
-        all_files = general_files + system_files + project_files + language_files
+        # Get user selection in display order
+        all_files = (
+            cline_files + general_files + system_files + project_files + language_files
+        )
         if not all_files:
             logger.error("No files found")
             return None
@@ -83,12 +95,17 @@ class UpdateHandler:
         """
         block = self.block_extractor.extract_block(content, block_type, file_path)
         if block is None:
-            logger.error(f"Could not extract block from file: {file_path}")
+            logger.error("Could not extract block from file: %s", file_path)
             return None
         return block
 
     def replace_block(
-        self, content: str, new_block: str, block_type: str, file_path: str
+        self,
+        content: str,
+        new_block: str,
+        block_type: str,
+        file_path: str,
+        index: Optional[BlockIndex] = None,
     ) -> Optional[str]:
         """
         Replace block in content.
@@ -98,14 +115,15 @@ class UpdateHandler:
             new_block: New block content
             block_type: Type of block to replace
             file_path: Path to file being processed
+            index: Prebuilt index of content (built on demand if omitted)
 
         Returns:
             Updated content or None if replacement fails
         """
         updated_content = self.block_extractor.replace_block(
-            content, new_block, block_type, file_path
+            content, new_block, block_type, file_path, index
         )
         if updated_content is None:
-            logger.error(f"Could not replace block in file: {file_path}")
+            logger.error("Could not replace block in file: %s", file_path)
             return None
         return updated_content
@@ -0,0 +1,5 @@
+"""
+Long-running daemon for Cline Tools.
+Keeps the rule catalog and parsed documents warm and serves requests over a
+local socket.
+"""
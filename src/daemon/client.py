@@ -0,0 +1,73 @@
+"""Thin client for the Cline Tools daemon."""
+
+import json
+import os
+import socket
+from typing import Any
+from .protocol import PATH_PARAMS, RpcError, encode_message, make_request
+
+
+class DaemonClient:
+    """Sends JSON-RPC requests to a running daemon over its Unix socket."""
+
+    def __init__(self, socket_path: str, timeout: float = 10.0):
+        """
+        Connect to the daemon.
+
+        Args:
+            socket_path: Path of the daemon's Unix domain socket
+            timeout: Socket timeout in seconds
+
+        Raises:
+            OSError: If the daemon is not reachable
+        """
+        self.connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.connection.settimeout(timeout)
+        self.connection.connect(socket_path)
+        self.reader = self.connection.makefile("rb")
+        self.next_id = 1
+
+    def call(self, method: str, **params: Any) -> Any:
+        """
+        Call a daemon method and wait for its result.
+
+        Path parameters are made absolute against the client's working
+        directory before they are sent.
+
+        Args:
+            method: Method name
+            params: Method parameters
+
+        Returns:
+            Method result
+
+        Raises:
+            RpcError: If the daemon returns an error
+        """
+        for name in PATH_PARAMS:
+            value = params.get(name)
+            if isinstance(value, str):
+                params[name] = os.path.abspath(value)
+            elif isinstance(value, list):
+                params[name] = [
+                    os.path.abspath(item) if isinstance(item, str) else item
+                    for item in value
+                ]
+
+        request_id = self.next_id
+        self.next_id += 1
+        request = make_request(request_id, method, params)
+        self.connection.sendall(encode_message(request))
+        line = self.reader.readline()
+        if not line:
+            raise RpcError(-32000, "Daemon closed the connection")
+
+        response = json.loads(line)
+        if "error" in response:
+            raise RpcError(response["error"]["code"], response["error"]["message"])
+        return response.get("result")
+
+    def close(self) -> None:
+        """Close the connection."""
+        self.reader.close()
+        self.connection.close()
@@ -0,0 +1,93 @@
+"""Newline-delimited JSON-RPC 2.0 framing shared by daemon server and client."""
+
+import json
+from typing import Any, Dict, Optional
+
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+# Parameters holding file paths (a string or a list of strings); they must be
+# absolute because client and daemon run in different working directories
+PATH_PARAMS = ("file", "external_file", "local_file", "local_files")
+
+
+class RpcError(Exception):
+    """Error returned to the client as a JSON-RPC error object."""
+
+    def __init__(self, code: int, message: str):
+        """
+        Initialize RpcError.
+
+        Args:
+            code: JSON-RPC error code
+            message: Human-readable error message
+        """
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+def encode_message(message: Dict[str, Any]) -> bytes:
+    """
+    Serialize a message as one line of JSON.
+
+    Args:
+        message: Message to serialize
+
+    Returns:
+        UTF-8 encoded JSON followed by a newline
+    """
+    return (json.dumps(message, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+def make_request(
+    request_id: int, method: str, params: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Build a request message.
+
+    Args:
+        request_id: Request identifier echoed in the response
+        method: Method name
+        params: Method parameters
+
+    Returns:
+        JSON-RPC request object
+    """
+    return {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params}
+
+
+def make_result(request_id: Optional[Any], result: Any) -> Dict[str, Any]:
+    """
+    Build a success response.
+
+    Args:
+        request_id: Identifier of the request being answered
+        result: Method result
+
+    Returns:
+        JSON-RPC response object
+    """
+    return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+
+def make_error(request_id: Optional[Any], code: int, message: str) -> Dict[str, Any]:
+    """
+    Build an error response.
+
+    Args:
+        request_id: Identifier of the request being answered
+        code: JSON-RPC error code
+        message: Human-readable error message
+
+    Returns:
+        JSON-RPC response object
+    """
+    return {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "error": {"code": code, "message": message},
+    }
@@ -0,0 +1,416 @@
+"""Daemon serving extract, compare, update and render requests over a Unix socket."""
+
+import json
+import os
+import socket
+import socketserver
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from src.utils.logging_config import setup_logger
+from src.core.file_manager import FileManager
+from src.core.block_store import BlockStore
+from src.core.document_cache import (
+    CachedDocument,
+    DocumentCache,
+    get_shared_document_cache,
+)
+from src.core.compare.diff_engine import DiffEngine
+from src.core.rules.catalog import RuleCatalog, get_shared_catalog
+from src.core.update.block_updater import BlockUpdater
+from .protocol import (
+    RpcError,
+    encode_message,
+    make_error,
+    make_result,
+    PARSE_ERROR,
+    INVALID_REQUEST,
+    METHOD_NOT_FOUND,
+    INVALID_PARAMS,
+    INTERNAL_ERROR,
+    PATH_PARAMS,
+)
+
+logger = setup_logger(__name__)
+
+
+class RulesDaemon:
+    """Keeps catalog, parsed documents and diff engine warm between requests."""
+
+    def __init__(
+        self,
+        catalog: Optional[RuleCatalog] = None,
+        document_cache: Optional[DocumentCache] = None,
+        use_history: bool = True,
+    ):
+        """
+        Initialize RulesDaemon.
+
+        Args:
+            catalog: Rule catalog to serve (defaults to the shared one)
+            document_cache: Parsed-document cache (defaults to the shared one)
+            use_history: Whether updates record block versions in the block store
+        """
+        self.catalog = catalog or get_shared_catalog()
+        self.document_cache = document_cache or get_shared_document_cache()
+        self.block_updater = BlockUpdater(
+            block_store=BlockStore() if use_history else None,
+            document_cache=self.document_cache,
+        )
+        self.block_extractor = self.block_updater.block_extractor
+        self.diff_engine = DiffEngine(color=False)
+        self.methods: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+            "ping": self.ping,
+            "catalog": self.list_catalog,
+            "extract": self.extract,
+            "compare": self.compare,
+            "render": self.render,
+            "update": self.update,
+            "stats": self.cache_stats,
+        }
+
+    def get_document(self, file_path: str) -> CachedDocument:
+        """
+        Get a parsed document, re-reading the file only if it changed.
+
+        Args:
+            file_path: Path to the file
+
+        Returns:
+            Parsed document
+
+        Raises:
+            RpcError: If the file cannot be read
+        """
+        if not os.path.exists(file_path):
+            raise RpcError(INVALID_PARAMS, f"Cannot access {file_path}")
+
+        document = self.document_cache.get(file_path)
+        if document is None:
+            raise RpcError(INVALID_PARAMS, f"Cannot read {file_path}")
+        return document
+
+    def _block_type(self, local_file: str) -> str:
+        """
+        Determine the block type of a local rule file.
+
+        Args:
+            local_file: Path to local rule file
+
+        Returns:
+            Block type
+
+        Raises:
+            RpcError: If the block type cannot be determined
+        """
+        block_type = self.block_extractor.determine_block_type(
+            os.path.abspath(local_file)
+        )
+        if not block_type:
+            raise RpcError(
+                INVALID_PARAMS,
+                f"Could not determine block type from path: {local_file}",
+            )
+        return block_type
+
+    def _extract(self, file_path: str, local_file: str) -> Tuple[str, str]:
+        """
+        Extract the block matching a local rule file.
+
+        Args:
+            file_path: File to extract from
+            local_file: Local rule file identifying the block
+
+        Returns:
+            Tuple of (block_content, block_type)
+
+        Raises:
+            RpcError: If the block cannot be found
+        """
+        block_type = self._block_type(local_file)
+        document = self.get_document(file_path)
+        block = self.block_extractor.extract_block(
+            document.content, block_type, local_file, document.index
+        )
+        if block is None:
+            raise RpcError(INVALID_PARAMS, f"Block not found in {file_path}")
+        return block, block_type
+
+    @staticmethod
+    def _check_paths(params: Dict[str, Any]) -> None:
+        """
+        Reject relative path parameters.
+
+        A relative path would be resolved against the daemon's working
+        directory instead of the client's.
+
+        Args:
+            params: Request parameters
+
+        Raises:
+            RpcError: If a path parameter is not an absolute path
+        """
+        for name in PATH_PARAMS:
+            value = params.get(name)
+            paths = value if isinstance(value, list) else [value]
+            for path in paths:
+                if path is not None and (
+                    not isinstance(path, str) or not os.path.isabs(path)
+                ):
+                    raise RpcError(
+                        INVALID_PARAMS, f"{name} must be an absolute path: {path}"
+                    )
+
+    @staticmethod
+    def _param(params: Dict[str, Any], name: str) -> Any:
+        """
+        Get a required parameter.
+
+        Args:
+            params: Request parameters
+            name: Parameter name
+
+        Returns:
+            Parameter value
+
+        Raises:
+            RpcError: If the parameter is missing
+        """
+        if name not in params:
+            raise RpcError(INVALID_PARAMS, f"Missing parameter: {name}")
+        return params[name]
+
+    def ping(self, params: Dict[str, Any]) -> str:
+        """Answer a liveness check."""
+        return "pong"
+
+    def cache_stats(self, params: Dict[str, Any]) -> Dict[str, int]:
+        """
+        Report document cache counters.
+
+        Returns:
+            Dictionary with documents, bytes, hits, misses and evictions
+        """
+        return self.document_cache.get_stats()
+
+    def list_catalog(self, params: Dict[str, Any]) -> Dict[str, List[str]]:
+        """
+        List local rule files by category.
+
+        Returns:
+            Mapping of category to file paths
+        """
+        return {
+            category: self.catalog.get_files(category)
+            for category in self.catalog.categories
+        }
+
+    def extract(self, params: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Extract a block. Params: file, local_file.
+
+        Returns:
+            Dictionary with block_type and block
+        """
+        block, block_type = self._extract(
+            self._param(params, "file"), self._param(params, "local_file")
+        )
+        return {"block_type": block_type, "block": block}
+
+    def compare(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Compare an external block with a local file.
+
+        Params: external_file, local_file.
+
+        Returns:
+            Dictionary with block_type and identical flag
+        """
+        external_file = self._param(params, "external_file")
+        local_file = self._param(params, "local_file")
+        external_block, block_type = self._extract(external_file, local_file)
+        local_block, _ = self._extract(local_file, local_file)
+        return {
+            "block_type": block_type,
+            "identical": external_block.strip() == local_block.strip(),
+        }
+
+    def render(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Render a diff.
+
+        Params: external_file, local_file, view (unified, side-by-side or json).
+
+        Returns:
+            Dictionary with block_type, identical flag and diff
+        """
+        external_file = self._param(params, "external_file")
+        local_file = self._param(params, "local_file")
+        view = params.get("view", "unified")
+        external_block, block_type = self._extract(external_file, local_file)
+        local_block, _ = self._extract(local_file, local_file)
+
+        if view == "json":
+            diff: Any = self.diff_engine.to_dict(
+                external_block, local_block, block_type
+            )
+        elif view == "side-by-side":
+            diff = self.diff_engine.render_side_by_side(
+                external_block, local_block, block_type
+            )
+        elif view == "unified":
+            diff = self.diff_engine.render_unified(
+                external_block, local_block, block_type
+            )
+        else:
+            raise RpcError(INVALID_PARAMS, f"Unknown view: {view}")
+
+        return {
+            "block_type": block_type,
+            "identical": external_block.strip() == local_block.strip(),
+            "diff": diff,
+        }
+
+    def update(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Update an external file with local blocks.
+
+        Params: external_file, local_files.
+
+        Returns:
+            Dictionary with the updated flag
+        """
+        external_file = self._param(params, "external_file")
+        local_files = self._param(params, "local_files")
+        if isinstance(local_files, str):
+            local_files = [local_files]
+
+        local_rules = [
+            (
+                local_file,
+                self._block_type(local_file),
+                self.get_document(local_file).content,
+            )
+            for local_file in local_files
+        ]
+        previous = self.get_document(external_file).content
+
+        # Same path as update-external, including the block store records
+        if not self.block_updater.update_external_with_locals(
+            external_file, local_rules
+        ):
+            raise RpcError(
+                INVALID_PARAMS,
+                f"Could not update {external_file}: no matching blocks or "
+                "write error",
+            )
+        return {"updated": self.get_document(external_file).content != previous}
+
+    def handle(self, message: Any) -> Optional[Dict[str, Any]]:
+        """
+        Dispatch one JSON-RPC request.
+
+        Args:
+            message: Decoded request object
+
+        Returns:
+            Response object, or None for notifications
+        """
+        if not isinstance(message, dict) or "method" not in message:
+            return make_error(None, INVALID_REQUEST, "Invalid request")
+
+        request_id = message.get("id")
+        method = self.methods.get(message["method"])
+        try:
+            if method is None:
+                raise RpcError(
+                    METHOD_NOT_FOUND, f"Unknown method: {message['method']}"
+                )
+            params = message.get("params") or {}
+            if not isinstance(params, dict):
+                raise RpcError(INVALID_PARAMS, "Params must be an object")
+            self._check_paths(params)
+            result = method(params)
+        except RpcError as e:
+            response = make_error(request_id, e.code, e.message)
+        except Exception as e:
+            logger.error(f"Error handling {message['method']}: {e}")
+            response = make_error(request_id, INTERNAL_ERROR, str(e))
+        else:
+            response = make_result(request_id, result)
+
+        return response if "id" in message else None
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Reads newline-delimited requests from one connection."""
+
+    def handle(self) -> None:
+        """Serve requests until the client disconnects."""
+        daemon: RulesDaemon = self.server.rules_daemon
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                message = json.loads(line)
+            except ValueError as e:
+                response = make_error(None, PARSE_ERROR, f"Parse error: {e}")
+            else:
+                if isinstance(message, dict) and message.get("method") == "shutdown":
+                    response = make_result(message.get("id"), True)
+                    self.wfile.write(encode_message(response))
+                    self.wfile.flush()
+                    threading.Thread(target=self.server.shutdown, daemon=True).start()
+                    return
+                response = daemon.handle(message)
+            if response is not None:
+                self.wfile.write(encode_message(response))
+                self.wfile.flush()
+
+
+def serve(
+    socket_path: str, catalog: Optional[RuleCatalog] = None, use_history: bool = True
+) -> bool:
+    """
+    Run the daemon until it receives a shutdown request.
+
+    Args:
+        socket_path: Path of the Unix domain socket to listen on
+        catalog: Rule catalog to serve (defaults to the shared one)
+        use_history: Whether updates record block versions in the block store
+
+    Returns:
+        True after a clean shutdown, False if the server could not start
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        logger.error("Unix domain sockets are not supported on this platform")
+        return False
+
+    if os.path.exists(socket_path):
+        # Remove a stale socket left behind by a previous daemon
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(socket_path)
+            logger.error(f"A daemon is already listening on {socket_path}")
+            return False
+        except OSError:
+            os.unlink(socket_path)
+        finally:
+            probe.close()
+
+    FileManager.ensure_directory(os.path.dirname(os.path.abspath(socket_path)))
+    server = socketserver.ThreadingUnixStreamServer(socket_path, _RequestHandler)
+    server.daemon_threads = True
+    server.rules_daemon = RulesDaemon(catalog, use_history=use_history)
+    # Warm the catalog before the first request arrives
+    server.rules_daemon.list_catalog({})
+    logger.info(f"Daemon listening on {socket_path}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+    logger.info("Daemon stopped")
+    return True
@@ -1,6 +1,6 @@
 import os
 from typing import List, Optional
-from src.utils.logging_config import setup_logger
+from src.utils.logging_config import setup_logger, flush_logging
 
 logger = setup_logger(__name__)
 
@@ -28,6 +28,7 @@ class InputHandler:
         """
         while True:
             try:
+                flush_logging()
                 choice = input(prompt).strip()
                 if allow_empty and not choice:
                     return None
@@ -42,24 +43,26 @@ class InputHandler:
                 print("Please enter a valid number")
 
     @staticmethod
-    def get_diff_tool_choice() -> bool:
+    def get_diff_view_choice() -> str:
         """
-        Get user's choice of diff tool.
+        Get user's choice of diff view.
 
         Returns:
-            True for git diff, False for VS Code diff
+            One of 'unified', 'side-by-side', 'git' or 'vscode'
         """
-        print("\nSelect diff tool:")
-        print("1. git diff (colored inline diff)")
-        print("2. VS Code (side-by-side diff)")
+        choices = {"1": "unified", "2": "side-by-side", "3": "git", "4": "vscode"}
+        print("\nSelect diff view:")
+        print("1. Inline (colored unified diff)")
+        print("2. Side-by-side")
+        print("3. git diff (external)")
+        print("4. VS Code (external side-by-side diff)")
 
         while True:
-            choice = input("Enter choice (1 or 2): ").strip()
-            if choice == "1":
-                return True
-            elif choice == "2":
-                return False
-            print("Please enter 1 or 2")
+            flush_logging()
+            choice = input("Enter choice (1-4): ").strip()
+            if choice in choices:
+                return choices[choice]
+            print("Please enter a number between 1 and 4")
 
     @staticmethod
     def display_files_with_numbers(
@@ -1,12 +1,245 @@
+import atexit
 import logging
 import sys
-from typing import Optional
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, Optional
+
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Attribute marking per-file records that aggregation turns into counts
+TALLY_ATTRIBUTE = "tally"
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Formats each record as one JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Format a record as JSON.
+
+        Args:
+            record: Log record
+
+        Returns:
+            JSON object with time, level, logger and message (plus tally and
+            exception text when present)
+        """
+        # Imported here so text output does not load it
+        import json
+
+        entry = {
+            "time": time.strftime(DATE_FORMAT, time.localtime(record.created)),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        tally = getattr(record, TALLY_ATTRIBUTE, None)
+        if tally:
+            entry[TALLY_ATTRIBUTE] = tally
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry)
+
+
+class TallyFilter(logging.Filter):
+    """Counts per-file INFO records instead of passing them on."""
+
+    def __init__(self, quiet: bool = False):
+        """
+        Initialize TallyFilter.
+
+        Args:
+            quiet: Also drop every other record below WARNING
+        """
+        super().__init__()
+        self.quiet = quiet
+        self.counts: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """
+        Drop and count records marked with a tally.
+
+        Args:
+            record: Log record
+
+        Returns:
+            True if the record should be written
+        """
+        if record.levelno >= logging.WARNING:
+            return True
+        tally = getattr(record, TALLY_ATTRIBUTE, None)
+        if tally is not None and record.levelno == logging.INFO:
+            with self._lock:
+                self.counts[tally] += 1
+            return False
+        return not self.quiet
+
+    def summary(self) -> Optional[str]:
+        """
+        Describe the counted records in one line.
+
+        Returns:
+            Summary such as 'Run summary: updated 4,980, up to date 20' or
+            None if nothing was counted
+        """
+        with self._lock:
+            if not self.counts:
+                return None
+            parts = [f"{name} {count:,}" for name, count in sorted(self.counts.items())]
+        return "Run summary: " + ", ".join(parts)
+
+
+class _LoggingState:
+    """Handlers installed on the root logger by this module."""
+
+    def __init__(self):
+        """Initialize _LoggingState."""
+        self.handler: Optional[logging.Handler] = None
+        self.output_handler: Optional[logging.Handler] = None
+        # QueueListener and its queue while the background writer runs
+        self.listener: Optional[Any] = None
+        self.queue: Optional[Any] = None
+        self.tally_filter: Optional[TallyFilter] = None
+        self.registered = False
+        self.lock = threading.Lock()
+
+
+_state = _LoggingState()
+
+
+def _make_output_handler(json_lines: bool) -> logging.Handler:
+    """
+    Create the handler that writes to stdout.
+
+    Args:
+        json_lines: Whether to emit one JSON object per line
+
+    Returns:
+        Configured stream handler
+    """
+    handler = logging.StreamHandler(sys.stdout)
+    if json_lines:
+        handler.setFormatter(JsonLinesFormatter())
+    else:
+        handler.setFormatter(logging.Formatter(LOG_FORMAT, datefmt=DATE_FORMAT))
+    return handler
+
+
+def _install(handler: logging.Handler) -> None:
+    """
+    Replace the handler of this module on the root logger.
+
+    Args:
+        handler: Handler to install
+    """
+    root = logging.getLogger()
+    if _state.handler is not None:
+        root.removeHandler(_state.handler)
+    root.addHandler(handler)
+    _state.handler = handler
+
+
+def configure_logging(
+    json_lines: bool = False,
+    aggregate: bool = False,
+    quiet: bool = False,
+    background: bool = True,
+) -> None:
+    """
+    Set up process-wide log output.
+
+    Records are handed to a background thread through a queue so writing to
+    the terminal does not slow down the calling thread.
+
+    Args:
+        json_lines: Emit one JSON object per line instead of text
+        aggregate: Count per-file INFO records and log one summary at the end
+        quiet: Only show warnings and errors (plus the summary); implies aggregate
+        background: Write records from a background thread
+    """
+    # Imported here so commands that keep the default setup skip loading them
+    import logging.handlers
+    import queue
+
+    shutdown_logging()
+    with _state.lock:
+        output_handler = _make_output_handler(json_lines)
+        _state.output_handler = output_handler
+
+        if background:
+            _state.queue = queue.Queue()
+            handler: logging.Handler = logging.handlers.QueueHandler(_state.queue)
+            _state.listener = logging.handlers.QueueListener(
+                _state.queue, output_handler
+            )
+            _state.listener.start()
+        else:
+            handler = output_handler
+
+        if aggregate or quiet:
+            _state.tally_filter = TallyFilter(quiet)
+            handler.addFilter(_state.tally_filter)
+
+        _install(handler)
+        if not _state.registered:
+            atexit.register(shutdown_logging)
+            _state.registered = True
+
+
+def flush_logging() -> None:
+    """Wait until the background writer has written every queued record."""
+    if _state.listener is not None and _state.queue is not None:
+        _state.queue.join()
+    sys.stdout.flush()
+
+
+def shutdown_logging() -> None:
+    """Write the run summary, stop the background writer and flush output."""
+    with _state.lock:
+        if _state.listener is not None:
+            _state.listener.stop()
+            _state.listener = None
+            _state.queue = None
+
+        if _state.tally_filter is not None and _state.output_handler is not None:
+            summary = _state.tally_filter.summary()
+            if summary:
+                # Bypasses the logger so the summary survives quiet mode
+                _state.output_handler.handle(
+                    logging.LogRecord(
+                        "summary", logging.INFO, __file__, 0, summary, None, None
+                    )
+                )
+            _state.tally_filter = None
+
+        if _state.output_handler is not None:
+            _state.output_handler.flush()
+            _install(_state.output_handler)
+
+
+def get_tally_counts() -> Dict[str, int]:
+    """
+    Get the records counted so far in aggregate mode.
+
+    Returns:
+        Mapping of tally name to count (empty if aggregation is off)
+    """
+    if _state.tally_filter is None:
+        return {}
+    return dict(_state.tally_filter.counts)
 
 
 def setup_logger(name: str, level: Optional[int] = logging.INFO) -> logging.Logger:
     """
     Set up a logger with consistent formatting and handling.
 
+    Loggers share one handler on the root logger; configure_logging() swaps
+    it for the background writer.
+
     Args:
         name: The name of the logger
         level: The logging level (defaults to INFO)
@@ -17,18 +250,11 @@ def setup_logger(name: str, level: Optional[int] = logging.INFO) -> logging.Logg
     logger = logging.getLogger(name)
     logger.setLevel(level)
 
-    # Create console handler if none exists
-    if not logger.handlers:
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(level)
-
-        # Create formatter
-        formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S",
-        )
-
-        console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
+    # Create the shared console handler on first use
+    if _state.handler is None:
+        with _state.lock:
+            if _state.handler is None:
+                _state.output_handler = _make_output_handler(json_lines=False)
+                _install(_state.output_handler)
 
     return logger
@@ -0,0 +1,246 @@
+"""
+Lightweight stage profiling.
+Spans record wall time, bytes processed and call counts per stage, and the
+nesting of spans is kept as folded stacks for flamegraph tools.
+"""
+
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+
+class StageStats:
+    """Accumulated measurements for one stage."""
+
+    __slots__ = ("calls", "wall_ns", "self_ns", "bytes")
+
+    def __init__(self):
+        """Initialize empty StageStats."""
+        self.calls = 0
+        self.wall_ns = 0
+        self.self_ns = 0
+        self.bytes = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the measurements to a JSON-serializable dictionary.
+
+        Returns:
+            Dictionary with calls, wall_ms, self_ms and bytes
+        """
+        return {
+            "calls": self.calls,
+            "wall_ms": round(self.wall_ns / 1e6, 3),
+            "self_ms": round(self.self_ns / 1e6, 3),
+            "bytes": self.bytes,
+        }
+
+
+class _NullSpan:
+    """Span used while profiling is disabled; does nothing."""
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        return None
+
+    def add_bytes(self, count: int) -> None:
+        """Ignore processed bytes."""
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Span:
+    """One timed execution of a stage."""
+
+    __slots__ = ("profiler", "name", "start_ns", "child_ns", "bytes")
+
+    def __init__(self, profiler: "Profiler", name: str):
+        """
+        Initialize Span.
+
+        Args:
+            profiler: Profiler receiving the measurement
+            name: Stage name
+        """
+        self.profiler = profiler
+        self.name = name
+        self.start_ns = 0
+        self.child_ns = 0
+        self.bytes = 0
+
+    def __enter__(self) -> "Span":
+        self.profiler._stack().append(self)
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        elapsed = time.perf_counter_ns() - self.start_ns
+        stack = self.profiler._stack()
+        path = ";".join(span.name for span in stack)
+        stack.pop()
+        if stack:
+            stack[-1].child_ns += elapsed
+        self.profiler._record(
+            self.name, path, elapsed, elapsed - self.child_ns, self.bytes
+        )
+
+    def add_bytes(self, count: int) -> None:
+        """
+        Add to the number of bytes processed by this span.
+
+        Args:
+            count: Number of bytes
+        """
+        self.bytes += count
+
+
+class Profiler:
+    """Collects span measurements from all threads of the process."""
+
+    def __init__(self):
+        """Initialize a disabled Profiler."""
+        self.enabled = False
+        self.stages: Dict[str, StageStats] = {}
+        self.folded: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _stack(self) -> List[Span]:
+        """
+        Get the open spans of the current thread.
+
+        Returns:
+            List of open spans, innermost last
+        """
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _record(
+        self, name: str, path: str, wall_ns: int, self_ns: int, nbytes: int
+    ) -> None:
+        """
+        Store the measurement of a finished span.
+
+        Args:
+            name: Stage name
+            path: Semicolon-separated names of the enclosing spans
+            wall_ns: Elapsed time including nested spans
+            self_ns: Elapsed time excluding nested spans
+            nbytes: Bytes processed
+        """
+        with self._lock:
+            stats = self.stages.get(name)
+            if stats is None:
+                stats = self.stages[name] = StageStats()
+            stats.calls += 1
+            stats.wall_ns += wall_ns
+            stats.self_ns += self_ns
+            stats.bytes += nbytes
+            self.folded[path] = self.folded.get(path, 0) + self_ns
+
+    def span(self, name: str) -> Any:
+        """
+        Time a stage.
+
+        Use as `with profiler.span("stage") as stage: ...`; call
+        `stage.add_bytes(n)` to record processed bytes.
+
+        Args:
+            name: Stage name
+
+        Returns:
+            Context manager measuring the stage (a no-op while disabled)
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return Span(self, name)
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Build the profiling report.
+
+        Returns:
+            Dictionary with per-stage measurements and folded stacks
+        """
+        with self._lock:
+            stages = sorted(
+                self.stages.items(), key=lambda item: item[1].wall_ns, reverse=True
+            )
+            return {
+                "stages": {name: stats.to_dict() for name, stats in stages},
+                "folded": self.folded_lines(),
+            }
+
+    def folded_lines(self) -> List[str]:
+        """
+        Render the folded stacks in flamegraph.pl / speedscope format.
+
+        Returns:
+            Lines of 'outer;inner microseconds'
+        """
+        return [
+            f"{path} {max(self_ns // 1000, 1)}"
+            for path, self_ns in sorted(self.folded.items())
+        ]
+
+    def write_report(self, report_path: str) -> bool:
+        """
+        Write the report as JSON, or as folded stacks for .folded/.txt paths.
+
+        Args:
+            report_path: Path of the report file
+
+        Returns:
+            True if the report was written, False otherwise
+        """
+        import json
+
+        from src.core.file_manager import FileManager
+
+        if report_path.endswith((".folded", ".txt")):
+            with self._lock:
+                content = "\n".join(self.folded_lines()) + "\n"
+        else:
+            content = json.dumps(self.report(), indent=2)
+        return FileManager.write_file(report_path, content)
+
+
+profiler = Profiler()
+
+
+def span(name: str) -> Any:
+    """
+    Time a stage with the process-wide profiler.
+
+    Args:
+        name: Stage name
+
+    Returns:
+        Context manager measuring the stage (a no-op while profiling is disabled)
+    """
+    return profiler.span(name)
+
+
+def enable_profiling() -> None:
+    """Start recording spans in the process-wide profiler."""
+    profiler.enabled = True
+
+
+def write_profile(report_path: Optional[str]) -> bool:
+    """
+    Write the process-wide profiling report.
+
+    Args:
+        report_path: Path of the report file
+
+    Returns:
+        True if the report was written, False otherwise
+    """
+    if not report_path:
+        return False
+    return profiler.write_report(report_path)